@@ -0,0 +1,42 @@
+import argparse
+import pathlib
+import sys
+
+from benchmarks.suite import BENCHMARKS, REGRESSION_TOLERANCE, compare, load_report, run_benchmarks, save_report
+
+BASELINE = pathlib.Path(__file__).with_name('baseline.json')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Time To-Do App operations on generated workspaces.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000], help='total task counts to generate')
+    parser.add_argument('--lists', type=int, default=100, help='task lists per workspace')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='benchmarks to run')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark, the fastest is kept')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc peak memory run')
+    parser.add_argument('--output', help='write the JSON report to this file')
+    parser.add_argument('--baseline', default=str(BASELINE), help='report to compare against')
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE, help='allowed slowdown before a regression is reported')
+    arguments = parser.parse_args(argv)
+
+    def progress(size, name, result):
+        memory = f'{result["peak_bytes"] / 2 ** 20:10.1f} MiB' if 'peak_bytes' in result else ''
+        print(f'{size:>10} {name:<30} {result["seconds"]:10.4f} s {memory}', file=sys.stderr)
+
+    report = run_benchmarks(arguments.sizes, arguments.only, arguments.lists, arguments.repeat, not arguments.no_memory, arguments.seed, progress)
+    if arguments.output:
+        save_report(report, arguments.output)
+
+    if not pathlib.Path(arguments.baseline).exists():
+        return 0
+
+    regressions = compare(report, load_report(arguments.baseline), arguments.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression["size"]} {regression["benchmark"]} {regression["metric"]} x{regression["ratio"]}', file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import random
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+VERBS = ['Clean', 'Wash', 'Paint', 'Fix', 'Buy', 'Call', 'Write', 'Review', 'Plan', 'Cook', 'Order', 'Sort']
+NOUNS = ['kitchen', 'car', 'report', 'garden', 'invoice', 'roof', 'laptop', 'dinner', 'garage', 'budget']
+
+DEFAULT_STATUS_WEIGHTS = {TaskStatus.TO_BE_DONE: 5, TaskStatus.IN_PROGRESS: 2, TaskStatus.DONE: 3}
+DEFAULT_PRIORITY_WEIGHTS = {TaskPriority.HIGH: 2, TaskPriority.MEDIUM: 5, TaskPriority.LOW: 3}
+
+
+class WorkspaceShape:
+    """Size and value distributions of a generated workspace."""
+
+    def __init__(self, total_tasks: int, task_lists: int = 100, status_weights: dict = None, priority_weights: dict = None, seed: int = 0):
+        if total_tasks < 0 or task_lists < 1:
+            raise ValueError('Shape needs at least one task list and a non-negative task count')
+
+        self.total_tasks = total_tasks
+        self.task_lists = min(task_lists, max(total_tasks, 1))
+        self.status_weights = status_weights or DEFAULT_STATUS_WEIGHTS
+        self.priority_weights = priority_weights or DEFAULT_PRIORITY_WEIGHTS
+        self.seed = seed
+
+    def list_sizes(self) -> list[int]:
+        size, extra = divmod(self.total_tasks, self.task_lists)
+        return [size + (index < extra) for index in range(self.task_lists)]
+
+    def to_dict(self) -> dict:
+        return {
+            "total_tasks": self.total_tasks,
+            "task_lists": self.task_lists,
+            "status_weights": {status.name: weight for status, weight in self.status_weights.items()},
+            "priority_weights": {priority.name: weight for priority, weight in self.priority_weights.items()},
+            "seed": self.seed,
+        }
+
+
+def generate_tasks(shape: WorkspaceShape) -> list[tuple[str, list[Task]]]:
+    rng = random.Random(shape.seed)
+    statuses, status_weights = list(shape.status_weights), list(shape.status_weights.values())
+    priorities, priority_weights = list(shape.priority_weights), list(shape.priority_weights.values())
+
+    task_lists = []
+    for list_index, size in enumerate(shape.list_sizes()):
+        verbs = rng.choices(VERBS, k=size)
+        nouns = rng.choices(NOUNS, k=size)
+        list_statuses = rng.choices(statuses, status_weights, k=size)
+        list_priorities = rng.choices(priorities, priority_weights, k=size)
+        task_lists.append((f'List {list_index}', [
+            Task._trusted(f'{verb} {noun} {list_index}-{index}', priority, status)
+            for index, (verb, noun, priority, status) in enumerate(zip(verbs, nouns, list_priorities, list_statuses))
+        ]))
+
+    return task_lists
+
+
+def generate_workspace(shape: WorkspaceShape, compact: bool = False) -> Workspace:
+    workspace = Workspace('Benchmark')
+    for name, tasks in generate_tasks(shape):
+        task_list = TaskList(name, compact)
+        task_list.add_tasks(tasks)
+        workspace.add_task_list(task_list)
+
+    return workspace
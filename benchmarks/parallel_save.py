@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import pathlib
+import platform
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks.generator import WorkspaceShape, generate_workspace
+from benchmarks.save_format import _fastest
+from benchmarks.suite import save_report
+
+RESULTS = pathlib.Path(__file__).with_name('parallel_save.json')
+EXECUTORS = {'processes': ProcessPoolExecutor, 'threads': ThreadPoolExecutor}
+
+
+def measure_parallel_save(shape: WorkspaceShape, workers: tuple = (1, 2, 4), repeat: int = 3) -> dict:
+    """to_json times of the serial writer and of process and thread pools at each worker count."""
+    workspace = generate_workspace(shape)
+    serial_seconds, expected = _fastest(repeat, workspace.to_json)
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "shape": shape.to_dict(),
+        "serial": {"to_json_seconds": serial_seconds, "bytes": len(expected.encode())},
+    }
+    for kind, executor_class in EXECUTORS.items():
+        results[kind] = {}
+        for count in workers:
+            with executor_class(max_workers=count) as executor:
+                workspace.to_json(executor)
+                seconds, encoded = _fastest(repeat, lambda: workspace.to_json(executor))
+            if encoded != expected:
+                raise AssertionError(f'{kind} with {count} workers changed the output')
+
+            results[kind][str(count)] = {"to_json_seconds": seconds, "speedup": serial_seconds / seconds}
+
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.parallel_save', description='Compare serial and parallel workspace serialization.')
+    parser.add_argument('--tasks', type=int, default=500_000, help='total tasks to generate')
+    parser.add_argument('--lists', type=int, default=50, help='task lists per workspace')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='pool sizes to measure')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, the fastest is kept')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help=f'write the JSON results to this file, e.g. {RESULTS}')
+    arguments = parser.parse_args(argv)
+
+    shape = WorkspaceShape(arguments.tasks, task_lists=arguments.lists, seed=arguments.seed)
+    results = measure_parallel_save(shape, tuple(arguments.workers), arguments.repeat)
+    print(f'serial     to_json {results["serial"]["to_json_seconds"]:8.3f} s', file=sys.stderr)
+    for kind in EXECUTORS:
+        for count, result in results[kind].items():
+            print(f'{kind:<9} {count:>2} to_json {result["to_json_seconds"]:8.3f} s  x{result["speedup"]:.2f}', file=sys.stderr)
+
+    if arguments.output:
+        save_report(results, arguments.output)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+from benchmarks.generator import WorkspaceShape, generate_workspace
+from src.task import Task
+from src.utils.task_status import TaskStatus
+
+
+def measure_read_throughput(shape: WorkspaceShape, readers: int = 4, writers: int = 2, seconds: float = 1.0) -> dict:
+    workspace = generate_workspace(shape)
+    workspace.enable_concurrency()
+    names = list(workspace.task_lists)
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0] * writers
+
+    def read(reader: int):
+        generator = random.Random(shape.seed + reader)
+        while not stop.is_set():
+            snapshot = workspace.snapshot()
+            for _ in snapshot.tasks(generator.choice(names)):
+                pass
+            reads[reader] += 1
+
+    def write(writer: int):
+        generator = random.Random(shape.seed - writer - 1)
+        while not stop.is_set():
+            task_list = workspace.task_lists[generator.choice(names)]
+            task = Task(f'Writer {writer} task {writes[writer]}')
+            task_list.add_task(task)
+            task.status = TaskStatus.DONE
+            writes[writer] += 1
+
+    threads = [threading.Thread(target=read, args=(reader,)) for reader in range(readers)]
+    threads += [threading.Thread(target=write, args=(writer,)) for writer in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "shape": shape.to_dict(),
+        "readers": readers,
+        "writers": writers,
+        "seconds": elapsed,
+        "reads": sum(reads),
+        "writes": sum(writes),
+        "reads_per_second": sum(reads) / elapsed,
+        "writes_per_second": sum(writes) / elapsed,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.read_throughput', description='Measure snapshot reads per second while writer threads edit the workspace.')
+    parser.add_argument('--tasks', type=int, default=100_000, help='total tasks to generate')
+    parser.add_argument('--lists', type=int, default=100, help='task lists per workspace')
+    parser.add_argument('--readers', type=int, default=4, help='reader threads')
+    parser.add_argument('--writers', type=int, nargs='+', default=[0, 2], help='writer thread counts to compare')
+    parser.add_argument('--seconds', type=float, default=2.0, help='measurement time per writer count')
+    parser.add_argument('--seed', type=int, default=0)
+    arguments = parser.parse_args(argv)
+
+    shape = WorkspaceShape(arguments.tasks, task_lists=arguments.lists, seed=arguments.seed)
+    results = [measure_read_throughput(shape, arguments.readers, writers, arguments.seconds) for writers in arguments.writers]
+    for result in results:
+        print(f'{result["writers"]:>3} writers {result["reads_per_second"]:12.1f} reads/s {result["writes_per_second"]:12.1f} writes/s', file=sys.stderr)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import argparse
+import json
+import pathlib
+import platform
+import sys
+import time
+
+from benchmarks.generator import WorkspaceShape, generate_workspace
+from benchmarks.suite import save_report
+from src.workspace import Workspace
+
+RESULTS = pathlib.Path(__file__).with_name('save_format.json')
+
+
+def encode_v1(workspace: Workspace) -> str:
+    return json.dumps({
+        "name": workspace.name,
+        "task_list": [task_list.to_json() for task_list in workspace.task_lists.values()],
+    }, ensure_ascii=False)
+
+
+def encode_v2(workspace: Workspace) -> str:
+    return json.dumps(workspace.to_dict(), ensure_ascii=False)
+
+
+def measure_save_format(shape: WorkspaceShape, repeat: int = 3) -> dict:
+    """Encode and decode times and sizes of the nested v1 and the flat v2 save formats."""
+    workspace = generate_workspace(shape)
+    results = {"python": platform.python_version(), "machine": platform.machine(), "shape": shape.to_dict()}
+    for version, encode in (('v1', encode_v1), ('v2', encode_v2)):
+        encode_seconds, encoded = _fastest(repeat, lambda: encode(workspace))
+        decode_seconds, decoded = _fastest(repeat, lambda: Workspace.from_json(encoded))
+        if decoded.to_dict() != workspace.to_dict():
+            raise AssertionError(f'{version} round trip changed the workspace')
+
+        results[version] = {
+            "to_json_seconds": encode_seconds,
+            "from_json_seconds": decode_seconds,
+            "bytes": len(encoded.encode()),
+        }
+
+    return results
+
+
+def _fastest(repeat: int, run) -> tuple:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, value
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.save_format', description='Compare the nested v1 and flat v2 save formats.')
+    parser.add_argument('--tasks', type=int, default=500_000, help='total tasks to generate')
+    parser.add_argument('--lists', type=int, default=50, help='task lists per workspace')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, the fastest is kept')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help=f'write the JSON results to this file, e.g. {RESULTS}')
+    arguments = parser.parse_args(argv)
+
+    results = measure_save_format(WorkspaceShape(arguments.tasks, task_lists=arguments.lists, seed=arguments.seed), arguments.repeat)
+    for version in ('v1', 'v2'):
+        result = results[version]
+        print(
+            f'{version} to_json {result["to_json_seconds"]:8.3f} s  from_json {result["from_json_seconds"]:8.3f} s  {result["bytes"] / 1e6:8.1f} MB',
+            file=sys.stderr,
+        )
+
+    if arguments.output:
+        save_report(results, arguments.output)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
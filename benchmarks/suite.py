@@ -0,0 +1,220 @@
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generator import WorkspaceShape, generate_tasks, generate_workspace
+from src.task_list import TaskList
+from src.workspace import Workspace
+
+LOOKUPS = 10_000
+REGRESSION_TOLERANCE = 0.25
+
+
+def _sample(workspace: Workspace, seed: int) -> list[tuple[TaskList, str]]:
+    pairs = [(task_list, description) for task_list in workspace.task_lists.values() for description in task_list.tasks]
+    return random.Random(seed).sample(pairs, min(LOOKUPS, len(pairs)))
+
+
+def bench_add_task(shape: WorkspaceShape):
+    task_lists = generate_tasks(shape)
+
+    def run():
+        workspace = Workspace('Benchmark')
+        for name, tasks in task_lists:
+            task_list = TaskList(name)
+            workspace.add_task_list(task_list)
+            for task in tasks:
+                task_list.add_task(task)
+
+    return run
+
+
+def bench_add_tasks(shape: WorkspaceShape):
+    task_lists = generate_tasks(shape)
+
+    def run():
+        workspace = Workspace('Benchmark')
+        for name, tasks in task_lists:
+            task_list = TaskList(name)
+            task_list.add_tasks(tasks)
+            workspace.add_task_list(task_list)
+
+    return run
+
+
+def bench_find_task(shape: WorkspaceShape):
+    sample = _sample(generate_workspace(shape), shape.seed)
+
+    def run():
+        for task_list, description in sample:
+            task_list.find_task_by_description(description)
+
+    return run
+
+
+def bench_remove_task(shape: WorkspaceShape):
+    sample = _sample(generate_workspace(shape), shape.seed)
+
+    def run():
+        for task_list, description in sample:
+            task_list.remove_task(description)
+
+    return run
+
+
+def _bench_sort(method: str):
+    def bench(shape: WorkspaceShape):
+        workspace = generate_workspace(shape)
+
+        def run():
+            getattr(workspace, method)()
+            for task_list in workspace.task_lists.values():
+                for _ in task_list.tasks:
+                    pass
+
+        return run
+
+    return bench
+
+
+def bench_progress(shape: WorkspaceShape):
+    workspace = generate_workspace(shape)
+
+    def run():
+        for _ in range(1000):
+            workspace.progress
+        for task_list in workspace.task_lists.values():
+            task_list.progress
+
+    return run
+
+
+def bench_str(shape: WorkspaceShape):
+    workspace = generate_workspace(shape)
+    return lambda: str(workspace)
+
+
+def bench_to_json(shape: WorkspaceShape):
+    workspace = generate_workspace(shape)
+    return workspace.to_json
+
+
+def bench_from_json(shape: WorkspaceShape):
+    json_str = generate_workspace(shape).to_json()
+    return lambda: Workspace.from_json(json_str)
+
+
+def bench_save_to_file(shape: WorkspaceShape):
+    workspace = generate_workspace(shape)
+    return lambda: workspace.save_to_file('benchmark.json')
+
+
+def bench_load_from_file(shape: WorkspaceShape):
+    generate_workspace(shape).save_to_file('benchmark.json')
+    return lambda: Workspace.load_from_file('benchmark.json')
+
+
+BENCHMARKS = {
+    'add_task': bench_add_task,
+    'add_tasks': bench_add_tasks,
+    'find_task': bench_find_task,
+    'remove_task': bench_remove_task,
+    'sort_by_status': _bench_sort('sort_tasks_by_status'),
+    'sort_by_priority': _bench_sort('sort_tasks_by_priority'),
+    'sort_by_status_then_priority': _bench_sort('sort_tasks_by_status_then_priority'),
+    'progress': bench_progress,
+    'str': bench_str,
+    'to_json': bench_to_json,
+    'from_json': bench_from_json,
+    'save_to_file': bench_save_to_file,
+    'load_from_file': bench_load_from_file,
+}
+
+
+def measure(bench, shape: WorkspaceShape, repeat: int = 3, memory: bool = True) -> dict:
+    timings = []
+    for _ in range(repeat):
+        run = bench(shape)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+        del run
+
+    result = {"seconds": min(timings)}
+    if memory:
+        run = bench(shape)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def run_benchmarks(sizes, names=None, task_lists: int = 100, repeat: int = 3, memory: bool = True, seed: int = 0, progress=None) -> dict:
+    names = list(BENCHMARKS) if names is None else names
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f'Unknown benchmark: {name}')
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {},
+    }
+    original_cwd = os.getcwd()
+    directory = tempfile.mkdtemp()
+    os.chdir(directory)
+    try:
+        for size in sizes:
+            shape = WorkspaceShape(size, task_lists, seed=seed)
+            results = report["results"][str(size)] = {"shape": shape.to_dict()}
+            for name in names:
+                results[name] = measure(BENCHMARKS[name], shape, repeat, memory)
+                if progress is not None:
+                    progress(size, name, results[name])
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(directory)
+
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float = REGRESSION_TOLERANCE) -> list[dict]:
+    regressions = []
+    for size, results in report["results"].items():
+        baseline_results = baseline.get("results", {}).get(size, {})
+        for name, result in results.items():
+            if name == 'shape' or name not in baseline_results:
+                continue
+
+            for metric in ('seconds', 'peak_bytes'):
+                if metric not in result or not baseline_results[name].get(metric):
+                    continue
+
+                ratio = result[metric] / baseline_results[name][metric]
+                if ratio > 1 + tolerance:
+                    regressions.append({"size": size, "benchmark": name, "metric": metric, "ratio": round(ratio, 2)})
+
+    return regressions
+
+
+def load_report(path: str) -> dict:
+    with open(path, 'r') as report_file:
+        return json.load(report_file)
+
+
+def save_report(report: dict, path: str) -> None:
+    with open(path, 'w') as report_file:
+        json.dump(report, report_file, indent=2)
+        report_file.write('\n')
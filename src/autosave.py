@@ -0,0 +1,107 @@
+import asyncio
+
+
+class AutoSaver:
+    """Saves a workspace in the background at most once per interval.
+
+    Mutations only mark the workspace dirty and start a timer, so a burst
+    of changes ends in a single save_to_file_async call. Mutations may come
+    from any thread; the timer is always started on the loop. Saves never
+    overlap, and close() flushes whatever is still unsaved. An error from a
+    background save is raised by the next flush() or close().
+    """
+
+    def __init__(self, workspace, file_name: str, interval: float = 1.0, journaled: bool = False, executor=None):
+        if interval < 0:
+            raise ValueError('Interval cannot be negative')
+
+        self.workspace = workspace
+        self.file_name = file_name
+        self.interval = interval
+        self.journaled = journaled
+        self.executor = executor
+        self.saves = 0
+        self._dirty = False
+        self._loop = None
+        self._timer = None
+        self._pending = False
+        self._closed = False
+        self._error = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def start(self) -> None:
+        if self.workspace._autosaver is not None:
+            raise ValueError('Workspace already has an autosaver')
+
+        self._loop = asyncio.get_running_loop()
+        self._closed = False
+        self.workspace._autosaver = self
+
+    def notify(self) -> None:
+        self._dirty = True
+        if not self._pending:
+            self._pending = True
+            self._loop.call_soon_threadsafe(self._start_timer)
+
+    async def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        error, self._error = self._error, None
+        await self._save()
+        if error is not None:
+            raise error
+
+    async def close(self) -> None:
+        if self.workspace._autosaver is self:
+            self.workspace._autosaver = None
+
+        self._closed = True
+        await self.flush()
+
+    async def __aenter__(self) -> "AutoSaver":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _start_timer(self) -> None:
+        self._pending = False
+        if self._timer is None and not self._closed:
+            self._timer = self._loop.create_task(self._save_later())
+            self._timer.add_done_callback(self._timer_done)
+
+    def _timer_done(self, timer: asyncio.Task) -> None:
+        if self._timer is timer:
+            self._timer = None
+        if timer.cancelled():
+            return
+
+        if timer.exception() is not None:
+            self._error = self._error or timer.exception()
+        elif self._dirty:
+            self._start_timer()
+
+    async def _save_later(self) -> None:
+        await asyncio.sleep(self.interval)
+        await self._save()
+
+    async def _save(self) -> None:
+        async with self._lock:
+            if not self._dirty:
+                return
+
+            self._dirty = False
+            try:
+                await self.workspace.save_to_file_async(self.file_name, self.journaled, self.executor)
+            except BaseException:
+                self._dirty = True
+                raise
+
+            self.saves += 1
@@ -0,0 +1,172 @@
+import mmap
+import struct
+from collections.abc import Sequence
+
+from src.serialization import write_atomically
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+MAGIC = b'TDWS'
+BINARY_FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sHHQIIQQQQ')
+LIST_ENTRY = struct.Struct('<QIIQQ' + 'Q' * len(TaskStatus))
+TASK_RECORD = struct.Struct('<QIBBxx')
+
+PRIORITIES = list(TaskPriority)
+STATUSES = list(TaskStatus)
+
+
+class _StringTable:
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def add(self, text: str) -> tuple[int, int]:
+        encoded = text.encode()
+        offset = self.size
+        self.chunks.append(encoded)
+        self.size += len(encoded)
+        return offset, len(encoded)
+
+
+def write_binary_snapshot(workspace, path) -> None:
+    """Layout: header, list directory, fixed-width task records, string table."""
+    strings = _StringTable()
+    name_offset, name_length = strings.add(workspace.name)
+    directory = []
+    records = bytearray()
+    task_count = 0
+
+    for task_list in workspace.task_lists.values():
+        list_name_offset, list_name_length = strings.add(task_list.name)
+        status_counts = [0] * len(STATUSES)
+        first_task = task_count
+        for task in task_list.tasks.values():
+            description_offset, description_length = strings.add(task.description)
+            records += TASK_RECORD.pack(description_offset, description_length, task.priority.rank, task.status.rank)
+            status_counts[task.status.rank] += 1
+            task_count += 1
+
+        directory.append(LIST_ENTRY.pack(list_name_offset, list_name_length, 0, first_task, task_count - first_task, *status_counts))
+
+    directory_offset = HEADER.size
+    records_offset = directory_offset + LIST_ENTRY.size * len(directory)
+    strings_offset = records_offset + len(records)
+    header = HEADER.pack(
+        MAGIC, BINARY_FORMAT_VERSION, 0, task_count, len(directory), name_length,
+        name_offset, directory_offset, records_offset, strings_offset,
+    )
+
+    def write(output_file):
+        output_file.write(header)
+        output_file.write(b''.join(directory))
+        output_file.write(records)
+        output_file.write(b''.join(strings.chunks))
+
+    write_atomically(path, write, 'wb')
+
+
+class BinaryTaskList(Sequence):
+    """Read-only sequence of tasks of one list, decoded from the snapshot on access."""
+
+    def __init__(self, snapshot: "BinarySnapshot", name: str, first_task: int, task_count: int, status_counts: dict[TaskStatus, int]):
+        self._snapshot = snapshot
+        self.name = name
+        self.status_counts = status_counts
+        self._first_task = first_task
+        self._task_count = task_count
+
+    def __len__(self) -> int:
+        return self._task_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._task_count))]
+
+        if index < 0:
+            index += self._task_count
+
+        if not 0 <= index < self._task_count:
+            raise IndexError('Task index out of range')
+
+        return self._snapshot._task_at(self._first_task + index)
+
+    def __iter__(self):
+        for description, priority, status in self._snapshot._records(self._first_task, self._task_count):
+            yield Task._trusted(description, PRIORITIES[priority], STATUSES[status])
+
+    def to_task_list(self, compact: bool = False) -> TaskList:
+        task_list = TaskList(self.name, compact)
+        task_list._add_tasks(self, bind=False)
+
+        return task_list
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "tasks": [
+                {"description": description, "priority": PRIORITIES[priority].name, "status": STATUSES[status].name}
+                for description, priority, status in self._snapshot._records(self._first_task, self._task_count)
+            ],
+        }
+
+
+class BinarySnapshot:
+    """Memory-mapped view of a binary workspace snapshot.
+
+    Opening reads only the header and the list directory; task records and
+    descriptions are decoded from the mapping when they are accessed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.task_count, list_count, name_length, name_offset, directory_offset, \
+            self._records_offset, self._strings_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError('Not a binary workspace snapshot')
+
+        if version > BINARY_FORMAT_VERSION:
+            raise ValueError(f'Unsupported binary snapshot version: {version}')
+
+        self.name = self._string(name_offset, name_length)
+        self.task_lists = {}
+        for index in range(list_count):
+            name_offset, name_length, _, first_task, task_count, *status_counts = \
+                LIST_ENTRY.unpack_from(self._mmap, directory_offset + index * LIST_ENTRY.size)
+            name = self._string(name_offset, name_length)
+            self.task_lists[name] = BinaryTaskList(self, name, first_task, task_count, dict(zip(STATUSES, status_counts)))
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "BinarySnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._mmap[start:start + length].decode()
+
+    def _task_at(self, index: int) -> Task:
+        description_offset, description_length, priority, status = \
+            TASK_RECORD.unpack_from(self._mmap, self._records_offset + index * TASK_RECORD.size)
+        return Task(self._string(description_offset, description_length), PRIORITIES[priority], STATUSES[status])
+
+    def _records(self, first_task: int, task_count: int):
+        start = self._records_offset + first_task * TASK_RECORD.size
+        records = memoryview(self._mmap)[start:start + task_count * TASK_RECORD.size]
+        strings_offset = self._strings_offset
+        try:
+            for description_offset, description_length, priority, status in TASK_RECORD.iter_unpack(records):
+                start = strings_offset + description_offset
+                yield self._mmap[start:start + description_length].decode(), priority, status
+        finally:
+            records.release()
@@ -0,0 +1,34 @@
+import threading
+
+TASK_LIST_LOCKED = (
+    'add_task', 'add_tasks', '_add_tasks', 'remove_task', 'remove_tasks', 'find_task_by_description',
+    '_sort_tasks', '_reorder', '_rename_task', '_update_task', '_encoded', '_encoded_tasks',
+)
+WORKSPACE_LOCKED = (
+    'add_task_lists', '_remove_task_list', '_rename_task_list', '_add_unloaded_task_list', '_task_list_loaded',
+    '_task_added', '_task_removed', '_tasks_added', '_tasks_removed', '_task_changed', '_task_renamed', '_task_list_sorted',
+)
+
+
+def make_concurrent(owner, names, lock=None) -> None:
+    """Give owner a lock and shadow the named methods with instance attributes that hold it.
+
+    Objects outside concurrent mode keep calling the plain class methods, so
+    locking costs nothing until a workspace enables it. The class attribute
+    is looked up on every call, so instrumentation wrappers still apply.
+    Pass lock to share an existing lock instead of creating one.
+    """
+    lock = owner._lock = lock or threading.RLock()
+    for name in names:
+        owner.__dict__[name] = _locked_method(owner, name, lock)
+
+
+def _locked_method(owner, name: str, lock):
+    cls = type(owner)
+
+    def method(*args, **kwargs):
+        with lock:
+            return getattr(cls, name)(owner, *args, **kwargs)
+
+    method.__name__ = name
+    return method
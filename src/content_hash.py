@@ -0,0 +1,22 @@
+from hashlib import blake2b
+
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+HASH_MASK = (1 << 64) - 1
+
+
+def task_digest(description: str, priority: TaskPriority, status: TaskStatus) -> int:
+    """Stable 64-bit digest of one task, the same in every process."""
+    data = f'{priority.name}\0{status.name}\0{description}'.encode()
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), 'little')
+
+
+def tasks_digest(tasks) -> int:
+    """Order-independent digest of a task collection, updated by adding or subtracting task digests."""
+    return sum(task_digest(task.description, task.priority, task.status) for task in tasks) & HASH_MASK
+
+
+def task_list_digest(name: str, content_hash: int) -> int:
+    data = content_hash.to_bytes(8, 'little') + name.encode()
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), 'little')
@@ -0,0 +1,140 @@
+import json
+import sys
+import threading
+from collections import OrderedDict
+from itertools import count
+
+ENCODING_CACHE_MAX_BYTES = 0
+ENTRY_BYTES = 112
+
+encode = json.JSONEncoder(ensure_ascii=False).encode
+
+_keys = count()
+
+
+def next_key() -> int:
+    return next(_keys)
+
+
+def encode_task(description: str, priority, status) -> str:
+    return f'{{"description": {encode(description)}, "priority": "{priority.name}", "status": "{status.name}"}}'
+
+
+class EncodingCache:
+    """Least recently used cache of JSON encodings of task lists and tasks.
+
+    Task lists are keyed by an integer taken from next_key and their tasks
+    by (that key, description), so the cache never keeps a list alive.
+    Owners discard their entries when they change. Each entry is charged
+    for its text, its key and ENTRY_BYTES of OrderedDict bookkeeping; the
+    least recently used entries are dropped once the total exceeds
+    max_bytes. Caching is off until max_bytes is raised above its
+    default of 0; while it is off, encoding and saving stream as before.
+    """
+
+    def __init__(self, max_bytes: int = ENCODING_CACHE_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError('Cache size cannot be negative')
+
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError('Cache size cannot be negative')
+
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def get(self, key) -> str | None:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+
+            return text
+
+    def get_many(self, keys) -> list:
+        entries = self._entries
+        with self._lock:
+            texts = [entries.get(key) for key in keys]
+            for key, text in zip(keys, texts):
+                if text is not None:
+                    entries.move_to_end(key)
+
+        return texts
+
+    def put(self, key, text: str) -> None:
+        self.put_many([(key, text)])
+
+    def put_many(self, items) -> None:
+        if self._max_bytes == 0:
+            return
+
+        entries = self._entries
+        with self._lock:
+            for key, text in items:
+                previous = entries.pop(key, None)
+                if previous is not None:
+                    self._nbytes -= _entry_bytes(key, previous)
+
+                size = _entry_bytes(key, text)
+                if size > self._max_bytes:
+                    continue
+
+                entries[key] = text
+                self._nbytes += size
+
+            self._evict()
+
+    def discard(self, key) -> None:
+        with self._lock:
+            text = self._entries.pop(key, None)
+            if text is not None:
+                self._nbytes -= _entry_bytes(key, text)
+
+    def discard_many(self, keys) -> None:
+        entries = self._entries
+        with self._lock:
+            for key in keys:
+                text = entries.pop(key, None)
+                if text is not None:
+                    self._nbytes -= _entry_bytes(key, text)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes:
+            self._nbytes -= _entry_bytes(*self._entries.popitem(last=False))
+
+
+def _entry_bytes(key, text: str) -> int:
+    size = ENTRY_BYTES + sys.getsizeof(key) + sys.getsizeof(text)
+    if isinstance(key, tuple):
+        size += sys.getsizeof(key[1])
+
+    return size
+
+
+ENCODING_CACHE = EncodingCache()
@@ -0,0 +1,63 @@
+import os
+import pathlib
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class SaveConflictError(ValueError):
+    def __init__(self, path: pathlib.Path, expected: int, found: int):
+        super().__init__(f'{path} is at generation {found}, expected {expected}')
+        self.path = path
+        self.expected = expected
+        self.found = found
+
+
+class FileLock:
+    """Advisory fcntl lock on a save file, shared for readers and exclusive for writers.
+
+    The save file itself is locked, so no lock files are left next to it.
+    Writers replace the file while holding the lock on the old one, so the
+    lock is taken again until it is held on the file currently at path.
+    While the file does not exist its directory is locked instead. Where
+    fcntl is unavailable the lock does nothing.
+    """
+
+    def __init__(self, path: pathlib.Path, shared: bool = False):
+        self.path = path
+        self.shared = shared
+        self._descriptor = None
+
+    def __enter__(self) -> "FileLock":
+        if fcntl is None:  # pragma: no cover
+            return self
+
+        while True:
+            try:
+                descriptor = os.open(self.path, os.O_RDONLY)
+            except FileNotFoundError:
+                descriptor = os.open(self.path.parent, os.O_RDONLY)
+
+            fcntl.flock(descriptor, fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+            if self._holds(descriptor):
+                self._descriptor = descriptor
+                return self
+
+            os.close(descriptor)
+
+    def __exit__(self, *exc_info) -> None:
+        if self._descriptor is not None:
+            fcntl.flock(self._descriptor, fcntl.LOCK_UN)
+            os.close(self._descriptor)
+            self._descriptor = None
+
+    def _holds(self, descriptor: int) -> bool:
+        locked = os.fstat(descriptor)
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return locked.st_ino == os.stat(self.path.parent).st_ino
+
+        return (locked.st_dev, locked.st_ino) == (current.st_dev, current.st_ino)
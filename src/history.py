@@ -0,0 +1,373 @@
+from collections import deque
+
+from src.persistent_map import MISSING, WIDTH, PersistentMap
+from src.serialization import FORMAT_VERSION
+from src.task import Task
+from src.task_list import TaskList
+from src.task_list_index import UnloadedTaskList
+
+HISTORY_MAX_BYTES = 64 * 2 ** 20
+
+
+class WorkspaceSnapshot:
+    """Read-only workspace contents at one point in its history.
+
+    Holds a persistent map of list name to (sequence, tasks, compact), where
+    tasks maps description to (sequence, priority, status). Taking one costs O(1) since
+    the maps are shared with the live history until the next edit.
+    """
+
+    def __init__(self, name: str, lists: PersistentMap):
+        self.name = name
+        self._lists = lists
+
+    def __len__(self) -> int:
+        return len(self._lists)
+
+    def __contains__(self, task_list_name) -> bool:
+        return task_list_name in self._lists
+
+    @property
+    def task_list_names(self) -> list[str]:
+        return [name for name, _ in sorted(self._lists.items(), key=_sequence_of)]
+
+    def tasks(self, task_list_name: str) -> list[Task]:
+        return [
+            Task._trusted(description, priority, status)
+            for description, (_, priority, status) in sorted(self._lists[task_list_name][1].items(), key=_sequence_of)
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "version": FORMAT_VERSION,
+            "name": self.name,
+            "task_list": [
+                {"name": name, "tasks": [task.to_dict() for task in self.tasks(name)]} for name in self.task_list_names
+            ],
+        }
+
+    def to_workspace(self, compact: bool = False):
+        from src.workspace import Workspace
+
+        workspace = Workspace(self.name)
+        task_lists = []
+        for name in self.task_list_names:
+            task_list = TaskList(name, compact)
+            task_list._add_tasks(self.tasks(name), bind=False)
+            task_lists.append(task_list)
+
+        workspace.add_task_lists(task_lists)
+        return workspace
+
+
+class WorkspaceMirror:
+    """Persistent-map copy of a workspace, updated from its change hooks.
+
+    Each edit copies only the trie path it touches and publishes the new
+    maps, so snapshot() is O(1) and readers never need a lock.
+    """
+
+    def __init__(self, workspace, mirror: "WorkspaceMirror" = None):
+        self._workspace = workspace
+        if mirror is not None:
+            self._next_sequence = mirror._next_sequence
+            self._lists = mirror._lists
+            return
+
+        self._next_sequence = 0
+        self._lists = PersistentMap(
+            (entry.name, self._state(entry)) for entry in workspace.task_lists.entries()
+        )
+
+    def snapshot(self) -> WorkspaceSnapshot:
+        return WorkspaceSnapshot(self._workspace.name, self._lists)
+
+    def add_task_list(self, entry) -> None:
+        self._commit(self._lists.set(entry.name, self._state(entry)), [entry.name])
+
+    def remove_task_list(self, task_list_name: str) -> None:
+        self._commit(self._lists.delete(task_list_name), [task_list_name])
+
+    def rename_task_list(self, old_name: str, name: str) -> None:
+        self._commit(self._lists.delete(old_name).set(name, self._lists[old_name]), [old_name, name])
+
+    def add(self, task_list_name: str, tasks) -> None:
+        sequence, rows, compact = self._lists[task_list_name]
+        added = self._rows(tasks)
+        rows = rows.update(added)
+        self._commit(self._lists.set(task_list_name, (sequence, rows, compact)), [task_list_name], [description for description, _ in added])
+
+    def remove(self, task_list_name: str, descriptions) -> None:
+        sequence, rows, compact = self._lists[task_list_name]
+        descriptions = list(descriptions)
+        self._commit(self._lists.set(task_list_name, (sequence, rows.discard(descriptions), compact)), [task_list_name], descriptions)
+
+    def update(self, task_list_name: str, task: Task) -> None:
+        sequence, rows, compact = self._lists[task_list_name]
+        rows = rows.set(task.description, (rows[task.description][0], task.priority, task.status))
+        self._commit(self._lists.set(task_list_name, (sequence, rows, compact)), [task_list_name], [task.description])
+
+    def rename(self, task_list_name: str, old_description: str, description: str, to_end: bool = False) -> None:
+        sequence, rows, compact = self._lists[task_list_name]
+        row = rows[old_description]
+        if to_end:
+            row = (self._next_sequence, *row[1:])
+            self._next_sequence += 1
+        rows = rows.delete(old_description).set(description, row)
+        self._commit(self._lists.set(task_list_name, (sequence, rows, compact)), [task_list_name], [old_description, description])
+
+    def reorder(self, entry) -> None:
+        sequence, _, compact = self._lists[entry.name]
+        rows = self._rows(_tasks_of(entry))
+        self._commit(self._lists.set(entry.name, (sequence, PersistentMap(rows), compact)), [entry.name], [description for description, _ in rows])
+
+    def _state(self, entry) -> tuple:
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        return sequence, PersistentMap(self._rows(_tasks_of(entry))), entry.compact
+
+    def _rows(self, tasks) -> list:
+        rows = [
+            (task.description, (sequence, task.priority, task.status))
+            for sequence, task in enumerate(tasks, self._next_sequence)
+        ]
+        self._next_sequence += len(rows)
+        return rows
+
+    def _commit(self, lists: PersistentMap, task_list_names: list, descriptions: list = ()) -> None:
+        self._lists = lists
+
+
+class WorkspaceHistory(WorkspaceMirror):
+    """Undo and redo over the edits of a workspace.
+
+    Every edit to the mirrored maps is one undo step that keeps only the
+    trie nodes it replaced. Undo and redo diff the current maps against the
+    target ones, skipping shared subtrees, and replay the difference through
+    the normal TaskList and Workspace methods. The oldest steps are dropped
+    once the bytes held only by history exceed max_bytes.
+    """
+
+    def __init__(self, workspace, max_bytes: int = HISTORY_MAX_BYTES, mirror: WorkspaceMirror = None):
+        if max_bytes < 0:
+            raise ValueError('History size cannot be negative')
+
+        super().__init__(workspace, mirror)
+        self._max_bytes = max_bytes
+        self._undo = deque()
+        self._redo = []
+        self._nbytes = 0
+        self._replaying = False
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError('History size cannot be negative')
+
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo(self) -> None:
+        if not self._undo:
+            raise ValueError('Nothing to undo')
+
+        lists, nbytes = self._undo.pop()
+        self._nbytes -= nbytes
+        self._redo.append(self._move_to(lists))
+        self._evict()
+
+    def redo(self) -> None:
+        if not self._redo:
+            raise ValueError('Nothing to redo')
+
+        lists, nbytes = self._redo.pop()
+        self._nbytes -= nbytes
+        self._undo.append(self._move_to(lists))
+        self._evict()
+
+    def restore(self, snapshot: WorkspaceSnapshot) -> None:
+        if snapshot._lists is self._lists:
+            return
+
+        self._drop_redo()
+        self._undo.append(self._move_to(snapshot._lists))
+        self._evict()
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._nbytes = 0
+
+    def _commit(self, lists: PersistentMap, task_list_names: list, descriptions: list = ()) -> None:
+        previous = self._lists
+        self._lists = lists
+        if self._replaying or self._max_bytes == 0:
+            return
+
+        self._drop_redo()
+        nbytes = _edit_bytes(previous, lists, task_list_names, descriptions)
+        self._undo.append((previous, nbytes))
+        self._nbytes += nbytes
+        self._evict()
+
+    def _drop_redo(self) -> None:
+        self._nbytes -= sum(nbytes for _, nbytes in self._redo)
+        self._redo.clear()
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes and self._undo:
+            self._nbytes -= self._undo.popleft()[1]
+
+        while self._nbytes > self._max_bytes and self._redo:
+            self._nbytes -= self._redo.pop(0)[1]
+
+    def _move_to(self, lists: PersistentMap) -> tuple:
+        previous = self._lists
+        self._replaying = True
+        try:
+            self._replay(previous, lists)
+        finally:
+            self._replaying = False
+
+        self._lists = lists
+        nbytes = _retained_bytes(previous, lists)
+        self._nbytes += nbytes
+        return previous, nbytes
+
+    def _replay(self, current: PersistentMap, target: PersistentMap) -> None:
+        workspace = self._workspace
+        removed = {}
+        added = {}
+        for name, state, target_state in current.diff(target):
+            if target_state is MISSING:
+                removed[name] = state
+            elif state is MISSING:
+                added[name] = target_state
+            elif state[1] is not target_state[1]:
+                _replay_tasks(workspace.task_lists[name], state[1], target_state[1])
+
+        renamed = {state[1]: name for name, state in removed.items()}
+        for name, state in list(added.items()):
+            old_name = renamed.get(state[1])
+            if old_name is not None and old_name in removed:
+                del removed[old_name]
+                del added[name]
+                workspace.task_lists[old_name].name = name
+
+        for name in removed:
+            workspace.remove_task_list(name)
+
+        task_lists = []
+        for name, (_, rows, compact) in added.items():
+            task_list = TaskList(name, compact)
+            task_list._add_tasks(_tasks_in_order(rows), bind=False)
+            task_lists.append(task_list)
+
+        workspace.add_task_lists(task_lists)
+        if added:
+            order = [name for name, _ in sorted(target.items(), key=_sequence_of)]
+            if list(workspace.task_lists) != order:
+                workspace.task_lists.reorder(order)
+
+
+def _replay_tasks(task_list: TaskList, rows: PersistentMap, target: PersistentMap) -> None:
+    removed = {}
+    added = {}
+    moved = False
+    for description, row, target_row in rows.diff(target):
+        if target_row is MISSING:
+            removed[description] = row
+        elif row is MISSING:
+            added[description] = target_row
+        else:
+            moved = moved or row[0] != target_row[0]
+            _replay_task(task_list.tasks[description], target_row)
+
+    renamed = {row[0]: description for description, row in removed.items()}
+    for description, target_row in list(added.items()):
+        old_description = renamed.get(target_row[0])
+        if old_description is not None and old_description in removed:
+            del removed[old_description]
+            del added[description]
+            task = task_list.tasks[old_description]
+            task.description = description
+            _replay_task(task, target_row)
+
+    if removed:
+        task_list.remove_tasks(removed)
+
+    if added:
+        task_list._add_tasks(_tasks_in_order(PersistentMap(added.items())), bind=False)
+    if added or moved:
+        order = [description for description, _ in sorted(target.items(), key=_sequence_of)]
+        if list(task_list._tasks) != order:
+            task_list._reorder(order)
+
+
+def _replay_task(task: Task, row: tuple) -> None:
+    if task.priority is not row[1]:
+        task.priority = row[1]
+    if task.status is not row[2]:
+        task.status = row[2]
+
+
+def _tasks_in_order(rows: PersistentMap) -> list[Task]:
+    return [
+        Task._trusted(description, priority, status)
+        for description, (_, priority, status) in sorted(rows.items(), key=_sequence_of)
+    ]
+
+
+def _tasks_of(entry):
+    if isinstance(entry, UnloadedTaskList):
+        return Task.from_dicts(entry.to_dict()["tasks"])
+
+    return entry._tasks.values()
+
+
+def _sequence_of(item) -> int:
+    return item[1][0]
+
+
+def _edit_bytes(lists: PersistentMap, other: PersistentMap, names: list, descriptions: list) -> int:
+    """Bytes of lists that other, one edit of the named lists and descriptions later, no longer shares."""
+    nbytes = lists.replaced_bytes(names)
+    kept = {id(state[1]) for state in map(other.get, names) if state is not None}
+    for name in names:
+        state = lists.get(name)
+        if state is None or id(state[1]) in kept:
+            continue
+
+        other_state = other.get(name)
+        if other_state is None or len(descriptions) > WIDTH:
+            nbytes += state[1].unshared_bytes(None if other_state is None else other_state[1])
+        else:
+            nbytes += state[1].replaced_bytes(descriptions)
+
+    return nbytes
+
+
+def _retained_bytes(lists: PersistentMap, other: PersistentMap) -> int:
+    kept = {id(state[1]) for _, _, state in lists.diff(other) if state is not MISSING}
+    nbytes = lists.unshared_bytes(other)
+    for _, state, other_state in lists.diff(other):
+        if state is not MISSING and id(state[1]) not in kept:
+            nbytes += state[1].unshared_bytes(None if other_state is MISSING else other_state[1])
+
+    return nbytes
@@ -0,0 +1,221 @@
+import cProfile
+import functools
+import pstats
+import threading
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+
+SAMPLE_SIZE = 1024
+
+TASK_LIST_OPERATIONS = (
+    'add_task', 'add_tasks', 'remove_task', 'remove_tasks', 'find_task_by_description', 'query',
+    'sort_tasks_by_status', 'sort_tasks_by_priority', 'sort_tasks_by_status_then_priority', 'to_json',
+)
+WORKSPACE_OPERATIONS = (
+    'add_task_list', 'add_task_lists', 'remove_task_list', 'find_task_list_by_name', 'search', 'query',
+    'sort_tasks_by_status', 'sort_tasks_by_priority', 'sort_tasks_by_status_then_priority',
+    'to_json', 'save_to_file', 'save_to_directory', 'save_to_binary', 'save_to_sqlite',
+)
+WORKSPACE_LOADERS = ('from_json', 'load_from_file', 'load_from_directory', 'load_from_binary', 'load_from_sqlite')
+
+_originals = {}
+_users = 0
+_users_lock = threading.Lock()
+_active = []
+_calls = threading.local()
+
+
+class OperationStats:
+    def __init__(self, sample_size: int = SAMPLE_SIZE):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+        self._samples = deque(maxlen=sample_size)
+
+    def add(self, seconds: float, nbytes: int = None) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self._samples.append(seconds)
+        if nbytes is not None:
+            self.bytes += nbytes
+
+    def percentile(self, percent: float) -> float:
+        if not self._samples:
+            return 0.0
+
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "p50_seconds": self.percentile(50),
+            "p90_seconds": self.percentile(90),
+            "p99_seconds": self.percentile(99),
+            "max_seconds": self.max_seconds,
+            "bytes": self.bytes,
+        }
+
+
+class Instrumentation:
+    """Call counts, latencies and bytes per TaskList/Workspace operation.
+
+    Operations are timed by wrappers installed on the classes only while
+    some instrumentation is attached to a workspace or active as a context
+    manager, so the methods run unwrapped the rest of the time. Calls made
+    inside another measured operation are counted only as part of it.
+    Latency percentiles are taken over the most recent sample_size calls.
+    """
+
+    def __init__(self, sample_size: int = SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self.operations = {}
+        self._hooks = []
+
+    def add_hook(self, hook) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook) -> None:
+        self._hooks.remove(hook)
+
+    def record(self, operation: str, seconds: float, nbytes: int = None) -> None:
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = OperationStats(self.sample_size)
+
+        stats.add(seconds, nbytes)
+        for hook in self._hooks:
+            hook(operation, seconds, nbytes)
+
+    def snapshot(self) -> dict:
+        return {operation: stats.to_dict() for operation, stats in self.operations.items()}
+
+    def reset(self) -> None:
+        self.operations.clear()
+
+    def __enter__(self) -> "Instrumentation":
+        acquire_wrappers()
+        _active.append(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active.remove(self)
+        release_wrappers()
+
+
+class ProfileReport:
+    def __init__(self):
+        self.stats = None
+        self.peak_bytes = None
+        self.snapshot = None
+
+
+@contextmanager
+def profile(cpu: bool = True, memory: bool = False):
+    report = ProfileReport()
+    profiler = cProfile.Profile() if cpu else None
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+    if profiler is not None:
+        profiler.enable()
+
+    try:
+        yield report
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            report.stats = pstats.Stats(profiler)
+        if memory:
+            report.peak_bytes = tracemalloc.get_traced_memory()[1]
+            report.snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def acquire_wrappers() -> None:
+    global _users
+    with _users_lock:
+        if _users == 0:
+            _install()
+        _users += 1
+
+
+def release_wrappers() -> None:
+    global _users
+    with _users_lock:
+        _users -= 1
+        if _users == 0:
+            _uninstall()
+
+
+def _install() -> None:
+    from src.task_list import TaskList
+    from src.workspace import Workspace, _save_path
+
+    def file_size(arguments, keywords, result):
+        path = _save_path(arguments[0] if arguments else keywords['file_name'])
+        return path.stat().st_size if path.is_file() else None
+
+    def text_size(arguments, keywords, result):
+        text = result if isinstance(result, str) else (arguments[0] if arguments else keywords['json_str'])
+        return len(text) if isinstance(text, bytes) else len(text.encode())
+
+    measures = {
+        'to_json': text_size,
+        'from_json': text_size,
+        'save_to_file': file_size,
+        'load_from_file': file_size,
+    }
+    targets = [
+        (TaskList, TASK_LIST_OPERATIONS, lambda task_list: task_list._workspace),
+        (Workspace, WORKSPACE_OPERATIONS, lambda workspace: workspace),
+        (Workspace, WORKSPACE_LOADERS, lambda cls: None),
+    ]
+    for cls, names, owner in targets:
+        for name in names:
+            original = cls.__dict__[name]
+            _originals[cls, name] = original
+            measure = measures.get(name) if cls is Workspace else None
+            if isinstance(original, classmethod):
+                setattr(cls, name, classmethod(_wrap(original.__func__, f'{cls.__name__}.{name}', owner, measure)))
+            else:
+                setattr(cls, name, _wrap(original, f'{cls.__name__}.{name}', owner, measure))
+
+
+def _uninstall() -> None:
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+
+    _originals.clear()
+
+
+def _wrap(function, operation: str, owner, measure):
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if getattr(_calls, 'measuring', False):
+            return function(self, *args, **kwargs)
+
+        active = _active[-1:]
+        instrumentation = active[0] if active else getattr(owner(self), '_instrumentation', None)
+        if instrumentation is None:
+            return function(self, *args, **kwargs)
+
+        _calls.measuring = True
+        try:
+            start = perf_counter()
+            result = function(self, *args, **kwargs)
+            seconds = perf_counter() - start
+        finally:
+            _calls.measuring = False
+        instrumentation.record(operation, seconds, None if measure is None else measure(args, kwargs, result))
+        return result
+
+    return wrapper
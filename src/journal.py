@@ -0,0 +1,171 @@
+import json
+import pathlib
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+COMPACTION_THRESHOLD = 1 << 20
+
+
+class WorkspaceJournal:
+    """Append-only log of workspace mutations kept next to a snapshot.
+
+    Entries set state rather than describe deltas, so replaying a log on a
+    snapshot that already contains some of its entries (a compaction
+    interrupted before the log was removed) converges to the same state.
+    """
+
+    def __init__(self, path: pathlib.Path, compaction_threshold: int = COMPACTION_THRESHOLD):
+        self.path = path
+        self.compaction_threshold = compaction_threshold
+        self._pending = []
+
+    @classmethod
+    def for_snapshot(cls, snapshot_path: pathlib.Path, compaction_threshold: int = COMPACTION_THRESHOLD) -> "WorkspaceJournal":
+        return cls(snapshot_path.with_name(snapshot_path.name + '.journal'), compaction_threshold)
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    @property
+    def pending_entries(self) -> int:
+        return len(self._pending)
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.size >= self.compaction_threshold
+
+    def record(self, *entry) -> None:
+        self._pending.append(entry)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        with open(self.path, 'a', encoding='utf-8') as journal_file:
+            journal_file.write(''.join([encode(entry) + '\n' for entry in self._pending]))
+
+        self._pending.clear()
+
+    def reset(self, entries: int = None) -> None:
+        del self._pending[:entries]
+        self.path.unlink(missing_ok=True)
+
+    def replay(self, workspace, compact: bool = False) -> None:
+        if not self.path.exists():
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as journal_file:
+            for line in journal_file:
+                if not line.endswith('\n'):
+                    break
+
+                self.apply(workspace, json.loads(line), compact)
+
+    @classmethod
+    def apply(cls, workspace, entry, compact: bool = False) -> None:
+        operation, *arguments = entry
+        if operation == 'add_list':
+            cls._replay_add_list(workspace, *arguments, compact)
+        else:
+            getattr(cls, f'_replay_{operation}')(workspace, *arguments)
+
+    @staticmethod
+    def _replay_add_list(workspace, data: dict, compact: bool):
+        if data["name"] in workspace.task_lists:
+            workspace.remove_task_list(data["name"])
+
+        workspace.add_task_list(TaskList.from_dict(data, compact))
+
+    @staticmethod
+    def _replay_remove_list(workspace, name: str):
+        if name in workspace.task_lists:
+            workspace.remove_task_list(name)
+
+    @staticmethod
+    def _replay_rename_list(workspace, old_name: str, new_name: str):
+        if old_name not in workspace.task_lists:
+            return
+
+        if new_name in workspace.task_lists:
+            workspace.remove_task_list(old_name)
+        else:
+            workspace.task_lists[old_name].name = new_name
+
+    @staticmethod
+    def _replay_add_task(workspace, list_name: str, data: dict):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is None:
+            return
+
+        if data["description"] in task_list.tasks:
+            task = task_list.tasks[data["description"]]
+            task.priority = TaskPriority[data["priority"]]
+            task.status = TaskStatus[data["status"]]
+        else:
+            task_list.add_task(Task.from_dict(data))
+
+    @classmethod
+    def _replay_add_tasks(cls, workspace, list_name: str, items: list[dict]):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is None:
+            return
+
+        added = {}
+        for data in items:
+            if data["description"] in task_list.tasks:
+                cls._replay_add_task(workspace, list_name, data)
+            else:
+                added[data["description"]] = data
+
+        if added:
+            task_list._add_tasks(Task.from_dicts(list(added.values())), bind=False)
+
+    @staticmethod
+    def _replay_remove_task(workspace, list_name: str, description: str):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is not None and description in task_list.tasks:
+            task_list.remove_task(description)
+
+    @classmethod
+    def _replay_remove_tasks(cls, workspace, list_name: str, descriptions: list[str]):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is None:
+            return
+
+        present = [description for description in descriptions if description in task_list.tasks]
+        if present:
+            task_list.remove_tasks(present)
+
+    @staticmethod
+    def _replay_sort(workspace, list_name: str, order: str):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is not None:
+            task_list._sort_tasks(order)
+
+    @staticmethod
+    def _replay_rename_task(workspace, list_name: str, old_description: str, new_description: str):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is None or old_description not in task_list.tasks:
+            return
+
+        if new_description in task_list.tasks:
+            task_list.remove_task(old_description)
+        else:
+            task_list.tasks[old_description].description = new_description
+
+    @staticmethod
+    def _replay_status(workspace, list_name: str, description: str, status: str):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is not None and description in task_list.tasks:
+            task_list.tasks[description].status = TaskStatus[status]
+
+    @staticmethod
+    def _replay_priority(workspace, list_name: str, description: str, priority: str):
+        task_list = workspace.task_lists.get(list_name)
+        if task_list is not None and description in task_list.tasks:
+            task_list.tasks[description].priority = TaskPriority[priority]
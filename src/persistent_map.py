@@ -0,0 +1,284 @@
+import sys
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+MISSING = object()
+
+_EMPTY_CHILDREN = (None,) * WIDTH
+
+
+class _Branch:
+    __slots__ = ('children',)
+
+    def __init__(self, children: tuple):
+        self.children = children
+
+
+class _Collision:
+    __slots__ = ('hash', 'leaves')
+
+    def __init__(self, key_hash: int, leaves: tuple):
+        self.hash = key_hash
+        self.leaves = leaves
+
+
+class PersistentMap:
+    """Immutable hash trie map; set and delete return a new map sharing every untouched node.
+
+    Leaves are (hash, key, value) tuples, branches hold 32 children indexed by
+    five hash bits per level, so an update copies only the branches on the path
+    to its key and two maps can be diffed by skipping the subtrees they share.
+    """
+
+    __slots__ = ('_root', '_size')
+
+    def __init__(self, items=()):
+        leaves = {}
+        for key, value in items:
+            leaves[key] = (hash(key), key, value)
+
+        self._root = _build(list(leaves.values()), 0)
+        self._size = len(leaves)
+
+    @classmethod
+    def _make(cls, root, size: int) -> "PersistentMap":
+        persistent_map = cls.__new__(cls)
+        persistent_map._root = root
+        persistent_map._size = size
+        return persistent_map
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for leaf in _leaves(self._root):
+            yield leaf[1]
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, MISSING) is not MISSING
+
+    def __getitem__(self, key):
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def get(self, key, default=None):
+        key_hash = hash(key)
+        node = self._root
+        shift = 0
+        while isinstance(node, _Branch):
+            node = node.children[(key_hash >> shift) & MASK]
+            shift += BITS
+
+        if isinstance(node, _Collision):
+            for leaf in node.leaves:
+                if leaf[1] == key:
+                    return leaf[2]
+        elif node is not None and node[0] == key_hash and node[1] == key:
+            return node[2]
+
+        return default
+
+    def items(self):
+        for leaf in _leaves(self._root):
+            yield leaf[1], leaf[2]
+
+    def values(self):
+        for leaf in _leaves(self._root):
+            yield leaf[2]
+
+    def set(self, key, value) -> "PersistentMap":
+        root, added = _set(self._root, hash(key), key, value, 0)
+        return PersistentMap._make(root, self._size + added)
+
+    def delete(self, key) -> "PersistentMap":
+        return PersistentMap._make(_delete(self._root, hash(key), key, 0), self._size - 1)
+
+    def update(self, items) -> "PersistentMap":
+        items = list(items)
+        if len(items) > max(self._size, WIDTH):
+            return PersistentMap([*self.items(), *items])
+
+        persistent_map = self
+        for key, value in items:
+            persistent_map = persistent_map.set(key, value)
+
+        return persistent_map
+
+    def discard(self, keys) -> "PersistentMap":
+        keys = set(keys)
+        if len(keys) > max(self._size // 2, WIDTH):
+            return PersistentMap((key, value) for key, value in self.items() if key not in keys)
+
+        persistent_map = self
+        for key in keys:
+            persistent_map = persistent_map.delete(key)
+
+        return persistent_map
+
+    def diff(self, other: "PersistentMap"):
+        """Yield (key, value here, value in other) for every key that differs, MISSING where absent."""
+        return _diff(self._root, other._root)
+
+    def unshared_bytes(self, other: "PersistentMap" = None) -> int:
+        """Approximate bytes held by nodes of this map that other does not share."""
+        return _unshared_bytes(self._root, None if other is None else other._root)
+
+    def replaced_bytes(self, keys) -> int:
+        """Approximate bytes of the nodes on the paths to keys, which set and delete of those keys replace.
+
+        Only those paths are walked, so an edit can be charged without diffing
+        this map against the edited one. Nodes an edit merely moves are not counted.
+        """
+        seen = set()
+        nbytes = 0
+        for key in keys:
+            key_hash = hash(key)
+            node = self._root
+            shift = 0
+            while isinstance(node, _Branch):
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    nbytes += sys.getsizeof(node) + sys.getsizeof(node.children)
+                node = node.children[(key_hash >> shift) & MASK]
+                shift += BITS
+
+            if isinstance(node, _Collision):
+                if node.hash == key_hash and id(node) not in seen:
+                    seen.add(id(node))
+                    nbytes += _unshared_bytes(node, None)
+            elif node is not None and node[0] == key_hash and node[1] == key:
+                nbytes += _unshared_bytes(node, None)
+
+        return nbytes
+
+
+def _build(leaves: list, shift: int):
+    if not leaves:
+        return None
+
+    if len(leaves) == 1:
+        return leaves[0]
+
+    if all(leaf[0] == leaves[0][0] for leaf in leaves):
+        return _Collision(leaves[0][0], tuple(leaves))
+
+    groups = [[] for _ in range(WIDTH)]
+    for leaf in leaves:
+        groups[(leaf[0] >> shift) & MASK].append(leaf)
+
+    return _Branch(tuple(_build(group, shift + BITS) for group in groups))
+
+
+def _leaves(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if isinstance(node, _Branch):
+            stack.extend(reversed(node.children))
+        elif isinstance(node, _Collision):
+            yield from node.leaves
+        else:
+            yield node
+
+
+def _split(node, node_hash: int, shift: int) -> _Branch:
+    children = list(_EMPTY_CHILDREN)
+    children[(node_hash >> shift) & MASK] = node
+    return _Branch(tuple(children))
+
+
+def _set(node, key_hash: int, key, value, shift: int):
+    if node is None:
+        return (key_hash, key, value), True
+
+    if isinstance(node, _Branch):
+        index = (key_hash >> shift) & MASK
+        child, added = _set(node.children[index], key_hash, key, value, shift + BITS)
+        children = list(node.children)
+        children[index] = child
+        return _Branch(tuple(children)), added
+
+    if isinstance(node, _Collision):
+        if node.hash != key_hash:
+            return _set(_split(node, node.hash, shift), key_hash, key, value, shift)
+
+        leaves = tuple(leaf for leaf in node.leaves if leaf[1] != key)
+        return _Collision(key_hash, leaves + ((key_hash, key, value),)), len(leaves) == len(node.leaves)
+
+    if node[0] != key_hash:
+        return _set(_split(node, node[0], shift), key_hash, key, value, shift)
+
+    if node[1] == key:
+        return (key_hash, key, value), False
+
+    return _Collision(key_hash, (node, (key_hash, key, value))), True
+
+
+def _delete(node, key_hash: int, key, shift: int):
+    if node is None:
+        raise KeyError(key)
+
+    if isinstance(node, _Branch):
+        index = (key_hash >> shift) & MASK
+        children = list(node.children)
+        children[index] = _delete(children[index], key_hash, key, shift + BITS)
+        remaining = [child for child in children if child is not None]
+        if not remaining:
+            return None
+        if len(remaining) == 1 and not isinstance(remaining[0], _Branch):
+            return remaining[0]
+
+        return _Branch(tuple(children))
+
+    if isinstance(node, _Collision):
+        leaves = tuple(leaf for leaf in node.leaves if leaf[1] != key)
+        if len(leaves) == len(node.leaves):
+            raise KeyError(key)
+
+        return leaves[0] if len(leaves) == 1 else _Collision(key_hash, leaves)
+
+    if node[0] != key_hash or node[1] != key:
+        raise KeyError(key)
+
+    return None
+
+
+def _diff(node, other):
+    if node is other:
+        return
+
+    if isinstance(node, _Branch) and isinstance(other, _Branch):
+        for child, other_child in zip(node.children, other.children):
+            yield from _diff(child, other_child)
+        return
+
+    values = {leaf[1]: leaf[2] for leaf in _leaves(node)}
+    for _, key, other_value in _leaves(other):
+        value = values.pop(key, MISSING)
+        if value is not other_value and (value is MISSING or value != other_value):
+            yield key, value, other_value
+
+    for key, value in values.items():
+        yield key, value, MISSING
+
+
+def _unshared_bytes(node, other) -> int:
+    if node is other or node is None:
+        return 0
+
+    if isinstance(node, _Branch):
+        other_children = other.children if isinstance(other, _Branch) else _EMPTY_CHILDREN
+        return sys.getsizeof(node) + sys.getsizeof(node.children) + sum(
+            _unshared_bytes(child, other_child) for child, other_child in zip(node.children, other_children)
+        )
+
+    if isinstance(node, _Collision):
+        return sys.getsizeof(node) + sys.getsizeof(node.leaves) + sum(_unshared_bytes(leaf, None) for leaf in node.leaves)
+
+    return sys.getsizeof(node) + sys.getsizeof(node[2])
@@ -0,0 +1,137 @@
+import re
+from bisect import bisect_left, insort
+from itertools import chain
+
+_TOKEN = re.compile(r'\w+')
+
+VOCABULARY_REBUILD_THRESHOLD = 16
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+class SearchIndex:
+    """Inverted index of description tokens across the task lists of a workspace.
+
+    Postings are insertion-ordered dicts used as ordered sets of
+    (list id, description) keys; a sorted vocabulary answers prefix terms.
+    Queries walk the smallest term's postings, probing the other terms'
+    postings or, for prefixes spanning several tokens, the candidate's
+    own description.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._vocabulary = []
+        self._list_ids = {}
+        self._list_names = {}
+        self._next_list_id = 0
+
+    def add_list(self, name: str, descriptions) -> None:
+        list_id = self._next_list_id
+        self._next_list_id += 1
+        self._list_ids[name] = list_id
+        self._list_names[list_id] = name
+        self._add_keys((list_id, description) for description in descriptions)
+
+    def remove_list(self, name: str, descriptions) -> None:
+        list_id = self._list_ids.pop(name)
+        del self._list_names[list_id]
+        self._remove_keys((list_id, description) for description in descriptions)
+
+    def rename_list(self, old_name: str, name: str) -> None:
+        list_id = self._list_ids.pop(old_name)
+        self._list_ids[name] = list_id
+        self._list_names[list_id] = name
+
+    def add(self, list_name: str, *descriptions: str) -> None:
+        list_id = self._list_ids[list_name]
+        self._add_keys((list_id, description) for description in descriptions)
+
+    def remove(self, list_name: str, *descriptions: str) -> None:
+        list_id = self._list_ids[list_name]
+        self._remove_keys((list_id, description) for description in descriptions)
+
+    def search(self, text: str, prefix: bool = True, limit: int = None) -> list[tuple[str, str]]:
+        terms = list(dict.fromkeys(tokenize(text)))
+        if not terms or limit == 0:
+            return []
+
+        postings = {term: self._term_postings(term, prefix) for term in terms}
+        terms.sort(key=lambda term: sum(len(posting) for posting in postings[term]))
+        driver, *filters = terms
+        exact = [postings[term][0] for term in filters if len(postings[term]) == 1]
+        filters = [term for term in filters if len(postings[term]) > 1]
+
+        results = []
+        seen = set() if len(postings[driver]) > 1 else None
+        for key in chain.from_iterable(postings[driver]):
+            if seen is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            if not all(key in posting for posting in exact):
+                continue
+
+            if filters and not self._matches(key[1], filters, prefix):
+                continue
+
+            results.append((self._list_names[key[0]], key[1]))
+            if limit is not None and len(results) >= limit:
+                break
+
+        return results
+
+    @staticmethod
+    def _matches(description: str, terms: list[str], prefix: bool) -> bool:
+        tokens = tokenize(description)
+        if prefix:
+            return all(any(token.startswith(term) for token in tokens) for term in terms)
+
+        return all(term in tokens for term in terms)
+
+    def _term_postings(self, term: str, prefix: bool) -> list[dict]:
+        if not prefix:
+            posting = self._postings.get(term)
+            return [posting] if posting is not None else []
+
+        start = bisect_left(self._vocabulary, term)
+        end = bisect_left(self._vocabulary, term + '\U0010ffff', start)
+        return [self._postings[token] for token in self._vocabulary[start:end]]
+
+    def _add_keys(self, keys) -> None:
+        new_tokens = []
+        for key in keys:
+            for token in set(tokenize(key[1])):
+                posting = self._postings.get(token)
+                if posting is None:
+                    posting = self._postings[token] = {}
+                    new_tokens.append(token)
+
+                posting[key] = None
+
+        if len(new_tokens) <= VOCABULARY_REBUILD_THRESHOLD:
+            for token in new_tokens:
+                insort(self._vocabulary, token)
+        else:
+            self._vocabulary.extend(new_tokens)
+            self._vocabulary.sort()
+
+    def _remove_keys(self, keys) -> None:
+        emptied = []
+        for key in keys:
+            for token in set(tokenize(key[1])):
+                posting = self._postings[token]
+                del posting[key]
+                if not posting:
+                    del self._postings[token]
+                    emptied.append(token)
+
+        if len(emptied) <= VOCABULARY_REBUILD_THRESHOLD:
+            for token in emptied:
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+        else:
+            emptied = set(emptied)
+            self._vocabulary = [token for token in self._vocabulary if token not in emptied]
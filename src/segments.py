@@ -0,0 +1,118 @@
+import json
+import pathlib
+
+from src.serialization import FORMAT_VERSION, write_atomically
+from src.task_list import TaskList
+from src.task_list_index import UnloadedTaskList
+from src.utils.task_status import TaskStatus
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class SegmentDirectory:
+    """Save directory holding one segment file per TaskList plus a manifest.
+
+    Segments are never overwritten: a changed list goes to a new file and
+    the manifest is replaced atomically afterwards, so a crash at any point
+    leaves the previous save readable.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._files = {}
+        self._dirty = set()
+        self._next_segment = 0
+
+    @property
+    def dirty(self) -> set[TaskList]:
+        return set(self._dirty)
+
+    def mark_dirty(self, task_list: TaskList) -> None:
+        self._dirty.add(task_list)
+
+    def forget(self, task_list: TaskList) -> None:
+        self._dirty.discard(task_list)
+
+    def replace(self, entry: UnloadedTaskList, task_list: TaskList) -> None:
+        if entry in self._files:
+            self._files[task_list] = self._files.pop(entry)
+
+    def save(self, workspace) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        files = {}
+        for entry in workspace.task_lists.entries():
+            file_name = self._files.get(entry)
+            if file_name is None or entry in self._dirty:
+                file_name = f'{self._next_segment:08d}.json'
+                self._next_segment += 1
+                data = entry.to_dict()
+                write_atomically(self.path / file_name, lambda output_file: json.dump(data, output_file, ensure_ascii=False))
+
+            files[entry] = file_name
+
+        manifest = {
+            "version": FORMAT_VERSION,
+            "name": workspace.name,
+            "next_segment": self._next_segment,
+            "segments": [
+                {
+                    "name": entry.name,
+                    "file": file_name,
+                    "status_counts": {status.name: count for status, count in entry.status_counts.items()},
+                }
+                for entry, file_name in files.items()
+            ],
+        }
+        write_atomically(self.path / MANIFEST_NAME, lambda output_file: json.dump(manifest, output_file, ensure_ascii=False))
+
+        self._files = files
+        self._dirty.clear()
+        self._remove_unreferenced_segments()
+
+    def read_manifest(self) -> dict:
+        with open(self.path / MANIFEST_NAME, 'r', encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+
+        if manifest["version"] > FORMAT_VERSION:
+            raise ValueError(f'Unsupported workspace format version: {manifest["version"]}')
+
+        return manifest
+
+    def read_segment(self, file_name: str, compact: bool = False) -> TaskList:
+        return TaskList.from_dict(self._read_segment_data(file_name), compact)
+
+    def _read_segment_data(self, file_name: str) -> dict:
+        with open(self.path / file_name, 'r', encoding='utf-8') as segment_file:
+            return json.load(segment_file)
+
+    def load_task_lists(self, manifest: dict, compact: bool = False, lazy: bool = False):
+        self._next_segment = manifest["next_segment"]
+        for segment in manifest["segments"]:
+            file_name = segment["file"]
+            if lazy and "status_counts" in segment:
+                entry = UnloadedTaskList(
+                    segment["name"],
+                    {TaskStatus[status]: count for status, count in segment["status_counts"].items()},
+                    lambda file_name=file_name: self.read_segment(file_name, compact),
+                    lambda file_name=file_name: self._read_segment_data(file_name),
+                    compact=compact,
+                )
+            else:
+                entry = self.read_segment(file_name, compact)
+
+            self._files[entry] = file_name
+            yield entry
+
+    def load_task_list(self, name: str, compact: bool = False) -> TaskList:
+        for segment in self.read_manifest()["segments"]:
+            if segment["name"] == name:
+                return self.read_segment(segment["file"], compact)
+
+        raise ValueError('No task list with provided name')
+
+    def _remove_unreferenced_segments(self) -> None:
+        referenced = set(self._files.values())
+        for path in [*self.path.glob('*.json'), *self.path.glob('.*.tmp')]:
+            if path.name != MANIFEST_NAME and path.name not in referenced:
+                path.unlink(missing_ok=True)
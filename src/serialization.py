@@ -0,0 +1,390 @@
+import json
+import os
+import pathlib
+import re
+import threading
+from itertools import islice
+from operator import attrgetter
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+FORMAT_VERSION = 2
+WRITE_BATCH_SIZE = 1024
+READ_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = ' \t\n\r'
+
+_PRIORITY_NAMES = [priority.name for priority in TaskPriority]
+_STATUS_NAMES = [status.name for status in TaskStatus]
+_PRIORITY_RANKS = {priority: priority.rank for priority in TaskPriority}
+_STATUS_RANKS = {status: status.rank for status in TaskStatus}
+
+_FLAT_OBJECTS = re.compile(r'(?:\s*+\{(?:[^"{}\[\]]++|"(?:[^"\\]++|\\.)*+")*+\}\s*+,?+)*+')
+
+_get_description = attrgetter('_description')
+_get_priority = attrgetter('_priority')
+_get_status = attrgetter('_status')
+
+
+def write_workspace(workspace, stream, executor=None, generation: int = None, counts: list = None) -> None:
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+
+    if executor is not None:
+        write_payloads(workspace.name, [task_list_payload(task_list) for task_list in workspace.task_lists.entries()], stream, executor, generation, counts)
+        return
+
+    stream.write(_header(workspace.name, generation, counts))
+    for index, task_list in enumerate(workspace.task_lists.entries()):
+        if index:
+            stream.write(', ')
+
+        if not isinstance(task_list, TaskList):
+            stream.write(encode(task_list.to_dict()))
+            continue
+
+        stream.write(f'{{"name": {encode(task_list.name)}, "tasks": [')
+        tasks = iter(task_list.tasks.values())
+        separator = ''
+        while batch := list(islice(tasks, WRITE_BATCH_SIZE)):
+            stream.write(separator + encode([task.to_dict() for task in batch])[1:-1])
+            separator = ', '
+
+        stream.write(']}')
+
+    stream.write(']}')
+
+
+def encode_workspace(workspace) -> str:
+    encoded = (
+        task_list._encoded() if isinstance(task_list, TaskList) else json.dumps(task_list.to_dict(), ensure_ascii=False)
+        for task_list in workspace.task_lists.entries()
+    )
+    return f'{_header(workspace.name)}{", ".join(encoded)}]}}'
+
+
+def write_payloads(name: str, payloads: list, stream, executor=None, generation: int = None, counts: list = None) -> None:
+    stream.write(_header(name, generation, counts))
+    encoded = map(encode_task_list, payloads) if executor is None else executor.map(encode_task_list, payloads)
+    for index, task_list in enumerate(encoded):
+        if index:
+            stream.write(', ')
+
+        stream.write(task_list)
+
+    stream.write(']}')
+
+
+def task_list_counts(workspace) -> list:
+    return [entry.status_counts for entry in workspace.task_lists.entries()]
+
+
+def _header(name: str, generation: int = None, counts: list = None) -> str:
+    fields = f'"version": {FORMAT_VERSION}, "name": {json.dumps(name, ensure_ascii=False)}'
+    if generation is not None:
+        fields += f', "generation": {generation}'
+    if counts is not None:
+        encoded = json.dumps([{status.name: count for status, count in list_counts.items()} for list_counts in counts])
+        fields += f', "status_counts": {encoded}'
+
+    return f'{{{fields}, "task_list": ['
+
+
+def read_generation(path: pathlib.Path) -> int:
+    try:
+        with open(path, 'r', encoding='utf-8') as input_file:
+            return WorkspaceReader(input_file).generation
+    except FileNotFoundError:
+        return 0
+
+
+def task_list_payload(task_list):
+    if not isinstance(task_list, TaskList):
+        return task_list.to_dict()
+
+    tasks = list(task_list.tasks.values())
+    return (
+        task_list.name,
+        list(map(_get_description, tasks)),
+        bytes(map(_PRIORITY_RANKS.__getitem__, map(_get_priority, tasks))),
+        bytes(map(_STATUS_RANKS.__getitem__, map(_get_status, tasks))),
+    )
+
+
+def encode_task_list(payload) -> str:
+    if isinstance(payload, dict):
+        return json.dumps(payload, ensure_ascii=False)
+
+    name, descriptions, priorities, statuses = payload
+    return json.dumps({
+        "name": name,
+        "tasks": [
+            {"description": description, "priority": _PRIORITY_NAMES[priority], "status": _STATUS_NAMES[status]}
+            for description, priority, status in zip(descriptions, priorities, statuses)
+        ],
+    }, ensure_ascii=False)
+
+
+def write_atomically(path: pathlib.Path, write, mode: str = 'w') -> None:
+    temporary_path = write_temporary(path, write, mode)
+    try:
+        os.replace(temporary_path, path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+
+def write_temporary(path: pathlib.Path, write, mode: str = 'w') -> pathlib.Path:
+    temporary_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        with open(temporary_path, mode, encoding=None if 'b' in mode else 'utf-8') as output_file:
+            write(output_file)
+            output_file.flush()
+            os.fsync(output_file.fileno())
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+    return temporary_path
+
+
+class WorkspaceReader:
+    def __init__(self, stream, chunk_size: int = READ_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+        self.name = None
+        self.version = 1
+        self.generation = 0
+        self.status_counts = None
+
+        self._expect('{')
+        while True:
+            key = self._read_value()
+            self._expect(':')
+            if key == 'task_list':
+                break
+
+            value = self._read_value()
+            if key == 'name':
+                self.name = value
+            elif key == 'version':
+                self.version = value
+            elif key == 'generation':
+                self.generation = value
+            elif key == 'status_counts':
+                self.status_counts = [{TaskStatus[status]: count for status, count in counts.items()} for counts in value]
+
+            self._expect(',')
+
+        if self.name is None:
+            raise ValueError('Workspace name must precede its task lists')
+
+        if self.version > FORMAT_VERSION:
+            raise ValueError(f'Unsupported workspace format version: {self.version}')
+
+    def task_lists(self, compact: bool = False):
+        task_list = None
+        tasks = []
+        for name, task in self._records():
+            if task is None:
+                if task_list is not None:
+                    task_list._add_tasks(tasks, bind=False)
+                    yield task_list
+
+                task_list = TaskList(name, compact)
+                tasks = []
+            else:
+                tasks.append(task)
+
+        if task_list is not None:
+            task_list._add_tasks(tasks, bind=False)
+            yield task_list
+
+    def tasks(self):
+        for name, task in self._records():
+            if task is not None:
+                yield name, task
+
+    def _records(self):
+        for _ in self._array_items():
+            if self._peek() == '"':
+                data = json.loads(self._read_value())
+                yield data["name"], None
+                for task in data["tasks"]:
+                    yield data["name"], Task.from_json(task)
+                continue
+
+            name = None
+            self._expect('{')
+            if self._peek() == '}':
+                raise ValueError('Task list is missing its name')
+
+            while True:
+                key = self._read_value()
+                self._expect(':')
+                if key == 'name':
+                    name = self._read_value()
+                    yield name, None
+                elif key == 'tasks':
+                    if name is None:
+                        raise ValueError('Task list name must precede its tasks')
+
+                    for _ in self._array_items():
+                        yield name, Task.from_dict(self._read_value())
+                else:
+                    self._read_value()
+
+                if self._next_token() == '}':
+                    break
+
+    def _array_items(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self._position += 1
+            return
+
+        while True:
+            yield
+            if self._next_token() == ']':
+                return
+
+    def _fill(self, size: int = 0) -> bool:
+        if self._eof:
+            return False
+
+        chunk = self._stream.read(max(size, self._chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._fill():
+                raise ValueError('Unexpected end of workspace save')
+
+    def _next_token(self) -> str:
+        token = self._peek()
+        self._position += 1
+        return token
+
+    def _expect(self, token: str) -> None:
+        if self._next_token() != token:
+            raise ValueError(f'Malformed workspace save, expected {token!r}')
+
+    def _read_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._fill(len(self._buffer) - self._position):
+                    continue
+                raise
+
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._position = end
+            return value
+
+
+class SaveIndexReader(WorkspaceReader):
+    """WorkspaceReader over a save opened with latin-1 and newline='', so text offsets are byte offsets.
+
+    task_list_spans() skips the task arrays without decoding them and
+    yields where each task list object starts and ends in the file.
+    """
+
+    def __init__(self, stream, chunk_size: int = READ_CHUNK_SIZE):
+        self._offset = 0
+        super().__init__(stream, chunk_size)
+
+    def task_list_spans(self):
+        for _ in self._array_items():
+            self._peek()
+            start = self._offset + self._position
+            name = None
+            self._expect('{')
+            while self._peek() != '}':
+                key = self._read_value()
+                self._expect(':')
+                if key == 'name':
+                    name = self._read_value()
+                elif key == 'tasks':
+                    self._skip_array()
+                else:
+                    self._read_value()
+
+                if self._peek() == ',':
+                    self._position += 1
+
+            self._position += 1
+            if name is None:
+                raise ValueError('Task list is missing its name')
+
+            yield name, start, self._offset + self._position
+
+    def _skip_array(self) -> None:
+        self._expect('[')
+        while (token := self._peek()) != ']':
+            end = _FLAT_OBJECTS.match(self._buffer, self._position).end()
+            if end > self._position:
+                self._position = end
+            elif token == ',':
+                self._position += 1
+            else:
+                self._read_value()
+
+        self._position += 1
+
+    def _fill(self, size: int = 0) -> bool:
+        position = self._position
+        if not super()._fill(size):
+            return False
+
+        self._offset += position
+        return True
+
+    def _read_value(self):
+        self._peek()
+        start = self._offset + self._position
+        value = super()._read_value()
+        text = self._buffer[start - self._offset:self._position]
+        return value if text.isascii() else json.loads(text.encode('latin-1'))
+
+
+class SaveFile:
+    """Open save whose task lists are decoded one byte span at a time.
+
+    Keeping the handle open means a later save that replaces the file does
+    not change what unloaded lists read.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._lock = threading.Lock()
+
+    def read(self, start: int, end: int) -> dict:
+        with self._lock:
+            self._file.seek(start)
+            return json.loads(self._file.read(end - start))
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,262 @@
+import sqlite3
+import threading
+from itertools import chain, islice
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+BATCH_SIZE = 50_000
+
+PRIORITIES = list(TaskPriority)
+STATUSES = list(TaskStatus)
+PRIORITY_NAMES = [priority.name for priority in PRIORITIES]
+STATUS_NAMES = [status.name for status in STATUSES]
+
+SORT_COLUMNS = ('status', 'priority')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS workspaces (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS task_lists (
+    id INTEGER PRIMARY KEY,
+    workspace_id INTEGER NOT NULL REFERENCES workspaces (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    UNIQUE (workspace_id, name)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    task_list_id INTEGER NOT NULL REFERENCES task_lists (id) ON DELETE CASCADE,
+    description TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    priority INTEGER NOT NULL
+);
+'''
+
+INDEXES = (
+    'CREATE UNIQUE INDEX IF NOT EXISTS tasks_by_list_description ON tasks (task_list_id, description)',
+    'CREATE INDEX IF NOT EXISTS tasks_by_list_status_priority ON tasks (task_list_id, status, priority)',
+)
+DROP_INDEXES = (
+    'DROP INDEX tasks_by_list_description',
+    'DROP INDEX tasks_by_list_status_priority',
+)
+
+
+class SqliteBackend:
+    """Workspace storage in an SQLite database.
+
+    Statuses and priorities are stored as enum ranks, and task ids follow
+    insertion order, so ORDER BY reproduces TaskList's sort orders. The
+    connection may be shared by lazily loaded lists across threads, so
+    reads for them go through load_task_list and read_task_list, which
+    hold the backend's lock.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.execute('PRAGMA cache_size = -65536')
+        self._connection.executescript(SCHEMA)
+        for statement in INDEXES:
+            self._connection.execute(statement)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def workspace_names(self) -> list[str]:
+        return [name for name, in self._connection.execute('SELECT name FROM workspaces ORDER BY id')]
+
+    def task_list_names(self, workspace_name: str) -> list[str]:
+        rows = self._connection.execute(
+            'SELECT task_lists.name FROM task_lists JOIN workspaces ON workspaces.id = task_lists.workspace_id '
+            'WHERE workspaces.name = ? ORDER BY task_lists.id',
+            (workspace_name,),
+        )
+        return [name for name, in rows]
+
+    def save_workspace(self, workspace) -> None:
+        with self._connection:
+            self._connection.execute('DELETE FROM workspaces WHERE name = ?', (workspace.name,))
+            workspace_id = self._connection.execute('INSERT INTO workspaces (name) VALUES (?)', (workspace.name,)).lastrowid
+            task_lists = list(workspace.task_lists.values())
+            task_list_ids = [
+                self._connection.execute(
+                    'INSERT INTO task_lists (workspace_id, name) VALUES (?, ?)', (workspace_id, task_list.name),
+                ).lastrowid
+                for task_list in task_lists
+            ]
+            self._insert_rows(chain.from_iterable(
+                _task_rows(task_list_id, task_list.tasks.values()) for task_list_id, task_list in zip(task_list_ids, task_lists)
+            ))
+
+    def import_tasks(self, workspace_name: str, task_list_name: str, tasks) -> None:
+        with self._connection:
+            self._connection.execute('INSERT OR IGNORE INTO workspaces (name) VALUES (?)', (workspace_name,))
+            workspace_id = self._workspace_id(workspace_name)
+            self._connection.execute(
+                'INSERT OR IGNORE INTO task_lists (workspace_id, name) VALUES (?, ?)', (workspace_id, task_list_name),
+            )
+            try:
+                self._insert_rows(_task_rows(self._task_list_id(workspace_name, task_list_name), tasks))
+            except sqlite3.IntegrityError as error:
+                raise ValueError('There is already task with this description') from error
+
+    def load_task_list(self, workspace_name: str, task_list_name: str, compact: bool = False) -> TaskList:
+        task_list = TaskList(task_list_name, compact)
+        with self._lock:
+            task_list._add_tasks(self.iter_tasks(workspace_name, task_list_name), bind=False)
+
+        return task_list
+
+    def read_task_list(self, workspace_name: str, task_list_name: str, keys: tuple = ()) -> dict:
+        """The list as TaskList.to_dict() would give it after sorting on keys, read with the indexed ORDER BY."""
+        with self._lock:
+            rows = self._connection.execute(
+                f'SELECT description, priority, status FROM tasks WHERE task_list_id = ? ORDER BY {_order_clause(keys)}',
+                (self._task_list_id(workspace_name, task_list_name),),
+            ).fetchall()
+
+        return {
+            "name": task_list_name,
+            "tasks": [
+                {"description": description, "priority": PRIORITY_NAMES[priority], "status": STATUS_NAMES[status]}
+                for description, priority, status in rows
+            ],
+        }
+
+    def iter_task_lists(self, workspace_name: str, compact: bool = False):
+        if workspace_name not in self.workspace_names():
+            raise ValueError('No workspace with provided name')
+
+        for task_list_name in self.task_list_names(workspace_name):
+            yield self.load_task_list(workspace_name, task_list_name, compact)
+
+    def iter_tasks(self, workspace_name: str, task_list_name: str, keys: tuple = ()):
+        rows = self._connection.execute(
+            f'SELECT description, priority, status FROM tasks WHERE task_list_id = ? ORDER BY {_order_clause(keys)}',
+            (self._task_list_id(workspace_name, task_list_name),),
+        )
+        for description, priority, status in rows:
+            yield Task._trusted(description, PRIORITIES[priority], STATUSES[status])
+
+    def find_task_by_description(self, workspace_name: str, task_list_name: str, task_description: str) -> Task:
+        row = self._connection.execute(
+            'SELECT description, priority, status FROM tasks WHERE task_list_id = ? AND description = ?',
+            (self._task_list_id(workspace_name, task_list_name), task_description),
+        ).fetchone()
+        if row is None:
+            raise ValueError('No task with provided description')
+
+        description, priority, status = row
+        return Task(description, PRIORITIES[priority], STATUSES[status])
+
+    def status_counts(self, workspace_name: str, task_list_name: str = None) -> dict[TaskStatus, int]:
+        if task_list_name is None:
+            rows = self._connection.execute(
+                'SELECT status, COUNT(*) FROM tasks WHERE task_list_id IN '
+                '(SELECT id FROM task_lists WHERE workspace_id = ?) GROUP BY status',
+                (self._workspace_id(workspace_name),),
+            )
+        else:
+            rows = self._connection.execute(
+                'SELECT status, COUNT(*) FROM tasks WHERE task_list_id = ? GROUP BY status',
+                (self._task_list_id(workspace_name, task_list_name),),
+            )
+
+        counts = {status: 0 for status in TaskStatus}
+        for status, count in rows:
+            counts[STATUSES[status]] = count
+
+        return counts
+
+    def task_list_status_counts(self, workspace_name: str) -> dict[str, dict[TaskStatus, int]]:
+        rows = self._connection.execute(
+            'SELECT task_lists.name, tasks.status, COUNT(tasks.id) FROM task_lists '
+            'LEFT JOIN tasks ON tasks.task_list_id = task_lists.id WHERE task_lists.workspace_id = ? '
+            'GROUP BY task_lists.id, tasks.status ORDER BY task_lists.id',
+            (self._workspace_id(workspace_name),),
+        )
+
+        counts = {}
+        for task_list_name, status, count in rows:
+            list_counts = counts.setdefault(task_list_name, {status: 0 for status in TaskStatus})
+            if status is not None:
+                list_counts[STATUSES[status]] = count
+
+        return counts
+
+    def progress(self, workspace_name: str, task_list_name: str = None) -> str:
+        counts = self.status_counts(workspace_name, task_list_name)
+        return f'{counts[TaskStatus.DONE]}/{sum(counts.values())}'
+
+    def _insert_rows(self, rows) -> None:
+        """Insert task rows inside the caller's transaction.
+
+        A write of more than one batch into a table holding less than a batch
+        drops the task indexes and rebuilds them afterwards, which is about
+        twice as fast as updating them row by row. A duplicate description
+        then fails the UNIQUE index build and rolls back with the rest.
+        """
+        rows = iter(rows)
+        batch = list(islice(rows, BATCH_SIZE))
+        rebuild = len(batch) == BATCH_SIZE and not self._holds_rows(BATCH_SIZE)
+        if rebuild:
+            for statement in DROP_INDEXES:
+                self._connection.execute(statement)
+
+        while batch:
+            self._connection.executemany(
+                'INSERT INTO tasks (task_list_id, description, status, priority) VALUES (?, ?, ?, ?)', batch,
+            )
+            batch = list(islice(rows, BATCH_SIZE))
+
+        if rebuild:
+            for statement in INDEXES:
+                self._connection.execute(statement)
+
+    def _holds_rows(self, count: int) -> bool:
+        return self._connection.execute('SELECT 1 FROM tasks LIMIT 1 OFFSET ?', (count - 1,)).fetchone() is not None
+
+    def _workspace_id(self, workspace_name: str) -> int:
+        row = self._connection.execute('SELECT id FROM workspaces WHERE name = ?', (workspace_name,)).fetchone()
+        if row is None:
+            raise ValueError('No workspace with provided name')
+
+        return row[0]
+
+    def _task_list_id(self, workspace_name: str, task_list_name: str) -> int:
+        row = self._connection.execute(
+            'SELECT task_lists.id FROM task_lists JOIN workspaces ON workspaces.id = task_lists.workspace_id '
+            'WHERE workspaces.name = ? AND task_lists.name = ?',
+            (workspace_name, task_list_name),
+        ).fetchone()
+        if row is None:
+            raise ValueError('No task list with provided name')
+
+        return row[0]
+
+
+def _order_clause(keys: tuple) -> str:
+    for key in keys:
+        if key not in SORT_COLUMNS:
+            raise ValueError(f'Cannot sort tasks by {key}')
+
+    return ', '.join((*keys, 'id'))
+
+
+def _task_rows(task_list_id: int, tasks):
+    return ((task_list_id, task.description, task.status.rank, task.priority.rank) for task in tasks)
@@ -0,0 +1,106 @@
+from src.content_hash import HASH_MASK, task_list_digest
+from src.journal import WorkspaceJournal
+
+MERGE_PREFERENCES = ('ours', 'theirs')
+
+
+def workspace_digest(workspace) -> int:
+    return sum(task_list_digest(entry.name, entry.content_hash) for entry in workspace.task_lists.entries()) & HASH_MASK
+
+
+def diff_workspaces(workspace, other) -> list:
+    """Change set turning workspace into other.
+
+    Change sets are lists of journal entries, so they are plain JSON and
+    apply idempotently. Lists whose content hashes match are skipped
+    without looking at their tasks; task order is not compared.
+    """
+    changes = [['remove_list', name] for name in workspace.task_lists if name not in other.task_lists]
+    for entry in other.task_lists.entries():
+        mine = workspace.task_lists.entry(entry.name)
+        if mine is None:
+            changes.append(['add_list', entry.to_dict()])
+        elif mine.content_hash != entry.content_hash:
+            changes.extend(_diff_tasks(entry.name, _rows(workspace, entry.name), _rows(other, entry.name)))
+
+    return changes
+
+
+def apply_changes(workspace, changes, compact: bool = False) -> None:
+    for entry in changes:
+        WorkspaceJournal.apply(workspace, entry, compact)
+
+
+def merge_workspaces(workspace, base, other, prefer: str = 'ours') -> list:
+    """Apply the changes other made since base to workspace and return them.
+
+    Lists other left untouched are skipped by hash. When both sides changed
+    the same task, or one side removed a list the other changed, prefer
+    picks the winner.
+    """
+    if prefer not in MERGE_PREFERENCES:
+        raise ValueError('prefer must be "ours" or "theirs"')
+
+    changes = []
+    for name in dict.fromkeys([*base.task_lists, *other.task_lists]):
+        base_hash = _content_hash(base, name)
+        their_hash = _content_hash(other, name)
+        my_hash = _content_hash(workspace, name)
+        if their_hash == base_hash or their_hash == my_hash:
+            continue
+
+        if my_hash is None or their_hash is None:
+            if my_hash == base_hash or prefer == 'theirs':
+                changes.append(['remove_list', name] if their_hash is None else ['add_list', other.task_lists[name].to_dict()])
+            continue
+
+        mine = _rows(workspace, name)
+        theirs = _rows(other, name)
+        if my_hash == base_hash:
+            changes.extend(_diff_tasks(name, mine, theirs))
+            continue
+
+        original = {} if base_hash is None else _rows(base, name)
+        merged = dict(mine)
+        for description in dict.fromkeys([*original, *theirs]):
+            base_row = original.get(description)
+            their_row = theirs.get(description)
+            my_row = mine.get(description)
+            if their_row == base_row or their_row == my_row:
+                continue
+
+            if my_row == base_row or prefer == 'theirs':
+                if their_row is None:
+                    del merged[description]
+                else:
+                    merged[description] = their_row
+
+        changes.extend(_diff_tasks(name, mine, merged))
+
+    apply_changes(workspace, changes)
+    return changes
+
+
+def _content_hash(workspace, name: str) -> int | None:
+    entry = workspace.task_lists.entry(name)
+    return None if entry is None else entry.content_hash
+
+
+def _rows(workspace, name: str) -> dict:
+    return {description: (task.priority, task.status) for description, task in workspace.task_lists[name]._tasks.items()}
+
+
+def _diff_tasks(name: str, rows: dict, target: dict) -> list:
+    changes = []
+    removed = [description for description in rows if description not in target]
+    if removed:
+        changes.append(['remove_tasks', name, removed])
+
+    changed = [
+        {"description": description, "priority": priority.name, "status": status.name}
+        for description, (priority, status) in target.items() if rows.get(description) != (priority, status)
+    ]
+    if changed:
+        changes.append(['add_tasks', name, changed])
+
+    return changes
@@ -1,11 +1,15 @@
 import json
 
+from src.encoding_cache import ENCODING_CACHE
 from src.utils.task_priority import TaskPriority
 from src.utils.task_status import TaskStatus
 
 
 class Task:
+    __slots__ = ('_description', '_priority', '_status', '_task_list', '__weakref__')
+
     def __init__(self, description: str, priority: TaskPriority = TaskPriority.MEDIUM, status: TaskStatus = TaskStatus.TO_BE_DONE):
+        self._task_list = None
         self.description = description
         self.priority = priority
         self.status = status
@@ -22,7 +26,10 @@ class Task:
         if description == '':
             raise ValueError('Description cannot be empty')
 
-        self._description = description
+        if self._task_list is None:
+            self._description = description
+        else:
+            self._task_list._rename_task(self, description)
 
     @property
     def status(self) -> TaskStatus:
@@ -33,7 +40,11 @@ class Task:
         if not isinstance(status, TaskStatus):
             raise TypeError('Status must be a TaskStatus type')
 
-        self._status = status
+        if self._task_list is None:
+            self._status = status
+            return
+
+        self._task_list._update_task(self, status=status)
 
     @property
     def priority(self) -> TaskPriority:
@@ -44,25 +55,65 @@ class Task:
         if not isinstance(priority, TaskPriority):
             raise TypeError('Priority must be a TaskPriority type')
 
-        self._priority = priority
+        if self._task_list is None:
+            self._priority = priority
+            return
+
+        self._task_list._update_task(self, priority=priority)
 
     def __str__(self):
         formatted_status = self.status.name.replace('_', ' ').capitalize()
         formatted_priority = self.priority.name.capitalize()
         return f'{self.description} - {formatted_status} - {formatted_priority}'
 
-    def to_json(self):
-        data = {
+    def to_dict(self) -> dict:
+        return {
             "description": self.description,
             "priority": self.priority.name,
             "status": self.status.name,
         }
 
-        return json.dumps(data, ensure_ascii=False)
+    def to_json(self):
+        task_list = self._task_list
+        if task_list is None or not ENCODING_CACHE.max_bytes:
+            return json.dumps(self.to_dict(), ensure_ascii=False)
+
+        return task_list._encoded_tasks([self.description], [self.priority], [self.status])[0]
 
     @classmethod
     def from_json(cls, json_str):
-        data = json.loads(json_str)
+        return cls.from_dict(json.loads(json_str))
+
+    @classmethod
+    def from_dicts(cls, items) -> list["Task"]:
+        priorities = TaskPriority.__members__
+        statuses = TaskStatus.__members__
+        tasks = []
+        for data in items:
+            priority = priorities[data["priority"]]
+            status = statuses[data["status"]]
+            description = data["description"]
+            if not isinstance(description, str):
+                raise TypeError('Description must be a string')
+
+            if description == '':
+                raise ValueError('Description cannot be empty')
+
+            tasks.append(cls._trusted(description, priority, status))
+
+        return tasks
+
+    @classmethod
+    def _trusted(cls, description: str, priority: TaskPriority, status: TaskStatus) -> "Task":
+        task = cls.__new__(cls)
+        task._task_list = None
+        task._description = description
+        task._priority = priority
+        task._status = status
+        return task
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Task":
         priority = TaskPriority[data["priority"]]
         status = TaskStatus[data["status"]]
 
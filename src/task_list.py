@@ -1,12 +1,61 @@
+import io
 import json
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Mapping
+from itertools import islice
+from operator import attrgetter
+from weakref import WeakValueDictionary
 
-from src.task import Task, TaskStatus
+from src.content_hash import HASH_MASK, task_digest, tasks_digest
+from src.encoding_cache import ENCODING_CACHE, encode, encode_task, next_key
+from src.task import Task, TaskPriority, TaskStatus
+from src.task_query import TaskQuery
+from src.task_store import TaskStore
+
+_get_description = attrgetter('_description')
+_get_priority = attrgetter('_priority')
+_get_status = attrgetter('_status')
+
+STATUS_RANKS = range(len(TaskStatus))
+PRIORITY_RANKS = range(len(TaskPriority))
+SORT_KEYS = {
+    'status': ('status',),
+    'priority': ('priority',),
+    'status_then_priority': ('status', 'priority'),
+}
+RENDER_BATCH_SIZE = 1024
+
+
+def write_lines(stream, lines) -> None:
+    lines = iter(lines)
+    separator = ''
+    while batch := list(islice(lines, RENDER_BATCH_SIZE)):
+        stream.write(separator + '\n'.join(batch))
+        separator = '\n'
 
 
 class TaskList:
-    def __init__(self, name: str):
+    """Named collection of tasks in insertion order.
+
+    A compact list keeps its tasks in a TaskStore. Renaming a task keeps
+    its place in a compact list but moves it to the end of a plain one,
+    so that renames stay O(1) in both.
+    """
+
+    def __init__(self, name: str, compact: bool = False):
+        self._lock = None
+        self._workspace = None
+        self._encoding_key = None
         self.name = name
-        self.tasks = {}
+        self._tasks = TaskStore(task_list=self) if compact else {}
+        self._bound = WeakValueDictionary() if compact else None
+        self._status_counts = {status: 0 for status in TaskStatus}
+        self._buckets = None
+        self._sequences = None
+        self._next_sequence = 0
+        self._content_hash = None
 
     @property
     def name(self) -> str:
@@ -20,70 +69,454 @@ class TaskList:
         if name == '':
             raise ValueError('Name cannot be empty')
 
-        self._name = name
+        if self._workspace is None:
+            self._name = name
+            if self._encoding_key is not None:
+                self._discard_encoding()
+        else:
+            self._workspace._rename_task_list(self, name)
+
+    @property
+    def compact(self) -> bool:
+        return self._bound is not None
+
+    @property
+    def tasks(self) -> Mapping:
+        return self._tasks
 
     @property
     def progress(self) -> str:
-        done = sum([1 for task in self.tasks.values() if task.status == TaskStatus.DONE])
-        tasks_count = len(self.tasks)
-        return f'{done}/{tasks_count}'
+        return f'{self._status_counts[TaskStatus.DONE]}/{len(self._tasks)}'
+
+    @property
+    def status_counts(self) -> dict[TaskStatus, int]:
+        return dict(self._status_counts)
+
+    @property
+    def content_hash(self) -> int:
+        if self._content_hash is None:
+            self._content_hash = tasks_digest(self._tasks.values())
+
+        return self._content_hash
 
     def add_task(self, task: Task):
-        if task.description in self.tasks:
+        if task.description in self._tasks:
             raise ValueError('There is already task with this description')
 
-        self.tasks[task.description] = task
+        if task._task_list is not None:
+            raise ValueError('Task already belongs to a task list')
+
+        self._tasks[task.description] = task
+        if self._bound is None:
+            task._task_list = self
+        else:
+            self._bind([task])
+
+        self._status_counts[task.status] += 1
+        if self._buckets is not None:
+            self._insert_sorted(task.description, task.status, task.priority)
+        if self._content_hash is not None:
+            self._content_hash = (self._content_hash + task_digest(task.description, task.priority, task.status)) & HASH_MASK
+        if self._encoding_key is not None:
+            self._discard_encoding()
+
+        if self._workspace is not None:
+            self._workspace._task_added(self, task)
+
+    def add_tasks(self, tasks):
+        self._add_tasks(tasks, bind=True)
+
+    def _add_tasks(self, tasks, bind: bool):
+        tasks = list(tasks)
+        descriptions = set()
+        for task in tasks:
+            if task.description in self._tasks or task.description in descriptions:
+                raise ValueError('There is already task with this description')
+
+            if task._task_list is not None:
+                raise ValueError('Task already belongs to a task list')
+
+            descriptions.add(task.description)
+
+        for task in tasks:
+            self._tasks[task.description] = task
+        if self._bound is None:
+            for task in tasks:
+                task._task_list = self
+        elif bind:
+            self._bind(tasks)
+
+        for status, count in Counter(task.status for task in tasks).items():
+            self._status_counts[status] += count
+        if self._content_hash is not None:
+            self._content_hash = (self._content_hash + tasks_digest(tasks)) & HASH_MASK
+        if self._encoding_key is not None:
+            self._discard_encoding()
+
+        if self._buckets is not None and isinstance(self._tasks, TaskStore):
+            rows = range(self._tasks.row_count - len(tasks), self._tasks.row_count)
+            for row, task in zip(rows, tasks):
+                self._buckets[task.status.rank, task.priority.rank].append(row)
+        elif self._buckets is not None:
+            for sequence, task in enumerate(tasks, self._next_sequence):
+                self._sequences[task.description] = sequence
+                self._buckets[task.status.rank, task.priority.rank].append((sequence, task.description))
+            self._next_sequence += len(tasks)
+
+        if self._workspace is not None and tasks:
+            self._workspace._tasks_added(self, tasks)
 
     def remove_task(self, task_description: str):
-        if task_description not in self.tasks:
+        if task_description not in self._tasks:
             raise ValueError('No task with provided description')
 
-        del self.tasks[task_description]
+        task = self._tasks[task_description] if self._bound is None else self._tasks.copy_of(task_description)
+        status = task.status
+        self._status_counts[status] -= 1
+        if self._buckets is not None:
+            self._discard_sorted(task_description, status, task.priority)
+        if self._content_hash is not None:
+            self._content_hash = (self._content_hash - task_digest(task_description, task.priority, status)) & HASH_MASK
+        if self._encoding_key is not None:
+            self._discard_encoding([task_description])
+
+        if self._workspace is not None:
+            self._workspace._task_removed(self, task)
+
+        del self._tasks[task_description]
+        if self._bound is None:
+            task._task_list = None
+        else:
+            self._unbind([task_description])
+
+    def remove_tasks(self, task_descriptions):
+        descriptions = list(dict.fromkeys(task_descriptions))
+        for description in descriptions:
+            if description not in self._tasks:
+                raise ValueError('No task with provided description')
+
+        if self._bound is None:
+            tasks = [self._tasks[description] for description in descriptions]
+        else:
+            tasks = list(map(self._tasks.copy_of, descriptions))
+        for status, count in Counter(task.status for task in tasks).items():
+            self._status_counts[status] -= count
+        if self._content_hash is not None:
+            self._content_hash = (self._content_hash - tasks_digest(tasks)) & HASH_MASK
+        if self._encoding_key is not None:
+            self._discard_encoding(descriptions)
+
+        if self._buckets is not None and isinstance(self._tasks, TaskStore):
+            removed = {self._tasks.row_of(description) for description in descriptions}
+            for key in {(task.status.rank, task.priority.rank) for task in tasks}:
+                self._buckets[key] = array('i', [row for row in self._buckets[key] if row not in removed])
+        elif self._buckets is not None:
+            removed = set(descriptions)
+            for key in {(task.status.rank, task.priority.rank) for task in tasks}:
+                self._buckets[key] = [item for item in self._buckets[key] if item[1] not in removed]
+            for description in descriptions:
+                del self._sequences[description]
+
+        if self._workspace is not None and tasks:
+            self._workspace._tasks_removed(self, tasks)
+
+        for description in descriptions:
+            del self._tasks[description]
+
+        if self._bound is None:
+            for task in tasks:
+                task._task_list = None
+        else:
+            self._unbind(descriptions)
 
     def find_task_by_description(self, task_description: str) -> Task:
-        if task_description in self.tasks:
-            return self.tasks[task_description]
+        if task_description in self._tasks:
+            return self._tasks[task_description]
 
         raise ValueError('No task with provided description')
 
+    def query(self, status=None, priority=None) -> TaskQuery:
+        return TaskQuery(self, status, priority)
+
     def sort_tasks_by_status(self):
-        self.tasks = {k: v for k, v in sorted(self.tasks.items(), key=lambda task: task[1].status)}
+        self._sort_tasks('status')
 
     def sort_tasks_by_status_then_priority(self):
-        self.tasks = {k: v for k, v in sorted(self.tasks.items(), key=lambda task: (task[1].status, task[1].priority))}
+        self._sort_tasks('status_then_priority')
 
     def sort_tasks_by_priority(self):
-        self.tasks = {k: v for k, v in sorted(self.tasks.items(), key=lambda task: task[1].priority)}
+        self._sort_tasks('priority')
+
+    def _sort_tasks(self, order: str):
+        self._sort_by(SORT_KEYS[order])
+        if self._workspace is not None:
+            self._workspace._task_list_sorted(self, order)
+
+    def _sort_by(self, keys: tuple) -> None:
+        """Stable sort on the given keys, with the current order breaking ties."""
+        if isinstance(self._tasks, TaskStore):
+            self._tasks.sort(keys)
+        else:
+            tasks = sorted(self._tasks.values(), key=attrgetter(*(f'_{key}.rank' for key in keys)))
+            self._tasks = {task._description: task for task in tasks}
+            self._rows_moved()
+
+        if self._encoding_key is not None:
+            self._discard_encoding()
+
+    def _ensure_buckets(self) -> dict:
+        if self._buckets is None and isinstance(self._tasks, TaskStore):
+            self._buckets = self._tasks.row_buckets()
+        elif self._buckets is None:
+            self._buckets = {(status, priority): [] for status in STATUS_RANKS for priority in PRIORITY_RANKS}
+            self._sequences = {}
+            for sequence, task in enumerate(self._tasks.values(), self._next_sequence):
+                self._sequences[task.description] = sequence
+                self._buckets[task.status.rank, task.priority.rank].append((sequence, task.description))
+            self._next_sequence += len(self._sequences)
+
+        return self._buckets
+
+    def _reorder(self, descriptions) -> None:
+        if isinstance(self._tasks, TaskStore):
+            self._tasks.reorder(descriptions)
+        else:
+            self._tasks = {description: self._tasks[description] for description in descriptions}
+            self._rows_moved()
+
+        if self._encoding_key is not None:
+            self._discard_encoding()
+
+    def _rows_moved(self) -> None:
+        self._buckets = None
+        self._sequences = None
+
+    def _bucket_descriptions(self, entries):
+        if isinstance(self._tasks, TaskStore):
+            return map(self._tasks._description_at, entries)
+
+        return (description for _, description in entries)
+
+    def _insert_sorted(self, description: str, status: TaskStatus, priority: TaskPriority, sequence: int = None):
+        if isinstance(self._tasks, TaskStore):
+            insort(self._buckets[status.rank, priority.rank], self._tasks.row_of(description) if sequence is None else sequence)
+            return
+
+        if sequence is None:
+            sequence = self._next_sequence
+            self._next_sequence += 1
+
+        self._sequences[description] = sequence
+        insort(self._buckets[status.rank, priority.rank], (sequence, description))
+
+    def _discard_sorted(self, description: str, status: TaskStatus, priority: TaskPriority) -> int:
+        bucket = self._buckets[status.rank, priority.rank]
+        if isinstance(self._tasks, TaskStore):
+            row = self._tasks.row_of(description)
+            del bucket[bisect_left(bucket, row)]
+            return row
+
+        sequence = self._sequences.pop(description)
+        del bucket[bisect_left(bucket, (sequence, description))]
+        return sequence
+
+    def _update_task(self, task: Task, status: TaskStatus = None, priority: TaskPriority = None):
+        if task._task_list is not self:
+            if status is not None:
+                task.status = status
+            if priority is not None:
+                task.priority = priority
+            return
+
+        old_status = task._status
+        old_priority = task._priority
+        if self._bound is None:
+            targets = (task,)
+        else:
+            targets = (self._tasks[task.description], self._bound.get(task.description))
+
+        for target in targets:
+            if target is None:
+                continue
+            if status is not None:
+                target._status = status
+            if priority is not None:
+                target._priority = priority
+
+        self._task_changed(task, old_status, old_priority)
+
+    def _task_changed(self, task: Task, old_status: TaskStatus, old_priority: TaskPriority):
+        status = task.status
+        self._status_counts[old_status] -= 1
+        self._status_counts[status] += 1
+        if self._content_hash is not None:
+            self._content_hash = (
+                self._content_hash
+                - task_digest(task.description, old_priority, old_status)
+                + task_digest(task.description, task.priority, status)
+            ) & HASH_MASK
+        if self._encoding_key is not None:
+            self._discard_encoding([task.description])
+        if self._buckets is not None:
+            sequence = self._discard_sorted(task.description, old_status, old_priority)
+            self._insert_sorted(task.description, status, task.priority, sequence)
+
+        if self._workspace is not None:
+            self._workspace._task_changed(self, task, old_status, old_priority)
+
+    def _rename_task(self, task: Task, description: str):
+        if task._task_list is not self:
+            task.description = description
+            return
+
+        old_description = task.description
+        if description == old_description:
+            return
+
+        if description in self._tasks:
+            raise ValueError('There is already task with this description')
+
+        if self._buckets is not None:
+            row = self._discard_sorted(old_description, task.status, task.priority)
+            self._insert_sorted(description, task.status, task.priority, row if self.compact else None)
+
+        if not self.compact:
+            self._tasks[description] = self._tasks.pop(old_description)
+        if self._content_hash is not None:
+            self._content_hash = (
+                self._content_hash
+                - task_digest(old_description, task.priority, task.status)
+                + task_digest(description, task.priority, task.status)
+            ) & HASH_MASK
+        if self._encoding_key is not None:
+            self._discard_encoding([old_description])
+
+        if self._workspace is not None:
+            self._workspace._task_renamed(self, old_description, description)
+
+        if self._bound is None:
+            task._description = description
+            return
+
+        self._tasks[old_description]._description = description
+        bound = self._bound.pop(old_description, None)
+        if bound is not None:
+            bound._description = description
+            self._bound[description] = bound
+
+    def _bind(self, tasks) -> None:
+        for task in tasks:
+            task._task_list = self
+        self._bound.update((task.description, task) for task in tasks)
+
+    def _unbind(self, descriptions) -> None:
+        for description in descriptions:
+            task = self._bound.pop(description, None)
+            if task is not None:
+                task._task_list = None
 
     def __str__(self) -> str:
-        formatted_tasks = []
-        for index, task in enumerate(self.tasks.values()):
-            prefix = '├' if index != len(self.tasks) - 1 else '└'
-            formatted_tasks.append(f'\t {prefix} {task}')
+        stream = io.StringIO()
+        self.render(stream)
+        return stream.getvalue()
 
-        return f'{self.name} {self.progress}\n' + '\n'.join(formatted_tasks)
+    def lines(self, offset: int = 0, limit: int = None):
+        return islice(self._lines(offset), limit)
 
-    def to_json(self) -> str:
-        data = {
+    def render(self, stream, *, limit: int = None, offset: int = 0) -> None:
+        write_lines(stream, self.lines(offset, limit))
+
+    def _lines(self, skip: int = 0):
+        if skip == 0:
+            yield f'{self.name} {self.progress}'
+        else:
+            skip -= 1
+
+        last = len(self._tasks) - 1
+        if last < 0:
+            if skip == 0:
+                yield ''
+            return
+
+        for index, task in enumerate(islice(self.tasks.values(), skip, None), skip):
+            yield f'\t {"└" if index == last else "├"} {task}'
+
+    def to_dict(self) -> dict:
+        return {
             "name": self.name,
             "tasks": [
-                task.to_json() for task in self.tasks.values()
+                task.to_dict() for task in self.tasks.values()
             ],
         }
 
+    def to_json(self) -> str:
+        data = {
+            "name": self.name,
+            "tasks": self._encoded_tasks(*self._columns()),
+        }
+
         return json.dumps(data, ensure_ascii=False)
 
+    def _encoded(self) -> str:
+        if self._encoding_key is None:
+            self._encoding_key = next_key()
+
+        text = ENCODING_CACHE.get(self._encoding_key)
+        if text is None:
+            text = f'{{"name": {encode(self._name)}, "tasks": [{", ".join(self._encoded_tasks(*self._columns()))}]}}'
+            ENCODING_CACHE.put(self._encoding_key, text)
+
+        return text
+
+    def _encoded_tasks(self, descriptions: list, priorities: list, statuses: list) -> list[str]:
+        if not ENCODING_CACHE.max_bytes:
+            return list(map(encode_task, descriptions, priorities, statuses))
+
+        if self._encoding_key is None:
+            self._encoding_key = next_key()
+
+        keys = [(self._encoding_key, description) for description in descriptions]
+        texts = ENCODING_CACHE.get_many(keys)
+        encoded = []
+        for index, text in enumerate(texts):
+            if text is None:
+                texts[index] = encode_task(descriptions[index], priorities[index], statuses[index])
+                encoded.append((keys[index], texts[index]))
+
+        ENCODING_CACHE.put_many(encoded)
+        return texts
+
+    def _columns(self) -> tuple[list, list, list]:
+        if isinstance(self._tasks, TaskStore):
+            return self._tasks.columns()
+
+        tasks = list(self._tasks.values())
+        return list(map(_get_description, tasks)), list(map(_get_priority, tasks)), list(map(_get_status, tasks))
+
+    def _discard_encoding(self, descriptions=()) -> None:
+        key = self._encoding_key
+        ENCODING_CACHE.discard_many([key, *((key, description) for description in descriptions)])
+
+    @classmethod
+    def from_dict(cls, data: dict, compact: bool = False) -> "TaskList":
+        task_list = cls(
+            data["name"],
+            compact,
+        )
+
+        task_list._add_tasks(Task.from_dicts(data["tasks"]), bind=False)
+
+        return task_list
+
     @classmethod
-    def from_json(cls, json_str) -> "TaskList":
+    def from_json(cls, json_str, compact: bool = False) -> "TaskList":
         data = json.loads(json_str)
 
         task_list = cls(
             data["name"],
+            compact,
         )
 
-        for task in data["tasks"]:
-            task_list.add_task(
-                Task.from_json(task)
-            )
+        task_list._add_tasks(Task.from_dicts(json.loads(task) for task in data["tasks"]), bind=False)
 
         return task_list
\ No newline at end of file
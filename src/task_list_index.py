@@ -0,0 +1,152 @@
+from collections.abc import MutableMapping
+
+from src.concurrency import TASK_LIST_LOCKED, make_concurrent
+from src.content_hash import tasks_digest
+from src.task import Task
+from src.task_list import SORT_KEYS, TaskList
+from src.utils.task_status import TaskStatus
+
+
+def release_after(count: int, close):
+    """Release callback for count unloaded lists that share one open source; the last call closes it."""
+    if not count:
+        close()
+        return None
+
+    remaining = iter(range(count - 1, -1, -1))
+
+    def release():
+        if next(remaining) == 0:
+            close()
+
+    return release
+
+
+class UnloadedTaskList:
+    """Placeholder for a TaskList whose tasks have not been built yet.
+
+    A placeholder given read_sorted can be sorted without loading: sorts
+    compose into one tuple of sort keys, which read_sorted orders by and
+    load() applies.
+    """
+
+    def __init__(self, name: str, status_counts: dict[TaskStatus, int], load, read, close=None, read_sorted=None, compact: bool = False):
+        self.name = name
+        self.status_counts = status_counts
+        self.compact = compact
+        self._load = load
+        self._read = read
+        self._close = close
+        self._read_sorted = read_sorted
+        self._sort_keys = ()
+        self._content_hash = None
+
+    @property
+    def content_hash(self) -> int:
+        if self._content_hash is None:
+            self._content_hash = tasks_digest(Task.from_dicts(self.to_dict()["tasks"]))
+
+        return self._content_hash
+
+    @property
+    def sortable(self) -> bool:
+        return self._read_sorted is not None
+
+    def sort(self, order: str) -> None:
+        if self._read_sorted is None:
+            raise ValueError('Task list must be loaded to be sorted')
+
+        keys = SORT_KEYS[order]
+        self._sort_keys = keys + tuple(key for key in self._sort_keys if key not in keys)
+
+    def load(self) -> TaskList:
+        task_list = self._load()
+        if self._sort_keys:
+            task_list._sort_by(self._sort_keys)
+
+        return task_list
+
+    def to_dict(self) -> dict:
+        if self._sort_keys:
+            return self._read_sorted(self._sort_keys)
+
+        return self._read()
+
+    def close(self) -> None:
+        """Release what the placeholder keeps open once it has been loaded or removed."""
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+
+class TaskListIndex(MutableMapping):
+    """Workspace.task_lists mapping that builds unloaded lists on first access."""
+
+    def __init__(self, workspace):
+        self._workspace = workspace
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __contains__(self, name) -> bool:
+        return name in self._entries
+
+    def __getitem__(self, name: str) -> TaskList:
+        entry = self._entries[name]
+        if isinstance(entry, UnloadedTaskList):
+            entry = self._materialize(name, entry)
+
+        return entry
+
+    def __setitem__(self, name: str, task_list: TaskList):
+        self._entries[name] = task_list
+
+    def __delitem__(self, name: str):
+        entry = self._entries.pop(name)
+        if isinstance(entry, UnloadedTaskList):
+            entry.close()
+
+    def pop(self, name: str, *default):
+        """Remove name and return its entry; unloaded lists are returned as they are, not loaded."""
+        return self._entries.pop(name, *default)
+
+    def add_unloaded(self, entry: UnloadedTaskList) -> None:
+        self._entries[entry.name] = entry
+
+    def entries(self):
+        return self._entries.values()
+
+    def entry(self, name: str):
+        return self._entries.get(name)
+
+    def is_loaded(self, name: str) -> bool:
+        return not isinstance(self._entries[name], UnloadedTaskList)
+
+    def rename(self, old_name: str, name: str) -> None:
+        self._entries = {(name if key == old_name else key): value for key, value in self._entries.items()}
+
+    def reorder(self, names) -> None:
+        self._entries = {name: self._entries[name] for name in names}
+
+    def _materialize(self, name: str, entry: UnloadedTaskList) -> TaskList:
+        lock = self._workspace._lock
+        if lock is None:
+            return self._load(name, entry)
+
+        with lock:
+            entry = self._entries[name]
+            return entry if isinstance(entry, TaskList) else self._load(name, entry)
+
+    def _load(self, name: str, entry: UnloadedTaskList) -> TaskList:
+        task_list = entry.load()
+        if self._workspace._lock is not None:
+            make_concurrent(task_list, TASK_LIST_LOCKED)
+        task_list._workspace = self._workspace
+        self._entries[name] = task_list
+        self._workspace._task_list_loaded(entry, task_list)
+        entry.close()
+        return task_list
@@ -0,0 +1,78 @@
+from heapq import merge
+
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+
+def _members(value, enum_class: type, label: str) -> tuple:
+    if value is None:
+        return tuple(enum_class)
+
+    members = (value,) if isinstance(value, enum_class) else tuple(value)
+    for member in members:
+        if not isinstance(member, enum_class):
+            raise TypeError(f'{label} must be a {enum_class.__name__} type')
+
+    return tuple(sorted(set(members)))
+
+
+class TaskQuery:
+    """Tasks of a TaskList matching a status and a priority, in insertion order.
+
+    Each filter takes a member, an iterable of members or None for any.
+    Results are read from the (status, priority) buckets of the task list
+    when iteration starts, so tasks can be changed while iterating.
+    """
+
+    def __init__(self, task_list, status=None, priority=None):
+        self._task_list = task_list
+        self.statuses = _members(status, TaskStatus, 'Status')
+        self.priorities = _members(priority, TaskPriority, 'Priority')
+
+    def __len__(self) -> int:
+        task_list = self._task_list
+        if len(self.priorities) == len(TaskPriority):
+            return sum(task_list._status_counts[status] for status in self.statuses)
+
+        buckets = task_list._ensure_buckets()
+        return sum(len(buckets[key]) for key in self._keys())
+
+    def __iter__(self):
+        task_list = self._task_list
+        buckets = task_list._ensure_buckets()
+        descriptions = list(task_list._bucket_descriptions(merge(*[buckets[key] for key in self._keys()])))
+        for description in descriptions:
+            tasks = task_list._tasks
+            if description in tasks:
+                yield tasks[description]
+
+    def _keys(self):
+        return [(status.rank, priority.rank) for status in self.statuses for priority in self.priorities]
+
+
+class WorkspaceQuery:
+    """(task list name, task) pairs matching a TaskQuery in every task list of a workspace."""
+
+    def __init__(self, workspace, status=None, priority=None):
+        self._workspace = workspace
+        self.statuses = _members(status, TaskStatus, 'Status')
+        self.priorities = _members(priority, TaskPriority, 'Priority')
+
+    def __len__(self) -> int:
+        count = 0
+        for entry in list(self._workspace.task_lists.entries()):
+            if len(self.priorities) == len(TaskPriority):
+                count += sum(entry.status_counts[status] for status in self.statuses)
+            else:
+                count += len(self._workspace.task_lists[entry.name].query(self.statuses, self.priorities))
+
+        return count
+
+    def __iter__(self):
+        for name in list(self._workspace.task_lists):
+            task_list = self._workspace.task_lists.get(name)
+            if task_list is None:
+                continue
+
+            for task in task_list.query(self.statuses, self.priorities):
+                yield task_list.name, task
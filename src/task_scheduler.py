@@ -0,0 +1,161 @@
+from contextlib import contextmanager, nullcontext
+from heapq import heapify, heappop, heappush
+from itertools import count
+
+from src.task import Task
+from src.utils.task_status import TaskStatus
+
+
+class TaskScheduler:
+    """Work queue over the tasks of a workspace that are not done.
+
+    Tasks come out by status rank, then priority rank, then insertion order.
+    Changes push a fresh heap entry and invalidate the old one, and stale
+    entries are dropped when popped or when they outnumber the live ones.
+    Popped tasks stay claimed until released. In a concurrent workspace
+    peek, pop_next and release take the lock of the list they resolve a
+    task in before the workspace lock, the same order writers take them,
+    so the list cannot change while the task is looked up.
+    """
+
+    def __init__(self, workspace):
+        self._lock = None
+        self._heap = []
+        self._entries = {}
+        self._sequences = {}
+        self._claimed = set()
+        self._next_sequence = 0
+        self._stale = 0
+        self._pushes = count()
+        for task_list in workspace.task_lists.values():
+            for task in task_list.tasks.values():
+                entry = self._entry(self._assign_sequence(task_list, task), task)
+                if entry is not None:
+                    self._heap.append(entry)
+
+        heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def claimed(self) -> list[Task]:
+        return [task_list.tasks[description] for task_list, description in self._claimed]
+
+    def peek(self) -> Task | None:
+        return self._next(pop=False)
+
+    def pop_next(self) -> Task | None:
+        return self._next(pop=True)
+
+    def release(self, task: Task) -> None:
+        with self._holding(task._task_list):
+            key = task._task_list, task.description
+            if key not in self._claimed:
+                raise ValueError('Task is not claimed')
+
+            self._claimed.remove(key)
+            self._push(key, task)
+
+    def add_task_list(self, task_list) -> None:
+        for task in task_list.tasks.values():
+            self.add(task_list, task)
+
+    def remove_task_list(self, task_list) -> None:
+        for description in task_list.tasks:
+            self.remove(task_list, description)
+
+    def add(self, task_list, task: Task) -> None:
+        self._push(self._assign_sequence(task_list, task), task)
+
+    def remove(self, task_list, description: str) -> None:
+        key = task_list, description
+        self._invalidate(key)
+        self._claimed.discard(key)
+        del self._sequences[key]
+
+    def update(self, task_list, task: Task) -> None:
+        key = task_list, task.description
+        if key in self._claimed:
+            return
+
+        self._invalidate(key)
+        self._push(key, task)
+
+    def rename(self, task_list, old_description: str, description: str) -> None:
+        old_key, key = (task_list, old_description), (task_list, description)
+        self._sequences[key] = self._sequences.pop(old_key)
+        if old_key in self._claimed:
+            self._claimed.remove(old_key)
+            self._claimed.add(key)
+
+        entry = self._entries.pop(old_key, None)
+        if entry is not None:
+            entry[5] = description
+            self._entries[key] = entry
+
+    def _assign_sequence(self, task_list, task: Task) -> tuple:
+        key = task_list, task.description
+        self._sequences[key] = self._next_sequence
+        self._next_sequence += 1
+        return key
+
+    def _entry(self, key: tuple, task: Task) -> list | None:
+        if task.status is TaskStatus.DONE:
+            return None
+
+        entry = [task.status.rank, task.priority.rank, self._sequences[key], next(self._pushes), key[0], key[1], True]
+        self._entries[key] = entry
+        return entry
+
+    def _push(self, key: tuple, task: Task) -> None:
+        entry = self._entry(key, task)
+        if entry is not None:
+            heappush(self._heap, entry)
+
+    def _invalidate(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        entry[6] = False
+        self._stale += 1
+        if self._stale > len(self._entries):
+            self._heap = [entry for entry in self._heap if entry[6]]
+            heapify(self._heap)
+            self._stale = 0
+
+    def _next(self, pop: bool) -> Task | None:
+        while True:
+            with self._lock or nullcontext():
+                entry = self._top()
+                if entry is None:
+                    return None
+
+            task_list = entry[4]
+            with self._holding(task_list):
+                entry = self._top()
+                if entry is None:
+                    return None
+                if entry[4] is not task_list:
+                    continue
+
+                if pop:
+                    heappop(self._heap)
+                    key = entry[4], entry[5]
+                    del self._entries[key]
+                    self._claimed.add(key)
+
+                return task_list.tasks[entry[5]]
+
+    @contextmanager
+    def _holding(self, task_list):
+        with getattr(task_list, '_lock', None) or nullcontext(), self._lock or nullcontext():
+            yield
+
+    def _top(self) -> list | None:
+        while self._heap and not self._heap[0][6]:
+            heappop(self._heap)
+            self._stale -= 1
+
+        return self._heap[0] if self._heap else None
@@ -0,0 +1,359 @@
+from array import array
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from itertools import accumulate
+from weakref import WeakValueDictionary
+
+from src.task import Task
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+PRIORITIES = list(TaskPriority)
+STATUSES = list(TaskStatus)
+
+_EMPTY_SLOT = -1
+_DELETED_SLOT = -2
+_REMOVED_ROW = -1
+
+COMPACT_MIN_ROWS = 1024
+COMPACT_MIN_BYTES = 1 << 16
+
+
+class StoredTask(Task):
+    """View over one row of a TaskStore.
+
+    Removing the row detaches the view into a one-row store of its own, so
+    it keeps its values and can be added to another task list.
+    """
+
+    __slots__ = ('_store', '_row', '_detached')
+
+    def __init__(self, store: "TaskStore", row: int):
+        self._store = store
+        self._row = row
+        self._detached = False
+
+    @property
+    def _task_list(self):
+        return self._store.task_list
+
+    @_task_list.setter
+    def _task_list(self, task_list) -> None:
+        if not self._detached:
+            self._detach()
+
+        self._store.task_list = task_list
+
+    @property
+    def _description(self) -> str:
+        return self._store._description_at(self._row)
+
+    @_description.setter
+    def _description(self, description: str) -> None:
+        self._store._rename_row(self._row, description)
+
+    @property
+    def _priority(self) -> TaskPriority:
+        return PRIORITIES[self._store._priorities[self._row]]
+
+    @_priority.setter
+    def _priority(self, priority: TaskPriority) -> None:
+        self._store._priorities[self._row] = priority.rank
+
+    @property
+    def _status(self) -> TaskStatus:
+        return STATUSES[self._store._statuses[self._row]]
+
+    @_status.setter
+    def _status(self, status: TaskStatus) -> None:
+        self._store._statuses[self._row] = status.rank
+
+    def _detach(self) -> None:
+        if self._store._views.get(self._row) is self:
+            del self._store._views[self._row]
+
+        task = Task._trusted(self._description, self._priority, self._status)
+        self._store = TaskStore([(task.description, task)])
+        self._row = 0
+        self._store._views[0] = self
+        self._detached = True
+
+
+class TaskStore(MutableMapping):
+    """Columnar description -> Task mapping.
+
+    Priorities and statuses are kept as small-int columns, descriptions as
+    UTF-8 in one shared buffer and the description lookup as an
+    open-addressing table of row numbers. Tasks handed out are lightweight
+    views over a row, so writes through them land in the columns. Each row
+    has at most one view, which is detached when the row is removed and
+    renumbered when rows move. Removed rows and replaced description bytes
+    are reclaimed once they outweigh the live ones.
+    """
+
+    def __init__(self, items=(), task_list=None):
+        self.task_list = task_list
+        self._priorities = array('b')
+        self._statuses = array('b')
+        self._offsets = array('Q')
+        self._lengths = array('L')
+        self._buffer = bytearray()
+        self._slots = array('i', [_EMPTY_SLOT]) * 8
+        self._size = 0
+        self._filled_slots = 0
+        self._dead_bytes = 0
+        self._views = WeakValueDictionary()
+
+        self.update(items)
+
+    @property
+    def nbytes(self) -> int:
+        columns = (self._priorities, self._statuses, self._offsets, self._lengths, self._slots)
+        return len(self._buffer) + sum(column.itemsize * len(column) for column in columns)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, description) -> bool:
+        return isinstance(description, str) and self._lookup(description)[1] != _EMPTY_SLOT
+
+    def __iter__(self):
+        for row, status in enumerate(self._statuses):
+            if status != _REMOVED_ROW:
+                yield self._description_at(row)
+
+    def __getitem__(self, description: str) -> StoredTask:
+        row = self._lookup(description)[1] if isinstance(description, str) else _EMPTY_SLOT
+        if row == _EMPTY_SLOT:
+            raise KeyError(description)
+
+        return self._view(row)
+
+    def copy_of(self, description: str) -> Task:
+        """Plain Task holding the values of a row, without handing out a view."""
+        row = self.row_of(description)
+        if row == _EMPTY_SLOT:
+            raise KeyError(description)
+
+        return Task._trusted(description, PRIORITIES[self._priorities[row]], STATUSES[self._statuses[row]])
+
+    def values(self) -> ValuesView:
+        return _StoreValues(self)
+
+    def items(self) -> ItemsView:
+        return _StoreItems(self)
+
+    def __setitem__(self, description: str, task: Task):
+        if description != task.description:
+            raise ValueError('Key must match task description')
+
+        slot, row = self._lookup(description)
+        if row != _EMPTY_SLOT:
+            self._priorities[row] = task.priority.rank
+            self._statuses[row] = task.status.rank
+            return
+
+        row = len(self._statuses)
+        self._priorities.append(task.priority.rank)
+        self._statuses.append(task.status.rank)
+        self._offsets.append(0)
+        self._lengths.append(0)
+        self._write_description(row, description)
+        self._size += 1
+        self._claim_slot(slot, row)
+
+    def __delitem__(self, description: str):
+        slot, row = self._lookup(description) if isinstance(description, str) else (0, _EMPTY_SLOT)
+        if row == _EMPTY_SLOT:
+            raise KeyError(description)
+
+        view = self._views.get(row)
+        if view is not None:
+            view._detach()
+
+        self._slots[slot] = _DELETED_SLOT
+        self._statuses[row] = _REMOVED_ROW
+        self._dead_bytes += self._lengths[row]
+        self._lengths[row] = 0
+        self._size -= 1
+        self._compact_if_sparse()
+
+    def columns(self) -> tuple[list, list, list]:
+        """Descriptions, priorities and statuses of the live rows, without handing out views."""
+        rows = list(self._live_rows())
+        return (
+            list(map(self._description_at, rows)),
+            [PRIORITIES[self._priorities[row]] for row in rows],
+            [STATUSES[self._statuses[row]] for row in rows],
+        )
+
+    @property
+    def row_count(self) -> int:
+        return len(self._statuses)
+
+    def row_of(self, description: str) -> int:
+        return self._lookup(description)[1]
+
+    def row_buckets(self) -> dict:
+        """Live rows in ascending order per (status rank, priority rank)."""
+        buckets = {(status, priority): array('i') for status in range(len(STATUSES)) for priority in range(len(PRIORITIES))}
+        for row, (status, priority) in enumerate(zip(self._statuses, self._priorities)):
+            if status != _REMOVED_ROW:
+                buckets[status, priority].append(row)
+
+        return buckets
+
+    def compact(self) -> None:
+        """Drop removed rows and unused description bytes, renumbering the views handed out."""
+        rows = list(self._live_rows())
+        lengths = array('L', map(self._lengths.__getitem__, rows))
+        buffer = memoryview(self._buffer)
+        self._buffer = bytearray().join([buffer[offset:offset + length] for offset, length in zip(map(self._offsets.__getitem__, rows), lengths)])
+        self._dead_bytes = 0
+        offsets = array('Q', accumulate(lengths, initial=0))
+        offsets.pop()
+        self._rebuild(rows, offsets)
+        self._resize_slots()
+
+    def reorder(self, descriptions) -> None:
+        """Move the rows into the order of descriptions, which must name every task once."""
+        rows = [self.row_of(description) for description in descriptions]
+        if len(rows) != self._size or len(set(rows)) != self._size or _EMPTY_SLOT in rows:
+            raise ValueError('Order must name every task once')
+
+        self._rebuild(rows)
+
+    def sort(self, keys: tuple) -> None:
+        """Stable sort of the rows on the 'status' and 'priority' columns named by keys."""
+        columns = [self._statuses if key == 'status' else self._priorities for key in keys]
+        if len(columns) == 1:
+            key = columns[0].__getitem__
+        else:
+            first, second = columns
+            key = lambda row: (first[row], second[row])
+
+        self._rebuild(sorted(self._live_rows(), key=key))
+
+    def _rebuild(self, rows: list, offsets: array = None) -> None:
+        # The last two entries map _DELETED_SLOT and _EMPTY_SLOT to themselves.
+        new_rows = [_EMPTY_SLOT] * (len(self._statuses) + 2)
+        for new_row, row in enumerate(rows):
+            new_rows[row] = new_row
+        new_rows[_DELETED_SLOT] = _DELETED_SLOT
+        self._slots = array('i', map(new_rows.__getitem__, self._slots))
+
+        self._offsets = array('Q', map(self._offsets.__getitem__, rows)) if offsets is None else offsets
+        self._lengths = array('L', map(self._lengths.__getitem__, rows))
+        self._priorities = array('b', map(self._priorities.__getitem__, rows))
+        self._statuses = array('b', map(self._statuses.__getitem__, rows))
+
+        views = list(self._views.items())
+        self._views = WeakValueDictionary()
+        for row, view in views:
+            view._row = new_rows[row]
+            self._views[view._row] = view
+
+        if self.task_list is not None:
+            self.task_list._rows_moved()
+
+    def _compact_if_sparse(self) -> None:
+        removed_rows = len(self._statuses) - self._size
+        if removed_rows > max(self._size, COMPACT_MIN_ROWS) or self._dead_bytes > max(len(self._buffer) - self._dead_bytes, COMPACT_MIN_BYTES):
+            self.compact()
+
+    def _live_rows(self):
+        return (row for row, status in enumerate(self._statuses) if status != _REMOVED_ROW)
+
+    def _view(self, row: int) -> StoredTask:
+        view = self._views.get(row)
+        if view is None:
+            view = self._views[row] = StoredTask(self, row)
+
+        return view
+
+    def _description_at(self, row: int) -> str:
+        offset = self._offsets[row]
+        return self._buffer[offset:offset + self._lengths[row]].decode()
+
+    def _write_description(self, row: int, description: str) -> None:
+        encoded = description.encode()
+        self._offsets[row] = len(self._buffer)
+        self._lengths[row] = len(encoded)
+        self._buffer += encoded
+
+    def _rename_row(self, row: int, description: str) -> None:
+        old_slot, _ = self._lookup(self._description_at(row))
+        _, existing_row = self._lookup(description)
+        if existing_row == row:
+            return
+
+        if existing_row != _EMPTY_SLOT:
+            raise ValueError('There is already task with this description')
+
+        self._slots[old_slot] = _DELETED_SLOT
+        self._dead_bytes += self._lengths[row]
+        self._write_description(row, description)
+        self._claim_slot(self._lookup(description)[0], row)
+        self._compact_if_sparse()
+
+    def _lookup(self, description: str) -> tuple[int, int]:
+        encoded = description.encode()
+        slots = self._slots
+        mask = len(slots) - 1
+        index = hash(description) & mask
+        free_slot = None
+
+        while True:
+            row = slots[index]
+            if row == _EMPTY_SLOT:
+                return (index if free_slot is None else free_slot), _EMPTY_SLOT
+
+            if row == _DELETED_SLOT:
+                if free_slot is None:
+                    free_slot = index
+            elif self._lengths[row] == len(encoded):
+                offset = self._offsets[row]
+                if self._buffer[offset:offset + len(encoded)] == encoded:
+                    return index, row
+
+            index = (index + 1) & mask
+
+    def _claim_slot(self, slot: int, row: int) -> None:
+        if self._slots[slot] == _EMPTY_SLOT:
+            self._filled_slots += 1
+
+        self._slots[slot] = row
+
+        if self._filled_slots * 3 >= len(self._slots) * 2:
+            self._resize_slots()
+
+    def _resize_slots(self) -> None:
+        capacity = 8
+        while capacity * 2 <= self._size * 3:
+            capacity *= 2
+
+        self._slots = array('i', [_EMPTY_SLOT]) * (capacity * 2)
+        self._filled_slots = 0
+        mask = len(self._slots) - 1
+        for row, status in enumerate(self._statuses):
+            if status == _REMOVED_ROW:
+                continue
+
+            index = hash(self._description_at(row)) & mask
+            while self._slots[index] != _EMPTY_SLOT:
+                index = (index + 1) & mask
+
+            self._slots[index] = row
+            self._filled_slots += 1
+
+
+class _StoreValues(ValuesView):
+    def __iter__(self):
+        store = self._mapping
+        return map(store._view, store._live_rows())
+
+
+class _StoreItems(ItemsView):
+    def __iter__(self):
+        store = self._mapping
+        for row in store._live_rows():
+            yield store._description_at(row), store._view(row)
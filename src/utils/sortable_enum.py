@@ -2,18 +2,35 @@ from enum import Enum
 
 
 class SortableEnum(Enum): # pragma: no cover
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for rank, member in enumerate(cls):
+            member.rank = rank
+
     def __eq__(self, other):
-        if isinstance(other, SortableEnum):
-            return (
-                    self._member_names_.index(self.name) ==
-                    self._member_names_.index(other.name)
-            )
+        if self.__class__ is other.__class__:
+            return self.rank == other.rank
+        return NotImplemented
+
+    def __lt__(self, other):
+        if self.__class__ is other.__class__:
+            return self.rank < other.rank
+        return NotImplemented
+
+    def __le__(self, other):
+        if self.__class__ is other.__class__:
+            return self.rank <= other.rank
         return NotImplemented
 
     def __gt__(self, other):
-        if isinstance(other, SortableEnum):
-            return (
-                    self._member_names_.index(self.name) >
-                    self._member_names_.index(other.name)
-            )
-        return NotImplemented
\ No newline at end of file
+        if self.__class__ is other.__class__:
+            return self.rank > other.rank
+        return NotImplemented
+
+    def __ge__(self, other):
+        if self.__class__ is other.__class__:
+            return self.rank >= other.rank
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.rank)
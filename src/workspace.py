@@ -1,13 +1,51 @@
+import asyncio
+import functools
+import io
 import json
+import os
 import pathlib
+import weakref
+from collections import Counter
+from contextlib import ExitStack, contextmanager, nullcontext
+from itertools import islice
 
-from src.task_list import TaskList
+from src.binary_snapshot import BinarySnapshot, write_binary_snapshot
+from src.concurrency import TASK_LIST_LOCKED, WORKSPACE_LOCKED, make_concurrent
+from src.encoding_cache import ENCODING_CACHE
+from src.file_lock import FileLock, SaveConflictError
+from src.history import WorkspaceHistory, WorkspaceMirror, WorkspaceSnapshot
+from src.instrumentation import Instrumentation, acquire_wrappers, release_wrappers
+from src.journal import WorkspaceJournal
+from src.search_index import SearchIndex
+from src.segments import SegmentDirectory
+from src.serialization import FORMAT_VERSION, SaveFile, SaveIndexReader, WorkspaceReader, encode_workspace, read_generation, task_list_counts, task_list_payload, write_payloads, write_temporary, write_workspace
+from src.sqlite_backend import SqliteBackend
+from src.sync import apply_changes, diff_workspaces, merge_workspaces, workspace_digest
+from src.task import Task
+from src.task_list import TaskList, write_lines
+from src.task_list_index import TaskListIndex, UnloadedTaskList, release_after
+from src.task_query import WorkspaceQuery
+from src.task_scheduler import TaskScheduler
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
 
 
 class Workspace:
     def __init__(self, name: str):
+        self._lock = None
         self.name = name
-        self.task_lists = {}
+        self.task_lists = TaskListIndex(self)
+        self._status_counts = {status: 0 for status in TaskStatus}
+        self._journal = None
+        self._changes = None
+        self._generation = 0
+        self._segments = None
+        self._search_index = None
+        self._scheduler = None
+        self._history = None
+        self._autosaver = None
+        self._instrumentation = None
+        self._release_wrappers = None
 
     @property
     def name(self) -> str:
@@ -23,14 +61,215 @@ class Workspace:
 
         self._name = name
 
+    @property
+    def journal(self) -> WorkspaceJournal | None:
+        return self._journal
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def scheduler(self) -> TaskScheduler:
+        if self._scheduler is None:
+            with self._holding_all_locks():
+                if self._scheduler is None:
+                    scheduler = TaskScheduler(self)
+                    scheduler._lock = self._lock
+                    self._scheduler = scheduler
+
+        return self._scheduler
+
+    @property
+    def history(self) -> WorkspaceHistory:
+        if not isinstance(self._history, WorkspaceHistory):
+            with self._lock or nullcontext():
+                if not isinstance(self._history, WorkspaceHistory):
+                    self._history = WorkspaceHistory(self, mirror=self._history)
+
+        return self._history
+
+    @property
+    def dirty_task_lists(self) -> list[str]:
+        if self._segments is None:
+            return list(self.task_lists)
+
+        dirty = self._segments.dirty
+        return [entry.name for entry in self.task_lists.entries() if entry in dirty]
+
+    @property
+    def progress(self) -> str:
+        return f'{self._status_counts[TaskStatus.DONE]}/{sum(self._status_counts.values())}'
+
+    @property
+    def status_counts(self) -> dict[TaskStatus, int]:
+        return dict(self._status_counts)
+
+    def enable_instrumentation(self, instrumentation: Instrumentation = None) -> Instrumentation:
+        if self._instrumentation is None:
+            self._instrumentation = instrumentation or Instrumentation()
+            acquire_wrappers()
+            self._release_wrappers = weakref.finalize(self, release_wrappers)
+        elif instrumentation is not None and instrumentation is not self._instrumentation:
+            raise ValueError('Workspace is already instrumented')
+
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        if self._instrumentation is not None:
+            self._instrumentation = None
+            self._release_wrappers()
+
+    def snapshot(self) -> WorkspaceSnapshot:
+        if self._history is None:
+            return self.history.snapshot()
+
+        return self._history.snapshot()
+
+    def restore(self, snapshot: WorkspaceSnapshot) -> None:
+        self.history.restore(snapshot)
+
+    def undo(self) -> None:
+        self.history.undo()
+
+    def redo(self) -> None:
+        self.history.redo()
+
+    @property
+    def content_hash(self) -> int:
+        return workspace_digest(self)
+
+    def diff(self, other: "Workspace") -> list:
+        return diff_workspaces(self, other)
+
+    def apply(self, changes, compact: bool = False) -> None:
+        apply_changes(self, changes, compact)
+
+    def merge(self, base: "Workspace", other: "Workspace", prefer: str = 'ours') -> list:
+        return merge_workspaces(self, base, other, prefer)
+
+    @property
+    def concurrent(self) -> bool:
+        return self._lock is not None
+
+    def enable_concurrency(self) -> None:
+        if self._lock is not None:
+            return
+
+        if self._history is None:
+            self._history = WorkspaceMirror(self)
+        for entry in self.task_lists.entries():
+            if isinstance(entry, TaskList):
+                make_concurrent(entry, TASK_LIST_LOCKED)
+        make_concurrent(self, WORKSPACE_LOCKED)
+        if self._scheduler is not None:
+            self._scheduler._lock = self._lock
+
+    @contextmanager
+    def _holding_all_locks(self):
+        if self._lock is None:
+            yield
+            return
+
+        while True:
+            locks = [entry._lock for entry in self.task_lists.entries() if isinstance(entry, TaskList)]
+            with ExitStack() as stack:
+                for lock in locks:
+                    stack.enter_context(lock)
+                stack.enter_context(self._lock)
+                if locks == [entry._lock for entry in self.task_lists.entries() if isinstance(entry, TaskList)]:
+                    yield
+                    return
+
+    def stats(self) -> dict:
+        if self._instrumentation is None:
+            return {}
+
+        return self._instrumentation.snapshot()
+
     def add_task_list(self, task_list: TaskList):
-        self.task_lists[task_list.name] = task_list
+        self.add_task_lists([task_list])
+
+    def add_task_lists(self, task_lists):
+        task_lists = list(task_lists)
+        names = set()
+        for task_list in task_lists:
+            if task_list.name in self.task_lists or task_list.name in names:
+                raise ValueError('There is already task list with this name')
+
+            if task_list._workspace is not None:
+                raise ValueError('Task list already belongs to a workspace')
+
+            names.add(task_list.name)
+
+        for task_list in task_lists:
+            if self._lock is not None:
+                make_concurrent(task_list, TASK_LIST_LOCKED)
+            self.task_lists[task_list.name] = task_list
+            task_list._workspace = self
+            for status, count in task_list._status_counts.items():
+                self._status_counts[status] += count
+
+            if self._recording:
+                self._record('add_list', task_list.to_dict())
+
+            self._mark_dirty(task_list)
+
+            if self._search_index is not None:
+                self._search_index.add_list(task_list.name, task_list.tasks)
+
+            if self._scheduler is not None:
+                self._scheduler.add_task_list(task_list)
+
+            if self._history is not None:
+                self._history.add_task_list(task_list)
 
     def remove_task_list(self, task_list_name: str):
+        removed = False
+        while not removed:
+            entry = self.task_lists.entry(task_list_name)
+            lock = getattr(entry, '_lock', None)
+            if lock is None:
+                removed = self._remove_task_list(task_list_name, entry)
+            else:
+                with lock:
+                    removed = self._remove_task_list(task_list_name, entry)
+
+    def _remove_task_list(self, task_list_name: str, entry) -> bool:
+        if self.task_lists.entry(task_list_name) is not entry:
+            return False
+
         if task_list_name not in self.task_lists:
             raise KeyError('No task list with provided name')
 
-        del self.task_lists[task_list_name]
+        task_list = self.task_lists.pop(task_list_name)
+        if isinstance(task_list, TaskList):
+            task_list._workspace = None
+        for status, count in task_list.status_counts.items():
+            self._status_counts[status] -= count
+
+        if self._recording:
+            self._record('remove_list', task_list_name)
+
+        if self._segments is not None:
+            self._segments.forget(task_list)
+
+        if self._autosaver is not None:
+            self._autosaver.notify()
+
+        if self._search_index is not None:
+            self._search_index.remove_list(task_list_name, _descriptions(task_list))
+
+        if self._scheduler is not None:
+            self._scheduler.remove_task_list(task_list)
+
+        if self._history is not None:
+            self._history.remove_task_list(task_list_name)
+
+        if isinstance(task_list, UnloadedTaskList):
+            task_list.close()
+
+        return True
 
     def find_task_list_by_name(self, name: str) -> TaskList:
         if name in self.task_lists:
@@ -38,59 +277,625 @@ class Workspace:
 
         raise ValueError('No task list with provided name')
 
+    def query(self, status=None, priority=None) -> WorkspaceQuery:
+        return WorkspaceQuery(self, status, priority)
+
+    def search(self, text: str, prefix: bool = True, limit: int = None) -> list[tuple[str, str]]:
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            for entry in self.task_lists.entries():
+                self._search_index.add_list(entry.name, _descriptions(entry))
+
+        return self._search_index.search(text, prefix, limit)
+
+    def _rename_task_list(self, task_list: TaskList, name: str):
+        old_name = task_list.name
+        if name == old_name:
+            return
+
+        if name in self.task_lists:
+            raise ValueError('There is already task list with this name')
+
+        self.task_lists.rename(old_name, name)
+
+        if self._recording:
+            self._record('rename_list', old_name, name)
+
+        self._mark_dirty(task_list)
+
+        if self._search_index is not None:
+            self._search_index.rename_list(old_name, name)
+
+        if self._history is not None:
+            self._history.rename_task_list(old_name, name)
+
+        task_list._name = name
+        if task_list._encoding_key is not None:
+            task_list._discard_encoding()
+
+    def _add_unloaded_task_list(self, entry: UnloadedTaskList):
+        if entry.name in self.task_lists:
+            raise ValueError('There is already task list with this name')
+
+        self.task_lists.add_unloaded(entry)
+        for status, count in entry.status_counts.items():
+            self._status_counts[status] += count
+
+        if self._search_index is not None:
+            self._search_index.add_list(entry.name, _descriptions(entry))
+
+        if self._scheduler is not None:
+            self._scheduler.add_task_list(self.task_lists[entry.name])
+
+        if self._history is not None:
+            self._history.add_task_list(entry)
+
+    @property
+    def _recording(self) -> bool:
+        return self._journal is not None or self._changes is not None
+
+    def _record(self, *entry):
+        if self._journal is not None:
+            self._journal.record(*entry)
+
+        if self._changes is not None:
+            self._changes.append(entry)
+
+    def _mark_dirty(self, task_list: TaskList):
+        if self._segments is not None:
+            self._segments.mark_dirty(task_list)
+
+        if self._autosaver is not None:
+            self._autosaver.notify()
+
+    def _task_list_loaded(self, entry: UnloadedTaskList, task_list: TaskList):
+        if self._segments is not None:
+            self._segments.replace(entry, task_list)
+
+    def _task_added(self, task_list: TaskList, task: Task):
+        self._status_counts[task.status] += 1
+
+        if self._recording:
+            self._record('add_task', task_list.name, task.to_dict())
+
+        self._mark_dirty(task_list)
+
+        if self._search_index is not None:
+            self._search_index.add(task_list.name, task.description)
+
+        if self._scheduler is not None:
+            self._scheduler.add(task_list, task)
+
+        if self._history is not None:
+            self._history.add(task_list.name, [task])
+
+    def _task_removed(self, task_list: TaskList, task: Task):
+        self._status_counts[task.status] -= 1
+
+        if self._recording:
+            self._record('remove_task', task_list.name, task.description)
+
+        self._mark_dirty(task_list)
+
+        if self._search_index is not None:
+            self._search_index.remove(task_list.name, task.description)
+
+        if self._scheduler is not None:
+            self._scheduler.remove(task_list, task.description)
+
+        if self._history is not None:
+            self._history.remove(task_list.name, [task.description])
+
+    def _tasks_added(self, task_list: TaskList, tasks: list[Task]):
+        for status, count in Counter(task.status for task in tasks).items():
+            self._status_counts[status] += count
+
+        if self._recording:
+            self._record('add_tasks', task_list.name, [task.to_dict() for task in tasks])
+
+        self._mark_dirty(task_list)
+
+        if self._search_index is not None:
+            self._search_index.add(task_list.name, *[task.description for task in tasks])
+
+        if self._scheduler is not None:
+            for task in tasks:
+                self._scheduler.add(task_list, task)
+
+        if self._history is not None:
+            self._history.add(task_list.name, tasks)
+
+    def _tasks_removed(self, task_list: TaskList, tasks: list[Task]):
+        for status, count in Counter(task.status for task in tasks).items():
+            self._status_counts[status] -= count
+
+        if self._recording:
+            self._record('remove_tasks', task_list.name, [task.description for task in tasks])
+
+        self._mark_dirty(task_list)
+
+        if self._search_index is not None:
+            self._search_index.remove(task_list.name, *[task.description for task in tasks])
+
+        if self._scheduler is not None:
+            for task in tasks:
+                self._scheduler.remove(task_list, task.description)
+
+        if self._history is not None:
+            self._history.remove(task_list.name, [task.description for task in tasks])
+
+    def _task_changed(self, task_list: TaskList, task: Task, old_status: TaskStatus, old_priority: TaskPriority):
+        self._status_counts[old_status] -= 1
+        self._status_counts[task.status] += 1
+
+        if self._recording:
+            if task.status is not old_status:
+                self._record('status', task_list.name, task.description, task.status.name)
+            if task.priority is not old_priority:
+                self._record('priority', task_list.name, task.description, task.priority.name)
+
+        self._mark_dirty(task_list)
+
+        if self._scheduler is not None:
+            self._scheduler.update(task_list, task)
+
+        if self._history is not None:
+            self._history.update(task_list.name, task)
+
+    def _task_renamed(self, task_list: TaskList, old_description: str, description: str):
+        if self._recording:
+            self._record('rename_task', task_list.name, old_description, description)
+
+        self._mark_dirty(task_list)
+
+        if self._search_index is not None:
+            self._search_index.remove(task_list.name, old_description)
+            self._search_index.add(task_list.name, description)
+
+        if self._scheduler is not None:
+            self._scheduler.rename(task_list, old_description, description)
+
+        if self._history is not None:
+            self._history.rename(task_list.name, old_description, description, not task_list.compact)
+
+    def _task_list_sorted(self, task_list: TaskList, order: str):
+        if self._recording:
+            self._record('sort', task_list.name, order)
+
+        self._mark_dirty(task_list)
+
+        if self._history is not None:
+            self._history.reorder(task_list)
+
     def sort_tasks_by_status(self):
-        for task_list in self.task_lists.values():
-            task_list.sort_tasks_by_status()
+        self._sort_task_lists('status')
 
     def sort_tasks_by_status_then_priority(self):
-        for task_list in self.task_lists.values():
-            task_list.sort_tasks_by_status_then_priority()
+        self._sort_task_lists('status_then_priority')
 
     def sort_tasks_by_priority(self):
-        for task_list in self.task_lists.values():
-            task_list.sort_tasks_by_priority()
+        self._sort_task_lists('priority')
+
+    def _sort_task_lists(self, order: str):
+        for name in list(self.task_lists):
+            with self._lock or nullcontext():
+                entry = self.task_lists.entry(name)
+                if entry is None:
+                    continue
+
+                if isinstance(entry, UnloadedTaskList) and entry.sortable:
+                    entry.sort(order)
+                    self._task_list_sorted(entry, order)
+                    continue
+
+            self.task_lists[name]._sort_tasks(order)
 
     def __str__(self):
-        return f'{self.name}\n' + '\n'.join([f' └ {task_list}' for task_list in self.task_lists.values()])
+        stream = io.StringIO()
+        self.render(stream)
+        return stream.getvalue()
+
+    def lines(self, offset: int = 0, limit: int = None, lists=None):
+        return islice(self._lines(offset, lists), limit)
+
+    def render(self, stream, *, limit: int = None, offset: int = 0, lists=None) -> None:
+        write_lines(stream, self.lines(offset, limit, lists))
+
+    def _lines(self, skip: int = 0, lists=None):
+        if skip == 0:
+            yield self.name
+        else:
+            skip -= 1
 
-    def to_json(self):
-        data = {
+        task_lists = self.task_lists.values() if lists is None else (self.task_lists[name] for name in lists)
+        empty = True
+        for task_list in task_lists:
+            empty = False
+            size = 1 + max(len(task_list.tasks), 1)
+            if skip >= size:
+                skip -= size
+                continue
+
+            task_list_lines = task_list._lines(skip)
+            if skip == 0:
+                yield f' └ {next(task_list_lines)}'
+
+            skip = 0
+            yield from task_list_lines
+
+        if empty and skip == 0:
+            yield ''
+
+    def to_dict(self) -> dict:
+        return {
+            "version": FORMAT_VERSION,
             "name": self.name,
             "task_list": [
-                task_list.to_json() for task_list in self.task_lists.values()
+                task_list.to_dict() for task_list in self.task_lists.entries()
             ],
         }
 
-        return json.dumps(data, ensure_ascii=False)
+    def to_json(self, executor=None):
+        if executor is None:
+            if ENCODING_CACHE.max_bytes:
+                return encode_workspace(self)
+
+            return json.dumps(self.to_dict(), ensure_ascii=False)
+
+        stream = io.StringIO()
+        write_workspace(self, stream, executor)
+        return stream.getvalue()
 
     @classmethod
-    def from_json(cls, json_str):
-        data = json.loads(json_str)
+    def from_json(cls, json_str, compact: bool = False):
+        return cls.from_dict(json.loads(json_str), compact)
+
+    @classmethod
+    def from_dict(cls, data: dict, compact: bool = False) -> "Workspace":
+        version = data.get("version", 1)
+        if version > FORMAT_VERSION:
+            raise ValueError(f'Unsupported workspace format version: {version}')
 
         workspace = cls(
             data["name"],
         )
 
-        for task_list in data["task_list"]:
-            workspace.add_task_list(
-                TaskList.from_json(task_list)
-            )
+        load_task_list = TaskList.from_json if version == 1 else TaskList.from_dict
+        workspace.add_task_lists(
+            load_task_list(task_list, compact) for task_list in data["task_list"]
+        )
 
         return workspace
 
-    def save_to_file(self, file_name: str):
-        path = pathlib.Path('saves')
-        path.mkdir(parents=True, exist_ok=True)
+    def save_to_file(self, file_name: str, journaled: bool = False, executor=None, on_conflict: str = None):
+        self._prepare_save(file_name, journaled, executor, on_conflict=on_conflict)()
+
+    async def save_to_file_async(self, file_name: str, journaled: bool = False, executor=None):
+        save = self._prepare_save(file_name, journaled, snapshot=True)
+        await asyncio.get_running_loop().run_in_executor(executor, save)
+
+    def _prepare_save(self, file_name: str, journaled: bool, executor=None, snapshot: bool = False, on_conflict: str = None):
+        if on_conflict not in (None, 'raise', 'merge'):
+            raise ValueError('on_conflict must be None, "raise" or "merge"')
+
+        if on_conflict is not None and journaled:
+            raise ValueError('Journaled saves cannot detect conflicts')
+
+        if on_conflict == 'merge' and self._changes is None:
+            raise ValueError('Merging needs a workspace loaded with shared=True')
+
+        path = _save_path(file_name)
+        journal = self._journal
+        if journal is None or journal.path != WorkspaceJournal.for_snapshot(path).path:
+            journal = WorkspaceJournal.for_snapshot(path)
+        elif journaled:
+            with FileLock(path):
+                journal.flush()
+            if not journal.needs_compaction:
+                return lambda: None
+
+        if snapshot:
+            name = self.name
+            payloads = [task_list_payload(task_list) for task_list in self.task_lists.entries()]
+            counts = task_list_counts(self)
+            write = lambda output_file, generation: write_payloads(name, payloads, output_file, generation=generation, counts=counts)
+        else:
+            write = lambda output_file, generation: write_workspace(self, output_file, executor, generation, task_list_counts(self))
+
+        previous_journal = self._journal
+        recorded = journal.pending_entries
+        changes = None if self._changes is None else len(self._changes)
+        expected = self._generation if on_conflict is not None else read_generation(path)
+        if journaled:
+            self._journal = journal
+        elif self._journal is journal:
+            self._journal = None
+
+        def save():
+            generation = expected + 1
+            temporary_path = None
+            try:
+                temporary_path = write_temporary(path, lambda output_file: write(output_file, generation))
+                with FileLock(path):
+                    found = read_generation(path)
+                    if found != expected:
+                        if on_conflict == 'raise':
+                            raise SaveConflictError(path, expected, found)
+                        if on_conflict == 'merge':
+                            self._merge_saved(path, changes)
+
+                        temporary_path.unlink()
+                        generation = found + 1
+                        temporary_path = write_temporary(path, lambda output_file: write(output_file, generation))
+
+                    os.replace(temporary_path, path)
+            except BaseException:
+                if temporary_path is not None:
+                    temporary_path.unlink(missing_ok=True)
+                self._journal = previous_journal
+                raise
 
-        with open(f'saves/{file_name}', 'w') as output_file:
-            output_file.write(self.to_json())
+            journal.reset(recorded)
+            self._generation = generation
+            if changes is not None:
+                del self._changes[:changes]
+            elif on_conflict is not None:
+                self._changes = []
+
+        return save
+
+    def _merge_saved(self, path: pathlib.Path, changes: int):
+        merged = self._read_file(path)
+        for entry in self._changes[:changes]:
+            WorkspaceJournal.apply(merged, entry)
+
+        recorded, self._changes = self._changes, None
+        try:
+            self._adopt(merged)
+        finally:
+            self._changes = recorded
+
+    def _adopt(self, other: "Workspace"):
+        for name in [name for name in self.task_lists if name not in other.task_lists]:
+            self.remove_task_list(name)
+
+        names = list(other.task_lists)
+        for name in names:
+            task_list = other.task_lists[name]
+            if name in self.task_lists:
+                _adopt_tasks(self.task_lists[name], task_list)
+            else:
+                other.remove_task_list(name)
+                self.add_task_list(task_list)
+
+        if list(self.task_lists) != names:
+            self.task_lists.reorder(names)
 
     @classmethod
-    def load_from_file(cls, file_name: str) -> "Workspace":
-        path = pathlib.Path('saves')
-        path.mkdir(parents=True, exist_ok=True)
+    def load_from_file(cls, file_name: str, compact: bool = False, journaled: bool = False, lazy: bool = False, shared: bool = False) -> "Workspace":
+        path = _save_path(file_name)
+        with FileLock(path, shared=True):
+            workspace = cls._read_file(path, compact, lazy)
+
+        if journaled:
+            workspace._journal = WorkspaceJournal.for_snapshot(path)
+        if shared:
+            workspace._changes = []
+
+        return workspace
+
+    @classmethod
+    def _read_file(cls, path: pathlib.Path, compact: bool = False, lazy: bool = False) -> "Workspace":
+        if lazy:
+            workspace, generation = cls._read_file_lazy(path, compact)
+        else:
+            with open(path, 'r', encoding='utf-8') as input_file:
+                reader = WorkspaceReader(input_file)
+                workspace = cls(reader.name)
+                for task_list in reader.task_lists(compact):
+                    workspace.add_task_list(task_list)
+                generation = reader.generation
+
+        WorkspaceJournal.for_snapshot(path).replay(workspace, compact)
+        workspace._generation = generation
+        return workspace
+
+    @classmethod
+    async def load_from_file_async(cls, file_name: str, compact: bool = False, journaled: bool = False, lazy: bool = False, shared: bool = False, executor=None) -> "Workspace":
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(cls.load_from_file, file_name, compact, journaled, lazy, shared),
+        )
+
+    @classmethod
+    def _read_file_lazy(cls, path: pathlib.Path, compact: bool) -> tuple["Workspace", int]:
+        with open(path, 'r', encoding='latin-1', newline='') as input_file:
+            reader = SaveIndexReader(input_file)
+            spans = None if reader.status_counts is None else list(reader.task_list_spans())
+
+        if spans is None:
+            with open(path, 'r', encoding='utf-8') as input_file:
+                data = json.load(input_file)
+
+            return cls._from_dict_lazy(data, compact), data.get("generation", 0)
+
+        if len(spans) != len(reader.status_counts):
+            raise ValueError('Status counts do not match the task lists of the save')
+
+        workspace = cls(reader.name)
+        save_file = SaveFile(path)
+        release = release_after(len(spans), save_file.close)
+        for (name, start, end), status_counts in zip(spans, reader.status_counts):
+            read = functools.partial(save_file.read, start, end)
+            workspace._add_unloaded_task_list(UnloadedTaskList(
+                name,
+                status_counts,
+                lambda read=read: TaskList.from_dict(read(), compact),
+                read,
+                release,
+                compact=compact,
+            ))
+
+        return workspace, reader.generation
+
+    @classmethod
+    def _from_dict_lazy(cls, data: dict, compact: bool) -> "Workspace":
+        if data.get("version", 1) == 1:
+            return cls.from_dict(data, compact)
+
+        workspace = cls(data["name"])
+        for task_list_data in data["task_list"]:
+            status_counts = {status: 0 for status in TaskStatus}
+            for task in task_list_data["tasks"]:
+                status_counts[TaskStatus[task["status"]]] += 1
+
+            workspace._add_unloaded_task_list(UnloadedTaskList(
+                task_list_data["name"],
+                status_counts,
+                lambda task_list_data=task_list_data: TaskList.from_dict(task_list_data, compact),
+                lambda task_list_data=task_list_data: task_list_data,
+                compact=compact,
+            ))
+
+        return workspace
+
+    def save_to_directory(self, directory_name: str):
+        path = _save_path(directory_name)
+        if self._segments is None or self._segments.path != path:
+            self._segments = SegmentDirectory(path)
+
+        self._segments.save(self)
+
+    @classmethod
+    def load_from_directory(cls, directory_name: str, compact: bool = False, lazy: bool = False) -> "Workspace":
+        segments = SegmentDirectory(_save_path(directory_name))
+        manifest = segments.read_manifest()
+
+        workspace = cls(manifest["name"])
+        for entry in segments.load_task_lists(manifest, compact, lazy):
+            if isinstance(entry, UnloadedTaskList):
+                workspace._add_unloaded_task_list(entry)
+            else:
+                workspace.add_task_list(entry)
+
+        workspace._segments = segments
+        return workspace
+
+    @staticmethod
+    def load_task_list_from_directory(directory_name: str, task_list_name: str, compact: bool = False) -> TaskList:
+        return SegmentDirectory(_save_path(directory_name)).load_task_list(task_list_name, compact)
+
+    def save_to_binary(self, file_name: str):
+        write_binary_snapshot(self, _save_path(file_name))
+
+    @classmethod
+    def load_from_binary(cls, file_name: str, compact: bool = False, lazy: bool = False) -> "Workspace":
+        snapshot = BinarySnapshot(_save_path(file_name))
+        workspace = cls(snapshot.name)
+        if not lazy:
+            with snapshot:
+                for task_list in snapshot.task_lists.values():
+                    workspace.add_task_list(task_list.to_task_list(compact))
+
+            return workspace
+
+        release = release_after(len(snapshot.task_lists), snapshot.close)
+        for task_list in snapshot.task_lists.values():
+            workspace._add_unloaded_task_list(UnloadedTaskList(
+                task_list.name,
+                task_list.status_counts,
+                lambda task_list=task_list: task_list.to_task_list(compact),
+                task_list.to_dict,
+                release,
+                compact=compact,
+            ))
+
+        return workspace
+
+    @staticmethod
+    def open_binary_snapshot(file_name: str) -> BinarySnapshot:
+        return BinarySnapshot(_save_path(file_name))
+
+    def save_to_sqlite(self, file_name: str):
+        with SqliteBackend(_save_path(file_name)) as backend:
+            backend.save_workspace(self)
+
+    @classmethod
+    def load_from_sqlite(cls, file_name: str, workspace_name: str, compact: bool = False, lazy: bool = False) -> "Workspace":
+        backend = SqliteBackend(_save_path(file_name))
+        if not lazy:
+            with backend:
+                workspace = cls(workspace_name)
+                for task_list in backend.iter_task_lists(workspace_name, compact):
+                    workspace.add_task_list(task_list)
+
+                return workspace
+
+        try:
+            counts = backend.task_list_status_counts(workspace_name)
+        except BaseException:
+            backend.close()
+            raise
+
+        workspace = cls(workspace_name)
+        release = release_after(len(counts), backend.close)
+        for name, status_counts in counts.items():
+            read = functools.partial(backend.read_task_list, workspace_name, name)
+            workspace._add_unloaded_task_list(UnloadedTaskList(
+                name,
+                status_counts,
+                functools.partial(backend.load_task_list, workspace_name, name, compact),
+                read,
+                release,
+                read,
+                compact,
+            ))
+
+        return workspace
+
+    @staticmethod
+    def iter_task_lists_from_file(file_name: str, compact: bool = False):
+        with open(_save_path(file_name), 'r', encoding='utf-8') as input_file:
+            yield from WorkspaceReader(input_file).task_lists(compact)
+
+    @staticmethod
+    def iter_tasks_from_file(file_name: str):
+        with open(_save_path(file_name), 'r', encoding='utf-8') as input_file:
+            yield from WorkspaceReader(input_file).tasks()
+
+
+def _descriptions(entry):
+    if isinstance(entry, UnloadedTaskList):
+        return [task["description"] for task in entry.to_dict()["tasks"]]
+
+    return entry.tasks
+
+
+def _adopt_tasks(task_list: TaskList, other: TaskList):
+    tasks = task_list._tasks
+    removed = [description for description in tasks if description not in other._tasks]
+    if removed:
+        task_list.remove_tasks(removed)
+
+    added = []
+    for description, task in other._tasks.items():
+        if description not in tasks:
+            added.append(Task._trusted(description, task.priority, task.status))
+            continue
+
+        existing = tasks[description]
+        if existing.priority is not task.priority:
+            existing.priority = task.priority
+        if existing.status is not task.status:
+            existing.status = task.status
+
+    task_list._add_tasks(added, bind=False)
+    order = list(other._tasks)
+    if list(task_list._tasks) != order:
+        task_list._reorder(order)
+
 
-        with open(f'saves/{file_name}', 'r') as input_file:
-            saved_json = input_file.read()
+def _save_path(file_name: str) -> pathlib.Path:
+    path = pathlib.Path('saves')
+    path.mkdir(parents=True, exist_ok=True)
 
-            return Workspace.from_json(saved_json)
+    return path / file_name
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.autosave import AutoSaver
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestAutoSave(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Async')
+        self.kitchen = TaskList('Kitchen')
+        self.kitchen.add_task(Task('Do dishes'))
+        self.workspace.add_task_list(self.kitchen)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    async def test_save_and_load_async(self):
+        await self.workspace.save_to_file_async('async.json')
+        loaded = await Workspace.load_from_file_async('async.json')
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+
+    async def test_async_save_writes_snapshot_taken_before_await(self):
+        save = asyncio.ensure_future(self.workspace.save_to_file_async('async.json'))
+        await asyncio.sleep(0)
+        self.kitchen.add_task(Task('Cook dinner'))
+        await save
+
+        self.assertEqual(list(Workspace.load_from_file('async.json').task_lists['Kitchen'].tasks), ['Do dishes'])
+
+    async def test_async_journaled_save_keeps_later_entries(self):
+        self.workspace.save_to_file('async.json', journaled=True)
+        self.workspace.journal.compaction_threshold = 1
+        self.kitchen.add_task(Task('Cook dinner'))
+
+        save = asyncio.ensure_future(self.workspace.save_to_file_async('async.json', journaled=True))
+        await asyncio.sleep(0)
+        self.kitchen.add_task(Task('Wipe table'))
+        await save
+        self.assertFalse(os.path.exists('saves/async.json.journal'))
+
+        self.workspace.journal.compaction_threshold = 1 << 20
+        self.workspace.save_to_file('async.json', journaled=True)
+        self.assertEqual(Workspace.load_from_file('async.json').to_json(), self.workspace.to_json())
+
+    async def test_autosave_coalesces_bursts(self):
+        async with AutoSaver(self.workspace, 'auto.json', interval=0.05) as autosaver:
+            for index in range(20):
+                self.kitchen.add_task(Task(f'Task {index}'))
+            self.kitchen.find_task_by_description('Do dishes').status = TaskStatus.DONE
+            self.assertTrue(autosaver.dirty)
+            self.assertFalse(os.path.exists('saves/auto.json'))
+
+            await asyncio.sleep(0.2)
+            self.assertEqual(autosaver.saves, 1)
+            self.assertFalse(autosaver.dirty)
+            self.assertEqual(Workspace.load_from_file('auto.json').progress, '1/21')
+
+    async def test_autosave_flushes_on_close(self):
+        autosaver = AutoSaver(self.workspace, 'auto.json', interval=60)
+        autosaver.start()
+        self.kitchen.remove_task('Do dishes')
+        self.workspace.add_task_list(TaskList('Garage'))
+        await autosaver.close()
+
+        self.assertEqual(autosaver.saves, 1)
+        self.assertIsNone(self.workspace._autosaver)
+        self.assertEqual(Workspace.load_from_file('auto.json').to_json(), self.workspace.to_json())
+
+        self.kitchen.add_task(Task('Cook dinner'))
+        self.assertFalse(autosaver.dirty)
+
+    async def test_autosave_notified_from_other_threads(self):
+        async with AutoSaver(self.workspace, 'auto.json', interval=0.01) as autosaver:
+            await asyncio.get_running_loop().run_in_executor(None, self.kitchen.add_task, Task('Cook dinner'))
+            await asyncio.sleep(0.2)
+            self.assertEqual(autosaver.saves, 1)
+            self.assertEqual(Workspace.load_from_file('auto.json').progress, '0/2')
+
+    async def test_failed_background_save_is_raised_by_close(self):
+        autosaver = AutoSaver(self.workspace, 'auto.json', interval=0.01)
+        autosaver.start()
+        with patch.object(Workspace, 'save_to_file_async', side_effect=OSError('Disk full')):
+            self.kitchen.add_task(Task('Cook dinner'))
+            await asyncio.sleep(0.2)
+            self.assertTrue(autosaver.dirty)
+            self.assertEqual(autosaver.saves, 0)
+
+        with self.assertRaises(OSError):
+            await autosaver.close()
+        self.assertEqual(autosaver.saves, 1)
+        self.assertEqual(Workspace.load_from_file('auto.json').to_json(), self.workspace.to_json())
+
+    async def test_single_autosaver_per_workspace(self):
+        async with AutoSaver(self.workspace, 'auto.json'):
+            with self.assertRaises(ValueError):
+                AutoSaver(self.workspace, 'other.json').start()
+
+    def test_negative_interval(self):
+        with self.assertRaises(ValueError):
+            AutoSaver(self.workspace, 'auto.json', interval=-1)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,79 @@
+import io
+import os
+import unittest
+from contextlib import redirect_stderr
+
+from benchmarks.__main__ import main
+from benchmarks.generator import WorkspaceShape, generate_workspace
+from benchmarks.read_throughput import measure_read_throughput
+from benchmarks.parallel_save import measure_parallel_save
+from benchmarks.save_format import measure_save_format
+from benchmarks.suite import BENCHMARKS, compare, run_benchmarks
+from src.utils.task_status import TaskStatus
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_generator_is_seeded(self):
+        shape = WorkspaceShape(1000, task_lists=7, seed=3)
+        self.assertEqual(generate_workspace(shape).to_json(), generate_workspace(shape).to_json())
+        self.assertNotEqual(generate_workspace(shape).to_json(), generate_workspace(WorkspaceShape(1000, task_lists=7, seed=4)).to_json())
+
+    def test_generator_shape(self):
+        shape = WorkspaceShape(1003, task_lists=10, status_weights={TaskStatus.DONE: 1})
+        workspace = generate_workspace(shape, compact=True)
+
+        self.assertEqual(len(workspace.task_lists), 10)
+        self.assertEqual(shape.list_sizes()[:4], [101, 101, 101, 100])
+        self.assertEqual(workspace.progress, '1003/1003')
+
+    def test_run_every_benchmark(self):
+        report = run_benchmarks([50], task_lists=5, repeat=1)
+        results = report["results"]["50"]
+
+        self.assertEqual(results["shape"]["total_tasks"], 50)
+        for name in BENCHMARKS:
+            self.assertGreaterEqual(results[name]["seconds"], 0)
+            self.assertIn("peak_bytes", results[name])
+
+    def test_compare_reports_regressions(self):
+        baseline = {"results": {"10": {"to_json": {"seconds": 1.0, "peak_bytes": 100}, "str": {"seconds": 1.0}}}}
+        report = {"results": {"10": {"shape": {}, "to_json": {"seconds": 1.1, "peak_bytes": 200}, "str": {"seconds": 2.0}}}}
+
+        self.assertEqual(compare(report, baseline), [
+            {"size": "10", "benchmark": "to_json", "metric": "peak_bytes", "ratio": 2.0},
+            {"size": "10", "benchmark": "str", "metric": "seconds", "ratio": 2.0},
+        ])
+        self.assertEqual(compare(report, baseline, tolerance=1.5), [])
+
+    def test_command_line(self):
+        with redirect_stderr(io.StringIO()) as output:
+            status = main(['--sizes', '20', '--lists', '2', '--only', 'progress', '--repeat', '1', '--no-memory', '--baseline', 'missing.json'])
+
+        self.assertEqual(status, 0)
+        self.assertIn('progress', output.getvalue())
+
+    def test_read_throughput(self):
+        result = measure_read_throughput(WorkspaceShape(200, task_lists=4), readers=2, writers=1, seconds=0.05)
+
+        self.assertGreater(result["reads"], 0)
+        self.assertGreater(result["writes"], 0)
+        self.assertEqual(result["shape"]["total_tasks"], 200)
+
+    def test_save_format(self):
+        result = measure_save_format(WorkspaceShape(300, task_lists=3), repeat=1)
+
+        self.assertLess(result["v2"]["bytes"], result["v1"]["bytes"])
+        self.assertGreater(result["v1"]["from_json_seconds"], 0)
+        self.assertEqual(result["shape"]["total_tasks"], 300)
+
+    def test_parallel_save(self):
+        result = measure_parallel_save(WorkspaceShape(300, task_lists=3), workers=(1, 2), repeat=1)
+
+        self.assertEqual(set(result["processes"]), {'1', '2'})
+        self.assertGreater(result["threads"]["2"]["to_json_seconds"], 0)
+        self.assertEqual(result["cpu_count"], os.cpu_count())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
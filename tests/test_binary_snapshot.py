@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.binary_snapshot import BinarySnapshot
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestBinarySnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Binary ąę')
+        kitchen = TaskList('Kitchen')
+        kitchen.add_task(Task('Do dishes', TaskPriority.LOW, TaskStatus.DONE))
+        kitchen.add_task(Task('Cook dinner ☕', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        self.workspace.add_task_list(kitchen)
+        self.workspace.add_task_list(TaskList('Empty'))
+        garage = TaskList('Garage')
+        garage.add_task(Task('Sweep'))
+        self.workspace.add_task_list(garage)
+        self.workspace.save_to_binary('home.bin')
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        self.assertEqual(Workspace.load_from_binary('home.bin').to_json(), self.workspace.to_json())
+        self.assertEqual(Workspace.load_from_binary('home.bin', compact=True).to_json(), self.workspace.to_json())
+
+    def test_round_trip_through_json(self):
+        Workspace.from_json(self.workspace.to_json()).save_to_binary('copy.bin')
+        self.assertEqual(Workspace.load_from_binary('copy.bin').to_json(), self.workspace.to_json())
+
+    def test_lazy_load(self):
+        loaded = Workspace.load_from_binary('home.bin', lazy=True)
+        self.assertEqual(loaded.progress, '1/3')
+        self.assertFalse(loaded.task_lists.is_loaded('Kitchen'))
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+        self.assertEqual(loaded.find_task_list_by_name('Garage').progress, '0/1')
+
+    def test_lazy_load_closes_snapshot_once_lists_are_loaded(self):
+        with patch.object(BinarySnapshot, 'close', autospec=True, side_effect=BinarySnapshot.close) as close:
+            loaded = Workspace.load_from_binary('home.bin', lazy=True)
+            loaded.find_task_list_by_name('Kitchen')
+            loaded.remove_task_list('Empty')
+            self.assertEqual(close.call_count, 0)
+
+            garage = loaded.find_task_list_by_name('Garage')
+            self.assertEqual(close.call_count, 1)
+            self.assertEqual(list(garage.tasks), ['Sweep'])
+
+            Workspace.load_from_binary('home.bin')
+            self.assertEqual(close.call_count, 2)
+
+    def test_random_access(self):
+        with Workspace.open_binary_snapshot('home.bin') as snapshot:
+            self.assertEqual(snapshot.name, 'Binary ąę')
+            self.assertEqual(snapshot.task_count, 3)
+            self.assertEqual(list(snapshot.task_lists), ['Kitchen', 'Empty', 'Garage'])
+
+            kitchen = snapshot.task_lists['Kitchen']
+            self.assertEqual(len(kitchen), 2)
+            self.assertEqual(kitchen.status_counts[TaskStatus.DONE], 1)
+            task = kitchen[-1]
+            self.assertEqual(str(task), 'Cook dinner ☕ - In progress - High')
+            self.assertEqual([task.description for task in snapshot.task_lists['Garage']], ['Sweep'])
+            with self.assertRaises(IndexError):
+                snapshot.task_lists['Empty'][0]
+
+    def test_not_a_snapshot(self):
+        self.workspace.save_to_file('home.json')
+        with self.assertRaises(ValueError):
+            Workspace.load_from_binary('home.json')
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
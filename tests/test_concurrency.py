@@ -0,0 +1,204 @@
+import random
+import sys
+import threading
+import unittest
+from collections import Counter
+
+from src.history import WorkspaceHistory
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        self.workspace = Workspace('Shared')
+        self.workspace.add_task_lists(TaskList(f'List {index}', compact=index % 2 == 1) for index in range(4))
+        for task_list in self.workspace.task_lists.values():
+            task_list.add_tasks(Task(f'Seed {index}') for index in range(20))
+        self.workspace.search('seed')
+        self.workspace.scheduler
+        self.workspace.enable_concurrency()
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def write(self, worker: int, errors: list):
+        generator = random.Random(worker)
+        try:
+            for step in range(400):
+                name = f'List {generator.randrange(4)}'
+                task_list = self.workspace.task_lists[name]
+                descriptions = [task.description for task in self.workspace.snapshot().tasks(name)]
+                action = generator.random()
+                if action < 0.4 or not descriptions:
+                    task_list.add_task(Task(f'Worker {worker} task {step}'))
+                    continue
+
+                description = generator.choice(descriptions)
+                try:
+                    task = task_list.find_task_by_description(description)
+                    if action < 0.6:
+                        task_list.remove_task(description)
+                    elif action < 0.8:
+                        task.status = generator.choice(list(TaskStatus))
+                    elif action < 0.9:
+                        task.priority = generator.choice(list(TaskPriority))
+                    else:
+                        task.description = f'{description} renamed by {worker}'
+                except ValueError:
+                    pass
+        except Exception as error:  # pragma: no cover
+            errors.append(error)
+
+    def read(self, stop: threading.Event, errors: list, reads: list):
+        try:
+            while not stop.is_set():
+                snapshot = self.workspace.snapshot()
+                for name in snapshot.task_list_names:
+                    descriptions = [task.description for task in snapshot.tasks(name)]
+                    if len(descriptions) != len(set(descriptions)):  # pragma: no cover
+                        errors.append(AssertionError(f'duplicate tasks in {name}'))
+                reads.append(len(snapshot))
+        except Exception as error:  # pragma: no cover
+            errors.append(error)
+
+    def test_concurrent_writers_and_readers(self):
+        errors = []
+        reads = []
+        stop = threading.Event()
+        readers = [threading.Thread(target=self.read, args=(stop, errors, reads)) for _ in range(2)]
+        writers = [threading.Thread(target=self.write, args=(worker, errors)) for worker in range(6)]
+        for thread in readers + writers:
+            thread.start()
+        for writer in writers:
+            writer.join()
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(errors, [])
+        self.assertGreater(len(reads), 0)
+
+        counts = Counter(task.status for task_list in self.workspace.task_lists.values() for task in task_list.tasks.values())
+        self.assertEqual(self.workspace.status_counts, {status: counts[status] for status in TaskStatus})
+        for task_list in self.workspace.task_lists.values():
+            list_counts = Counter(task.status for task in task_list.tasks.values())
+            self.assertEqual(task_list.status_counts, {status: list_counts[status] for status in TaskStatus})
+
+        self.assertEqual(self.workspace.snapshot().to_dict(), self.workspace.to_dict())
+        self.assertEqual(
+            sorted(self.workspace.search('seed', prefix=False)),
+            sorted((task_list.name, description) for task_list in self.workspace.task_lists.values() for description in task_list.tasks if 'Seed ' in description),
+        )
+        self.assertEqual(len(self.workspace.scheduler), sum(
+            1 for task_list in self.workspace.task_lists.values() for task in task_list.tasks.values() if task.status is not TaskStatus.DONE
+        ))
+
+    def consume(self, stop: threading.Event, errors: list, popped: list):
+        try:
+            while not stop.is_set():
+                task = self.workspace.scheduler.pop_next()
+                if task is None:
+                    continue
+
+                popped.append(task.description)
+                self.workspace.scheduler.peek()
+                try:
+                    if len(popped) % 2:
+                        task.status = TaskStatus.DONE
+                    self.workspace.scheduler.release(task)
+                except ValueError:
+                    pass
+        except Exception as error:  # pragma: no cover
+            errors.append(error)
+
+    def assertSchedulerMatches(self):
+        self.assertEqual(self.workspace.scheduler.claimed, [])
+        self.assertEqual(len(self.workspace.scheduler), sum(
+            1 for task_list in self.workspace.task_lists.values() for task in task_list.tasks.values() if task.status is not TaskStatus.DONE
+        ))
+
+    def test_scheduler_consumers_and_writers(self):
+        errors = []
+        popped = []
+        stop = threading.Event()
+        consumers = [threading.Thread(target=self.consume, args=(stop, errors, popped)) for _ in range(2)]
+        writers = [threading.Thread(target=self.write, args=(worker, errors)) for worker in range(4)]
+        for thread in consumers + writers:
+            thread.start()
+        for writer in writers:
+            writer.join()
+        stop.set()
+        for consumer in consumers:
+            consumer.join()
+
+        self.assertEqual(errors, [])
+        self.assertGreater(len(popped), 0)
+        self.assertSchedulerMatches()
+
+    def test_scheduler_created_while_writing(self):
+        workspace = self.workspace = Workspace('Late')
+        workspace.add_task_lists(TaskList(f'List {index}', compact=index % 2 == 1) for index in range(4))
+        workspace.enable_concurrency()
+        errors = []
+        writers = [threading.Thread(target=self.write, args=(worker, errors)) for worker in range(4)]
+        for writer in writers:
+            writer.start()
+        workspace.scheduler
+        for writer in writers:
+            writer.join()
+
+        self.assertEqual(errors, [])
+        self.assertSchedulerMatches()
+        while workspace.scheduler.pop_next() is not None:
+            pass
+        self.assertEqual(len(workspace.scheduler.claimed), len(workspace.query((TaskStatus.TO_BE_DONE, TaskStatus.IN_PROGRESS))))
+
+    def test_history_is_opt_in(self):
+        self.assertNotIsInstance(self.workspace._history, WorkspaceHistory)
+        snapshot = self.workspace.snapshot()
+        self.workspace.task_lists['List 0'].add_task(Task('Before history'))
+        self.assertFalse(self.workspace.history.can_undo)
+
+        self.workspace.task_lists['List 0'].add_task(Task('After history'))
+        self.workspace.undo()
+        self.assertEqual(list(self.workspace.task_lists['List 0'].tasks)[-1], 'Before history')
+        self.workspace.restore(snapshot)
+        self.assertEqual(self.workspace.snapshot().to_dict(), snapshot.to_dict())
+        self.assertEqual(self.workspace.to_dict(), snapshot.to_dict())
+
+    def test_concurrent_list_changes(self):
+        errors = []
+
+        def churn(worker: int):
+            try:
+                for step in range(100):
+                    task_list = TaskList(f'Worker {worker} list {step}')
+                    self.workspace.add_task_list(task_list)
+                    task_list.add_task(Task('Temporary'))
+                    task_list.name = f'Worker {worker} renamed {step}'
+                    self.workspace.remove_task_list(task_list.name)
+            except Exception as error:  # pragma: no cover
+                errors.append(error)
+
+        threads = [threading.Thread(target=churn, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(list(self.workspace.task_lists), [f'List {index}' for index in range(4)])
+        self.assertEqual(self.workspace.snapshot().task_list_names, list(self.workspace.task_lists))
+        self.assertEqual(self.workspace.progress, '0/80')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
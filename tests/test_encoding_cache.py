@@ -0,0 +1,157 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+from src.encoding_cache import ENCODING_CACHE, ENTRY_BYTES, EncodingCache
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestEncodingCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.max_bytes = ENCODING_CACHE.max_bytes
+        ENCODING_CACHE.max_bytes = 2 ** 20
+        self.workspace = Workspace('Home')
+        self.kitchen = TaskList('Kitchen')
+        self.kitchen.add_tasks(Task(f'Task {index}') for index in range(5))
+        self.garage = TaskList('Garage', compact=True)
+        self.garage.add_tasks([Task('Sweep', TaskPriority.HIGH), Task('Paint')])
+        self.workspace.add_task_lists([self.kitchen, self.garage])
+
+    def tearDown(self):
+        ENCODING_CACHE.max_bytes = self.max_bytes
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def assertEncodedCorrectly(self):
+        self.assertEqual(self.workspace.to_json(), json.dumps(self.workspace.to_dict(), ensure_ascii=False))
+        for task_list in (self.kitchen, self.garage):
+            self.assertEqual(TaskList.from_json(task_list.to_json()).to_dict(), task_list.to_dict())
+            for task in task_list.tasks.values():
+                self.assertEqual(task.to_json(), json.dumps(task.to_dict(), ensure_ascii=False))
+
+    def test_lru_eviction(self):
+        size = ENTRY_BYTES + 2 * sys.getsizeof('a')
+        cache = EncodingCache(3 * size)
+        cache.put('a', 'a')
+        cache.put('b', 'b')
+        cache.put('c', 'c')
+        self.assertEqual(cache.get('a'), 'a')
+
+        cache.put('d', 'd')
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get_many(['a', 'b', 'c', 'd']), ['a', None, 'c', 'd'])
+        self.assertEqual(cache.nbytes, 3 * size)
+
+        cache.max_bytes = size
+        self.assertEqual(len(cache), 1)
+        self.assertIn('d', cache)
+
+        cache.put('long', 'too long to fit')
+        self.assertNotIn('long', cache)
+
+        cache.discard_many(['d', 'missing'])
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+        with self.assertRaises(ValueError):
+            EncodingCache(-1)
+        with self.assertRaises(ValueError):
+            cache.max_bytes = -1
+
+    def test_size_covers_retained_memory(self):
+        task_list = TaskList('Large', compact=True)
+        task_list.add_tasks(Task(f'Task number {index}') for index in range(5000))
+        ENCODING_CACHE.clear()
+        ENCODING_CACHE.max_bytes = 2 ** 26
+
+        tracemalloc.start()
+        try:
+            task_list.to_json()
+            task_list._encoded()
+            retained = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        self.assertGreaterEqual(ENCODING_CACHE.nbytes, retained)
+        self.assertLess(ENCODING_CACHE.nbytes, 1.5 * retained)
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = EncodingCache()
+        cache.put('a', 'a')
+        self.assertEqual(len(cache), 0)
+
+        ENCODING_CACHE.max_bytes = 0
+        self.assertEncodedCorrectly()
+        self.assertEqual(len(ENCODING_CACHE), 0)
+
+    def test_save_does_not_fill_cache(self):
+        ENCODING_CACHE.clear()
+        self.workspace.save_to_file('home.json')
+
+        self.assertEqual(len(ENCODING_CACHE), 0)
+        self.assertEqual(Workspace.load_from_file('home.json').to_dict(), self.workspace.to_dict())
+
+    def test_unchanged_lists_are_reused(self):
+        self.workspace.to_json()
+        self.assertIn(self.kitchen._encoding_key, ENCODING_CACHE)
+        self.assertIn((self.kitchen._encoding_key, 'Task 1'), ENCODING_CACHE)
+
+        self.kitchen.tasks['Task 1'].status = TaskStatus.DONE
+        self.assertNotIn(self.kitchen._encoding_key, ENCODING_CACHE)
+        self.assertNotIn((self.kitchen._encoding_key, 'Task 1'), ENCODING_CACHE)
+        self.assertIn((self.kitchen._encoding_key, 'Task 2'), ENCODING_CACHE)
+        self.assertIn(self.garage._encoding_key, ENCODING_CACHE)
+
+    def test_mutations_invalidate_encodings(self):
+        snapshot = self.workspace.snapshot()
+        edits = [
+            lambda: self.kitchen.tasks['Task 0'].__setattr__('status', TaskStatus.DONE),
+            lambda: self.kitchen.tasks['Task 1'].__setattr__('priority', TaskPriority.LOW),
+            lambda: self.kitchen.tasks['Task 2'].__setattr__('description', 'Renamed'),
+            lambda: self.garage.tasks['Sweep'].__setattr__('status', TaskStatus.IN_PROGRESS),
+            lambda: self.garage.tasks['Paint'].__setattr__('description', 'Varnish'),
+            lambda: self.kitchen.add_task(Task('Task 5')),
+            lambda: self.garage.add_tasks([Task('Tidy', TaskPriority.LOW)]),
+            lambda: self.kitchen.remove_task('Task 3'),
+            lambda: self.garage.remove_tasks(['Tidy']),
+            lambda: self.workspace.sort_tasks_by_status_then_priority(),
+            lambda: self.kitchen.tasks['Renamed'].__setattr__('status', TaskStatus.DONE),
+            lambda: self.workspace.sort_tasks_by_priority(),
+            lambda: self.kitchen.__setattr__('name', 'Cooking'),
+            lambda: self.workspace.undo(),
+            lambda: self.workspace.restore(snapshot),
+        ]
+        self.assertEncodedCorrectly()
+        for edit in edits:
+            edit()
+            self.assertEncodedCorrectly()
+
+    def test_detached_task_list(self):
+        task_list = TaskList('Detached')
+        task_list.add_task(Task('A'))
+        encoded = task_list._encoded()
+
+        task_list.name = 'Renamed'
+        self.assertNotEqual(task_list._encoded(), encoded)
+        self.assertEqual(json.loads(task_list._encoded()), task_list.to_dict())
+
+        task = task_list.tasks['A']
+        task_list.remove_task('A')
+        task.status = TaskStatus.DONE
+        self.assertEqual(json.loads(task.to_json())["status"], 'DONE')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
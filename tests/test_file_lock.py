@@ -0,0 +1,125 @@
+import multiprocessing
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.file_lock import FileLock, SaveConflictError
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+def add_tasks_concurrently(directory: str, worker: int, count: int):
+    os.chdir(directory)
+    for index in range(count):
+        workspace = Workspace.load_from_file('shared.json', shared=True)
+        workspace.find_task_list_by_name('Inbox').add_task(Task(f'Worker {worker} task {index}'))
+        workspace.save_to_file('shared.json', on_conflict='merge')
+
+
+class TestFileLock(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        workspace = Workspace('Shared')
+        workspace.add_task_list(TaskList('Inbox'))
+        workspace.add_task_list(TaskList('Later'))
+        workspace.find_task_list_by_name('Inbox').add_task(Task('Existing'))
+        workspace.save_to_file('shared.json')
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def test_generation_is_saved(self):
+        workspace = Workspace.load_from_file('shared.json')
+        self.assertEqual(workspace.generation, 1)
+
+        workspace.save_to_file('shared.json')
+        self.assertEqual(workspace.generation, 2)
+        self.assertEqual(Workspace.load_from_file('shared.json', lazy=True).generation, 2)
+        self.assertEqual(os.listdir('saves'), ['shared.json'])
+
+    def test_conflicting_save_raises(self):
+        first = Workspace.load_from_file('shared.json', shared=True)
+        second = Workspace.load_from_file('shared.json', shared=True)
+        first.find_task_list_by_name('Inbox').add_task(Task('From first'))
+        first.save_to_file('shared.json', on_conflict='raise')
+        second.find_task_list_by_name('Later').add_task(Task('From second'))
+
+        with self.assertRaises(SaveConflictError) as context:
+            second.save_to_file('shared.json', on_conflict='raise')
+
+        self.assertEqual((context.exception.expected, context.exception.found), (1, 2))
+        self.assertEqual(Workspace.load_from_file('shared.json').to_json(), first.to_json())
+        self.assertEqual(os.listdir('saves'), ['shared.json'])
+
+    def test_conflicting_save_merges(self):
+        first = Workspace.load_from_file('shared.json', shared=True)
+        second = Workspace.load_from_file('shared.json', shared=True)
+        first.find_task_list_by_name('Inbox').add_task(Task('From first'))
+        first.add_task_list(TaskList('Added by first'))
+        first.save_to_file('shared.json', on_conflict='merge')
+
+        later = second.find_task_list_by_name('Later')
+        later.add_task(Task('From second'))
+        second.find_task_list_by_name('Inbox').tasks['Existing'].status = TaskStatus.DONE
+        second.save_to_file('shared.json', on_conflict='merge')
+
+        self.assertEqual(second.generation, 3)
+        self.assertIs(second.find_task_list_by_name('Later'), later)
+        self.assertEqual(list(second.find_task_list_by_name('Inbox').tasks), ['Existing', 'From first'])
+        self.assertEqual(list(second.task_lists), ['Inbox', 'Later', 'Added by first'])
+        self.assertEqual(second.progress, '1/3')
+        self.assertEqual(Workspace.load_from_file('shared.json').to_json(), second.to_json())
+
+    def test_invalid_conflict_options(self):
+        workspace = Workspace.load_from_file('shared.json')
+        with self.assertRaises(ValueError):
+            workspace.save_to_file('shared.json', on_conflict='merge')
+        with self.assertRaises(ValueError):
+            workspace.save_to_file('shared.json', on_conflict='ignore')
+        with self.assertRaises(ValueError):
+            workspace.save_to_file('shared.json', journaled=True, on_conflict='raise')
+
+    def test_writer_waits_for_reader(self):
+        path = pathlib.Path('saves/shared.json')
+        acquired = threading.Event()
+
+        def write():
+            with FileLock(path):
+                acquired.set()
+
+        with FileLock(path, shared=True):
+            with FileLock(path, shared=True):
+                writer = threading.Thread(target=write)
+                writer.start()
+                self.assertFalse(acquired.wait(0.1))
+
+        writer.join(5)
+        self.assertTrue(acquired.is_set())
+
+    def test_processes_merge_concurrent_saves(self):
+        context = multiprocessing.get_context()
+        workers = [context.Process(target=add_tasks_concurrently, args=(self.tmpdir, worker, 10)) for worker in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            self.assertEqual(worker.exitcode, 0)
+
+        workspace = Workspace.load_from_file('shared.json')
+        self.assertEqual(len(workspace.find_task_list_by_name('Inbox').tasks), 41)
+        self.assertEqual(workspace.generation, 41)
+        self.assertEqual(os.listdir('saves'), ['shared.json'])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,171 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.history import _retained_bytes
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Home')
+        self.kitchen = TaskList('Kitchen')
+        self.kitchen.add_tasks(Task(f'Task {index}') for index in range(5))
+        self.workspace.add_task_list(self.kitchen)
+        self.workspace.add_task_list(TaskList('Garage', compact=True))
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def edit(self):
+        self.kitchen.remove_task('Task 2')
+        self.kitchen.tasks['Task 3'].status = TaskStatus.DONE
+        self.kitchen.tasks['Task 0'].description = 'First task'
+        self.workspace.find_task_list_by_name('Garage').add_task(Task('Sweep', TaskPriority.HIGH))
+        self.workspace.remove_task_list('Garage')
+        self.kitchen.name = 'Cooking'
+
+    def test_snapshot_is_unaffected_by_edits(self):
+        snapshot = self.workspace.snapshot()
+        before = self.workspace.to_dict()
+        self.edit()
+
+        self.assertEqual(snapshot.to_dict(), before)
+        self.assertEqual(snapshot.task_list_names, ['Kitchen', 'Garage'])
+        self.assertEqual(snapshot.to_workspace().to_json(), Workspace.from_dict(before).to_json())
+        self.assertEqual(self.workspace.snapshot().task_list_names, ['Cooking'])
+
+    def test_undo_and_redo_every_step(self):
+        states = [self.workspace.to_json()]
+        self.workspace.history
+        for step in (
+            lambda: self.kitchen.remove_task('Task 2'),
+            lambda: setattr(self.kitchen.tasks['Task 3'], 'status', TaskStatus.DONE),
+            self.kitchen.sort_tasks_by_status,
+            lambda: setattr(self.kitchen.tasks['Task 0'], 'description', 'First task'),
+            lambda: self.workspace.find_task_list_by_name('Garage').add_task(Task('Sweep')),
+            lambda: self.workspace.remove_task_list('Garage'),
+            lambda: setattr(self.kitchen, 'name', 'Cooking'),
+        ):
+            step()
+            states.append(self.workspace.to_json())
+
+        for state in reversed(states[:-1]):
+            self.workspace.undo()
+            self.assertEqual(self.workspace.to_json(), state)
+            self.assertEqual(self.workspace.progress, Workspace.from_json(state).progress)
+
+        self.assertFalse(self.workspace.history.can_undo)
+        with self.assertRaises(ValueError):
+            self.workspace.undo()
+
+        for state in states[1:]:
+            self.workspace.redo()
+            self.assertEqual(self.workspace.to_json(), state)
+
+        with self.assertRaises(ValueError):
+            self.workspace.redo()
+
+    def test_undo_restores_removed_list_as_it_was(self):
+        garage = self.workspace.find_task_list_by_name('Garage')
+        garage.add_tasks([Task('Sweep'), Task('Fix door', TaskPriority.HIGH)])
+        garage.sort_tasks_by_priority()
+        self.workspace.history
+        self.workspace.remove_task_list('Garage')
+        self.workspace.undo()
+
+        garage = self.workspace.find_task_list_by_name('Garage')
+        self.assertTrue(garage.compact)
+        self.assertEqual(list(garage.tasks), ['Fix door', 'Sweep'])
+        self.assertFalse(self.kitchen.compact)
+
+    def test_new_edit_drops_redo(self):
+        self.workspace.history
+        self.kitchen.remove_task('Task 1')
+        self.workspace.undo()
+        self.kitchen.add_task(Task('Other'))
+
+        self.assertFalse(self.workspace.history.can_redo)
+        self.assertEqual(list(self.kitchen.tasks), ['Task 0', 'Task 1', 'Task 2', 'Task 3', 'Task 4', 'Other'])
+
+    def test_restore(self):
+        snapshot = self.workspace.snapshot()
+        self.kitchen.sort_tasks_by_status()
+        self.edit()
+        self.workspace.restore(snapshot)
+
+        self.assertEqual(self.workspace.to_dict(), snapshot.to_dict())
+        self.assertEqual(self.workspace.search('task 2'), [('Kitchen', 'Task 2')])
+
+        self.workspace.undo()
+        self.assertEqual(list(self.workspace.task_lists), ['Cooking'])
+
+    def test_memory_budget_evicts_oldest_steps(self):
+        history = self.workspace.history
+        history.max_bytes = 0
+        self.kitchen.add_task(Task('Evicted'))
+
+        self.assertFalse(history.can_undo)
+        self.assertEqual(history.nbytes, 0)
+
+        history.max_bytes = 10 ** 9
+        for index in range(20):
+            self.kitchen.add_task(Task(f'Extra {index}'))
+        self.assertTrue(history.can_undo)
+        self.assertGreater(history.nbytes, 0)
+
+        history.max_bytes = history.nbytes // 2
+        self.assertLessEqual(history.nbytes, history.max_bytes)
+        with self.assertRaises(ValueError):
+            history.max_bytes = -1
+
+    def test_steps_are_charged_for_the_nodes_they_replaced(self):
+        history = self.workspace.history
+        for step in (
+            lambda: self.kitchen.tasks['Task 3'].__setattr__('status', TaskStatus.DONE),
+            lambda: self.kitchen.tasks['Task 0'].__setattr__('description', 'First task'),
+            lambda: self.kitchen.add_tasks(Task(f'Extra {index}') for index in range(100)),
+            lambda: self.kitchen.remove_tasks([f'Extra {index}' for index in range(50)]),
+            lambda: self.workspace.find_task_list_by_name('Garage').add_task(Task('Sweep')),
+            lambda: setattr(self.kitchen, 'name', 'Cooking'),
+            lambda: self.workspace.remove_task_list('Garage'),
+        ):
+            previous, nbytes = history._lists, history.nbytes
+            step()
+            charged = history.nbytes - nbytes
+            self.assertGreater(charged, 0)
+            self.assertLessEqual(charged, _retained_bytes(previous, history._lists))
+
+        self.kitchen.tasks['Task 1'].status = TaskStatus.DONE
+        previous, charged = history._undo[-1]
+        self.assertEqual(charged, _retained_bytes(previous, history._lists))
+
+    def test_lazy_lists(self):
+        self.workspace.save_to_file('home.json')
+        workspace = Workspace.load_from_file(file_name='home.json', lazy=True)
+        snapshot = workspace.snapshot()
+        workspace.find_task_list_by_name('Kitchen').remove_task('Task 0')
+        workspace.undo()
+
+        self.assertEqual(workspace.to_dict(), snapshot.to_dict())
+
+        workspace = Workspace.load_from_file(file_name='home.json', compact=True, lazy=True)
+        workspace.history
+        workspace.remove_task_list('Garage')
+        workspace.undo()
+        self.assertTrue(workspace.find_task_list_by_name('Garage').compact)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
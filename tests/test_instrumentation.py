@@ -0,0 +1,126 @@
+import gc
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.instrumentation import Instrumentation, profile
+from src.task import Task
+from src.task_list import TaskList
+from src.workspace import Workspace
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Measured')
+        self.kitchen = TaskList('Kitchen')
+        self.workspace.add_task_list(self.kitchen)
+
+    def tearDown(self):
+        self.workspace.disable_instrumentation()
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def test_methods_are_unwrapped_when_off(self):
+        add_task = TaskList.__dict__['add_task']
+        self.workspace.enable_instrumentation()
+        self.assertIsNot(TaskList.__dict__['add_task'], add_task)
+
+        self.workspace.disable_instrumentation()
+        self.assertIs(TaskList.__dict__['add_task'], add_task)
+        self.assertEqual(self.workspace.stats(), {})
+
+    def test_methods_are_unwrapped_when_workspace_is_dropped(self):
+        add_task = TaskList.__dict__['add_task']
+        other = Workspace('Other')
+        other.enable_instrumentation()
+        self.assertIsNot(TaskList.__dict__['add_task'], add_task)
+
+        del other
+        gc.collect()
+        self.assertIs(TaskList.__dict__['add_task'], add_task)
+
+    def test_enable_and_disable_from_threads(self):
+        add_task = TaskList.__dict__['add_task']
+
+        def toggle():
+            workspace = Workspace('Threaded')
+            for _ in range(200):
+                workspace.enable_instrumentation()
+                workspace.disable_instrumentation()
+
+        threads = [threading.Thread(target=toggle) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIs(TaskList.__dict__['add_task'], add_task)
+
+    def test_counts_and_latencies(self):
+        self.workspace.enable_instrumentation()
+        for index in range(10):
+            self.kitchen.add_task(Task(f'Task {index}'))
+        self.kitchen.find_task_by_description('Task 3')
+        TaskList('Detached').add_task(Task('Not counted'))
+
+        stats = self.workspace.stats()
+        self.assertEqual(stats['TaskList.add_task']['count'], 10)
+        self.assertEqual(stats['TaskList.find_task_by_description']['count'], 1)
+        self.assertLessEqual(stats['TaskList.add_task']['p50_seconds'], stats['TaskList.add_task']['max_seconds'])
+        self.assertGreater(stats['TaskList.add_task']['total_seconds'], 0)
+
+    def test_bytes_serialized_and_read(self):
+        self.kitchen.add_task(Task('Do dishes'))
+        self.workspace.enable_instrumentation()
+        json_str = self.workspace.to_json()
+        self.workspace.save_to_file('measured.json')
+
+        stats = self.workspace.stats()
+        self.assertEqual(stats['Workspace.to_json']['bytes'], len(json_str.encode()))
+        self.assertEqual(stats['Workspace.save_to_file']['bytes'], os.path.getsize('saves/measured.json'))
+
+        with Instrumentation() as instrumentation:
+            Workspace.load_from_file(file_name='measured.json')
+
+        self.assertEqual(instrumentation.snapshot()['Workspace.load_from_file']['bytes'], os.path.getsize('saves/measured.json'))
+
+    def test_hooks(self):
+        calls = []
+        instrumentation = self.workspace.enable_instrumentation()
+        instrumentation.add_hook(lambda operation, seconds, nbytes: calls.append((operation, nbytes)))
+        self.workspace.find_task_list_by_name('Kitchen')
+
+        self.assertEqual(calls, [('Workspace.find_task_list_by_name', None)])
+
+    def test_shared_instrumentation(self):
+        instrumentation = Instrumentation(sample_size=4)
+        other = Workspace('Other')
+        self.workspace.enable_instrumentation(instrumentation)
+        other.enable_instrumentation(instrumentation)
+        try:
+            self.workspace.add_task_list(TaskList('A'))
+            other.add_task_list(TaskList('B'))
+            self.assertEqual(instrumentation.snapshot()['Workspace.add_task_list']['count'], 2)
+            self.assertNotIn('Workspace.add_task_lists', instrumentation.snapshot())
+            with self.assertRaises(ValueError):
+                other.enable_instrumentation(Instrumentation())
+        finally:
+            other.disable_instrumentation()
+
+    def test_profile(self):
+        with profile(memory=True) as report:
+            self.kitchen.add_tasks(Task(f'Task {index}') for index in range(100))
+
+        self.assertGreater(report.peak_bytes, 0)
+        self.assertTrue(any(function == 'add_tasks' for _, _, function in report.stats.stats))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Journaled')
+        kitchen = TaskList('Kitchen')
+        kitchen.add_task(Task('Do dishes'))
+        kitchen.add_task(Task('Cook dinner', TaskPriority.HIGH))
+        self.workspace.add_task_list(kitchen)
+        self.workspace.save_to_file('home.json', journaled=True)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def mutate(self):
+        kitchen = self.workspace.find_task_list_by_name('Kitchen')
+        kitchen.find_task_by_description('Do dishes').status = TaskStatus.DONE
+        kitchen.find_task_by_description('Cook dinner').priority = TaskPriority.LOW
+        kitchen.find_task_by_description('Cook dinner').description = 'Cook supper'
+        kitchen.add_task(Task('Empty dishwasher'))
+        kitchen.remove_task('Do dishes')
+        bathroom = TaskList('Bathroom')
+        bathroom.add_task(Task('Clean sink'))
+        self.workspace.add_task_list(bathroom)
+        bathroom.name = 'Bath'
+        self.workspace.add_task_list(TaskList('Garage'))
+        self.workspace.remove_task_list('Garage')
+        kitchen.add_tasks([Task('Wipe table'), Task('Sweep floor', TaskPriority.LOW)])
+        kitchen.remove_tasks(['Empty dishwasher', 'Wipe table'])
+
+    def test_save_appends_to_journal(self):
+        snapshot_before = os.path.getmtime('saves/home.json'), os.path.getsize('saves/home.json')
+        self.mutate()
+        self.workspace.save_to_file('home.json', journaled=True)
+        self.assertTrue(os.path.isfile('saves/home.json.journal'))
+        self.assertEqual((os.path.getmtime('saves/home.json'), os.path.getsize('saves/home.json')), snapshot_before)
+
+        loaded = Workspace.load_from_file('home.json')
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+
+    def test_sort_is_journaled(self):
+        kitchen = self.workspace.find_task_list_by_name('Kitchen')
+        kitchen.add_task(Task('Empty dishwasher', TaskPriority.LOW))
+        self.workspace.sort_tasks_by_priority()
+        kitchen.find_task_by_description('Empty dishwasher').priority = TaskPriority.HIGH
+        self.workspace.save_to_file('home.json', journaled=True)
+
+        loaded = Workspace.load_from_file('home.json')
+        self.assertEqual(list(loaded.find_task_list_by_name('Kitchen').tasks), ['Cook dinner', 'Do dishes', 'Empty dishwasher'])
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+
+        loaded.find_task_list_by_name('Kitchen').add_task(Task('Wipe table', TaskPriority.HIGH))
+        kitchen.add_task(Task('Wipe table', TaskPriority.HIGH))
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+
+    def test_save_and_journal_are_utf8(self):
+        self.workspace.find_task_list_by_name('Kitchen').add_task(Task('Umyć żółty czajnik'))
+        self.workspace.save_to_file('home.json', journaled=True)
+        with open('saves/home.json.journal', 'rb') as journal_file:
+            self.assertIn('Umyć żółty czajnik'.encode('utf-8'), journal_file.read())
+
+        self.workspace.save_to_file('home.json')
+        with open('saves/home.json', 'rb') as save_file:
+            self.assertIn('Umyć żółty czajnik'.encode('utf-8'), save_file.read())
+        self.assertEqual(Workspace.load_from_file('home.json').to_json(), self.workspace.to_json())
+
+    def test_replay_is_idempotent(self):
+        self.mutate()
+        self.workspace.save_to_file('home.json', journaled=True)
+        shutil.copy('saves/home.json.journal', 'journal.bak')
+        self.workspace.save_to_file('home.json')
+        self.assertFalse(os.path.exists('saves/home.json.journal'))
+
+        shutil.copy('journal.bak', 'saves/home.json.journal')
+        loaded = Workspace.load_from_file('home.json')
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+
+    def test_compaction(self):
+        self.workspace.journal.compaction_threshold = 1
+        self.mutate()
+        self.workspace.save_to_file('home.json', journaled=True)
+        self.assertFalse(os.path.exists('saves/home.json.journal'))
+        self.assertEqual(Workspace.load_from_file('home.json').to_json(), self.workspace.to_json())
+
+    def test_loaded_workspace_keeps_journaling(self):
+        loaded = Workspace.load_from_file('home.json', journaled=True)
+        loaded.find_task_list_by_name('Kitchen').remove_task('Do dishes')
+        loaded.save_to_file('home.json', journaled=True)
+        self.assertEqual(Workspace.load_from_file('home.json').progress, '0/1')
+
+    def test_torn_last_entry_is_ignored(self):
+        self.mutate()
+        self.workspace.save_to_file('home.json', journaled=True)
+        with open('saves/home.json.journal', 'a') as journal_file:
+            journal_file.write('["status", "Kitchen", "Cook')
+        self.assertEqual(Workspace.load_from_file('home.json').to_json(), self.workspace.to_json())
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from src.persistent_map import MISSING, PersistentMap
+
+
+class CollidingKey:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+
+class TestPersistentMap(unittest.TestCase):
+
+    def setUp(self):
+        self.items = {f'key {index}': index for index in range(2000)}
+        self.map = PersistentMap(self.items.items())
+
+    def test_lookup(self):
+        self.assertEqual(len(self.map), 2000)
+        self.assertEqual(dict(self.map.items()), self.items)
+        self.assertEqual(self.map['key 42'], 42)
+        self.assertNotIn('key 2000', self.map)
+        self.assertIsNone(self.map.get('missing'))
+        with self.assertRaises(KeyError):
+            self.map['missing']
+
+    def test_updates_leave_original_untouched(self):
+        changed = self.map.set('key 1', -1).set('new', 0).delete('key 2')
+
+        self.assertEqual(self.map['key 1'], 1)
+        self.assertIn('key 2', self.map)
+        self.assertEqual(len(changed), 2000)
+        self.assertEqual(changed['key 1'], -1)
+        self.assertNotIn('key 2', changed)
+        with self.assertRaises(KeyError):
+            changed.delete('key 2')
+
+    def test_delete_everything(self):
+        persistent_map = self.map
+        for key in self.items:
+            persistent_map = persistent_map.delete(key)
+
+        self.assertEqual(len(persistent_map), 0)
+        self.assertEqual(list(persistent_map), [])
+
+    def test_bulk_update_and_discard(self):
+        small = self.map.update([('key 1', 'one'), ('extra', 1)])
+        large = self.map.update((f'extra {index}', index) for index in range(5000))
+        removed = large.discard(f'key {index}' for index in range(1500))
+
+        self.assertEqual((len(small), small['key 1']), (2001, 'one'))
+        self.assertEqual(len(large), 7000)
+        self.assertEqual(len(removed), 5500)
+        self.assertNotIn('key 0', removed)
+        self.assertEqual(removed['key 1999'], 1999)
+
+    def test_hash_collisions(self):
+        keys = [CollidingKey(name) for name in 'abc']
+        persistent_map = PersistentMap((key, key.name) for key in keys).set('other', 1)
+
+        self.assertEqual([persistent_map[key] for key in keys], ['a', 'b', 'c'])
+        persistent_map = persistent_map.delete(keys[1]).set(keys[0], 'A')
+        self.assertEqual(len(persistent_map), 3)
+        self.assertEqual(persistent_map[keys[0]], 'A')
+        self.assertNotIn(keys[1], persistent_map)
+
+    def test_diff_and_sharing(self):
+        changed = self.map.set('key 1', -1).set('new', 0).delete('key 2')
+
+        self.assertEqual(sorted(self.map.diff(changed), key=str), sorted([
+            ('key 1', 1, -1), ('new', MISSING, 0), ('key 2', 2, MISSING),
+        ], key=str))
+        self.assertEqual(list(self.map.diff(self.map)), [])
+        self.assertLess(self.map.unshared_bytes(changed), self.map.unshared_bytes() // 10)
+
+    def test_replaced_bytes_follow_edited_paths(self):
+        keys = [f'key {index}' for index in range(0, 2000, 97)]
+        changed = self.map.update((key, -1) for key in keys)
+        self.assertEqual(self.map.replaced_bytes(keys), self.map.unshared_bytes(changed))
+
+        changed = self.map.set('key 1', -1).set('new', 0).delete('key 2')
+        self.assertLessEqual(self.map.replaced_bytes(['key 1', 'new', 'key 2']), self.map.unshared_bytes(changed))
+        self.assertGreater(self.map.replaced_bytes(['key 1', 'new', 'key 2']), 0)
+        self.assertEqual(self.map.replaced_bytes([]), 0)
+
+        keys = [CollidingKey(name) for name in 'abc']
+        colliding = PersistentMap((key, key.name) for key in keys)
+        self.assertEqual(colliding.replaced_bytes(keys[:2]), colliding.unshared_bytes(colliding.set(keys[0], 'A')))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,85 @@
+import io
+import unittest
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+def legacy_task_list_str(task_list: TaskList) -> str:
+    formatted_tasks = []
+    for index, task in enumerate(task_list.tasks.values()):
+        prefix = '├' if index != len(task_list.tasks) - 1 else '└'
+        formatted_tasks.append(f'\t {prefix} {task}')
+
+    return f'{task_list.name} {task_list.progress}\n' + '\n'.join(formatted_tasks)
+
+
+def legacy_workspace_str(workspace: Workspace) -> str:
+    return f'{workspace.name}\n' + '\n'.join([f' └ {legacy_task_list_str(task_list)}' for task_list in workspace.task_lists.values()])
+
+
+class TestRender(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = Workspace('Home')
+        kitchen = TaskList('Kitchen')
+        kitchen.add_task(Task('Do dishes', TaskPriority.LOW, TaskStatus.DONE))
+        kitchen.add_task(Task('Cook dinner', TaskPriority.HIGH))
+        kitchen.add_task(Task('Empty dishwasher'))
+        garage = TaskList('Garage', compact=True)
+        garage.add_task(Task('Sweep', status=TaskStatus.IN_PROGRESS))
+        self.workspace.add_task_list(kitchen)
+        self.workspace.add_task_list(TaskList('Empty'))
+        self.workspace.add_task_list(garage)
+
+    def render(self, target, **kwargs) -> str:
+        stream = io.StringIO()
+        target.render(stream, **kwargs)
+        return stream.getvalue()
+
+    def test_matches_legacy_format(self):
+        self.assertEqual(str(self.workspace), legacy_workspace_str(self.workspace))
+        self.assertEqual(self.render(self.workspace), legacy_workspace_str(self.workspace))
+
+        self.workspace.sort_tasks_by_status_then_priority()
+        self.assertEqual(self.render(self.workspace), legacy_workspace_str(self.workspace))
+
+        for task_list in self.workspace.task_lists.values():
+            self.assertEqual(str(task_list), legacy_task_list_str(task_list))
+            self.assertEqual(self.render(task_list), legacy_task_list_str(task_list))
+
+    def test_edge_shapes_match_legacy_format(self):
+        empty = Workspace('Nothing')
+        self.assertEqual(str(empty), legacy_workspace_str(empty))
+
+        empty.add_task_list(TaskList('Last one is empty'))
+        self.assertEqual(str(empty), legacy_workspace_str(empty))
+
+    def test_lines_pagination(self):
+        lines = str(self.workspace).split('\n')
+        for offset in range(len(lines) + 1):
+            for limit in (None, 0, 1, 3):
+                expected = lines[offset:] if limit is None else lines[offset:offset + limit]
+                self.assertEqual(list(self.workspace.lines(offset, limit)), expected)
+
+        self.assertEqual(self.render(self.workspace, offset=1, limit=2), '\n'.join(lines[1:3]))
+
+    def test_task_list_pagination(self):
+        task_list = self.workspace.find_task_list_by_name('Kitchen')
+        lines = str(task_list).split('\n')
+        for offset in range(len(lines) + 1):
+            self.assertEqual(list(task_list.lines(offset, 2)), lines[offset:offset + 2])
+
+    def test_selected_lists(self):
+        rendered = self.render(self.workspace, lists=['Garage'])
+        self.assertEqual(rendered, 'Home\n └ Garage 0/1\n\t └ Sweep - In progress - Medium')
+
+        with self.assertRaises(KeyError):
+            self.render(self.workspace, lists=['Attic'])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.search_index import SearchIndex, tokenize
+from src.task import Task
+from src.task_list import TaskList
+from src.workspace import Workspace
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = Workspace('Home')
+        self.kitchen = TaskList('Kitchen')
+        self.kitchen.add_task(Task('Wash the dishes'))
+        self.kitchen.add_task(Task('Clean the oven'))
+        self.garage = TaskList('Garage')
+        self.garage.add_task(Task('Wash the car'))
+        self.garage.add_task(Task('Dishwasher repair'))
+        self.workspace.add_task_list(self.kitchen)
+        self.workspace.add_task_list(self.garage)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('Wash the Dishes, then dry-up!'), ['wash', 'the', 'dishes', 'then', 'dry', 'up'])
+
+    def test_search_exact_and_prefix(self):
+        self.assertEqual(self.workspace.search('wash', prefix=False), [('Kitchen', 'Wash the dishes'), ('Garage', 'Wash the car')])
+        self.assertEqual(self.workspace.search('dish'), [('Kitchen', 'Wash the dishes'), ('Garage', 'Dishwasher repair')])
+        self.assertEqual(self.workspace.search('dish', prefix=False), [])
+
+    def test_search_conjunction(self):
+        self.assertEqual(self.workspace.search('WASH car'), [('Garage', 'Wash the car')])
+        self.assertEqual(self.workspace.search('wash oven'), [])
+        self.assertEqual(self.workspace.search('   '), [])
+
+    def test_search_limit(self):
+        self.assertEqual(self.workspace.search('the', limit=2), [('Kitchen', 'Wash the dishes'), ('Kitchen', 'Clean the oven')])
+        self.assertEqual(self.workspace.search('the', limit=0), [])
+
+    def test_index_follows_task_changes(self):
+        self.workspace.search('wash')
+
+        self.kitchen.add_task(Task('Wash windows'))
+        self.garage.remove_task('Wash the car')
+        self.kitchen.find_task_by_description('Clean the oven').description = 'Scrub the oven'
+
+        self.assertEqual(self.workspace.search('wash'), [('Kitchen', 'Wash the dishes'), ('Kitchen', 'Wash windows')])
+        self.assertEqual(self.workspace.search('clean'), [])
+        self.assertEqual(self.workspace.search('scrub'), [('Kitchen', 'Scrub the oven')])
+        self.assertEqual(self.workspace.search('car', prefix=False), [])
+
+    def test_index_follows_task_list_changes(self):
+        self.workspace.search('wash')
+
+        self.garage.name = 'Shed'
+        self.workspace.remove_task_list('Kitchen')
+        attic = TaskList('Attic')
+        attic.add_task(Task('Wash boxes'))
+        self.workspace.add_task_list(attic)
+
+        self.assertEqual(self.workspace.search('wash'), [('Shed', 'Wash the car'), ('Attic', 'Wash boxes')])
+        self.assertEqual(self.workspace.search('oven'), [])
+
+    def test_removed_tokens_leave_vocabulary(self):
+        index = SearchIndex()
+        index.add_list('List', ['Alpha beta'])
+        index.remove('List', 'Alpha beta')
+        self.assertEqual(index._postings, {})
+        self.assertEqual(index._vocabulary, [])
+
+    def test_search_lazy_workspace_without_loading(self):
+        tmpdir = tempfile.mkdtemp()
+        original_cwd = os.getcwd()
+        os.chdir(tmpdir)
+        try:
+            self.workspace.save_to_file('home.json')
+            loaded = Workspace.load_from_file('home.json', lazy=True)
+            self.assertEqual(loaded.search('wash'), self.workspace.search('wash'))
+            self.assertFalse(loaded.task_lists.is_loaded('Kitchen'))
+
+            loaded.find_task_list_by_name('Kitchen').remove_task('Wash the dishes')
+            self.assertEqual(loaded.search('wash'), [('Garage', 'Wash the car')])
+        finally:
+            os.chdir(original_cwd)
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestSegments(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Segmented')
+        for name in ('Kitchen', 'Bathroom', 'Garage'):
+            task_list = TaskList(name)
+            task_list.add_task(Task(f'Clean {name}'))
+            self.workspace.add_task_list(task_list)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def segment_files(self) -> dict:
+        with open('saves/home/manifest.json') as manifest_file:
+            return {segment["name"]: segment["file"] for segment in json.load(manifest_file)["segments"]}
+
+    def test_save_and_load(self):
+        self.workspace.save_to_directory('home')
+        self.assertEqual(sorted(os.listdir('saves/home')), sorted(['manifest.json', *self.segment_files().values()]))
+        loaded = Workspace.load_from_directory('home')
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+        self.assertEqual(loaded.dirty_task_lists, [])
+
+    def test_only_dirty_lists_are_rewritten(self):
+        self.workspace.save_to_directory('home')
+        before = self.segment_files()
+        self.assertEqual(self.workspace.dirty_task_lists, [])
+
+        self.workspace.find_task_list_by_name('Kitchen').find_task_by_description('Clean Kitchen').status = TaskStatus.DONE
+        self.assertEqual(self.workspace.dirty_task_lists, ['Kitchen'])
+
+        with patch.object(TaskList, 'to_dict', autospec=True, side_effect=TaskList.to_dict) as to_dict:
+            self.workspace.save_to_directory('home')
+        self.assertEqual([call.args[0].name for call in to_dict.call_args_list], ['Kitchen'])
+
+        after = self.segment_files()
+        self.assertNotEqual(before['Kitchen'], after['Kitchen'])
+        self.assertEqual(before['Bathroom'], after['Bathroom'])
+        self.assertFalse(os.path.exists(os.path.join('saves/home', before['Kitchen'])))
+        self.assertEqual(Workspace.load_from_directory('home').progress, '1/3')
+
+    def test_sorted_lists_are_rewritten(self):
+        kitchen = self.workspace.find_task_list_by_name('Kitchen')
+        kitchen.find_task_by_description('Clean Kitchen').status = TaskStatus.DONE
+        kitchen.add_task(Task('Cook'))
+        self.workspace.save_to_directory('home')
+
+        kitchen.sort_tasks_by_status()
+        self.assertEqual(self.workspace.dirty_task_lists, ['Kitchen'])
+
+        self.workspace.save_to_directory('home')
+        loaded = Workspace.load_from_directory('home').find_task_list_by_name('Kitchen')
+        self.assertEqual(list(loaded.tasks), list(kitchen.tasks))
+        self.assertEqual(list(kitchen.tasks), ['Cook', 'Clean Kitchen'])
+
+    def test_removed_and_renamed_lists(self):
+        self.workspace.save_to_directory('home')
+        self.workspace.remove_task_list('Garage')
+        self.workspace.find_task_list_by_name('Bathroom').name = 'Bath'
+        self.workspace.save_to_directory('home')
+        self.assertEqual(list(self.segment_files()), ['Kitchen', 'Bath'])
+        self.assertEqual(len(os.listdir('saves/home')), 3)
+
+    def test_load_single_task_list(self):
+        self.workspace.save_to_directory('home')
+        os.remove(os.path.join('saves/home', self.segment_files()['Garage']))
+        task_list = Workspace.load_task_list_from_directory('home', 'Kitchen')
+        self.assertEqual(list(task_list.tasks), ['Clean Kitchen'])
+        with self.assertRaises(ValueError):
+            Workspace.load_task_list_from_directory('home', 'Attic')
+
+    def test_failed_save_keeps_previous_save(self):
+        self.workspace.save_to_directory('home')
+        self.workspace.find_task_list_by_name('Garage').add_task(Task('Sweep'))
+        with patch('src.segments.write_atomically', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.workspace.save_to_directory('home')
+        self.assertEqual(Workspace.load_from_directory('home').progress, '0/3')
+
+    def test_save_to_file_is_atomic(self):
+        self.workspace.save_to_file('home.json')
+        with patch('src.workspace.write_workspace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.workspace.save_to_file('home.json')
+        self.assertEqual(os.listdir('saves'), ['home.json'])
+        self.assertEqual(Workspace.load_from_file('home.json').to_json(), self.workspace.to_json())
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
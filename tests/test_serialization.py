@@ -0,0 +1,108 @@
+import io
+import json
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.serialization import SaveIndexReader, WorkspaceReader, task_list_counts, write_workspace
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = Workspace('Home "sweet" home')
+        kitchen = TaskList('Kitchen')
+        kitchen.add_task(Task('Do dishes', TaskPriority.LOW, TaskStatus.DONE))
+        kitchen.add_task(Task('Cook dinner ąę', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        self.workspace.add_task_list(kitchen)
+        self.workspace.add_task_list(TaskList('Empty'))
+
+    def write(self) -> str:
+        stream = io.StringIO()
+        write_workspace(self.workspace, stream)
+        return stream.getvalue()
+
+    def test_write_matches_to_json(self):
+        self.assertEqual(self.write(), self.workspace.to_json())
+
+    def test_parallel_write_matches_to_json(self):
+        self.workspace.find_task_list_by_name('Kitchen').sort_tasks_by_status()
+        compact = TaskList('Compact', compact=True)
+        compact.add_task(Task('Sweep', TaskPriority.MEDIUM))
+        self.workspace.add_task_list(compact)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(self.workspace.to_json(executor), self.workspace.to_json())
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(self.workspace.to_json(executor), self.workspace.to_json())
+
+    def test_generation_header(self):
+        stream = io.StringIO()
+        write_workspace(self.workspace, stream, generation=7)
+        reader = WorkspaceReader(io.StringIO(stream.getvalue()), chunk_size=4)
+
+        self.assertEqual(reader.generation, 7)
+        self.assertEqual(json.loads(stream.getvalue())["generation"], 7)
+        self.assertEqual(WorkspaceReader(io.StringIO(self.write())).generation, 0)
+        self.assertEqual(Workspace.from_json(stream.getvalue()).to_json(), self.workspace.to_json())
+
+    def test_read_task_lists(self):
+        reader = WorkspaceReader(io.StringIO(self.write()), chunk_size=7)
+        self.assertEqual(reader.name, 'Home "sweet" home')
+        self.assertEqual(reader.version, 2)
+        task_lists = list(reader.task_lists())
+        self.assertEqual([task_list.name for task_list in task_lists], ['Kitchen', 'Empty'])
+        self.assertEqual(list(task_lists[0].tasks), ['Do dishes', 'Cook dinner ąę'])
+        self.assertEqual(task_lists[0].progress, '1/2')
+
+    def test_read_tasks(self):
+        reader = WorkspaceReader(io.StringIO(self.write()), chunk_size=5)
+        tasks = [(name, task.description, task.priority) for name, task in reader.tasks()]
+        self.assertEqual(tasks, [
+            ('Kitchen', 'Do dishes', TaskPriority.LOW),
+            ('Kitchen', 'Cook dinner ąę', TaskPriority.HIGH),
+        ])
+
+    def test_read_legacy_format(self):
+        legacy = json.dumps({
+            "name": "Old",
+            "task_list": [task_list.to_json() for task_list in self.workspace.task_lists.values()],
+        })
+        reader = WorkspaceReader(io.StringIO(legacy), chunk_size=3)
+        self.assertEqual(reader.version, 1)
+        task_lists = list(reader.task_lists(compact=True))
+        self.assertEqual(len(task_lists), 2)
+        self.assertEqual(task_lists[0].find_task_by_description('Do dishes').status, TaskStatus.DONE)
+
+    def test_tasks_before_name(self):
+        reader = WorkspaceReader(io.StringIO('{"name": "W", "task_list": [{"tasks": [], "name": "L"}]}'))
+        with self.assertRaises(ValueError):
+            list(reader.task_lists())
+
+    def test_task_list_spans(self):
+        self.workspace.find_task_list_by_name('Empty').name = 'Łazienka "stara"'
+        self.workspace.find_task_list_by_name('Kitchen').add_task(Task('Nested {[ "quoted" ]} \\ task'))
+        stream = io.StringIO()
+        write_workspace(self.workspace, stream, generation=3, counts=task_list_counts(self.workspace))
+        encoded = stream.getvalue().encode()
+
+        for chunk_size in (3, 16, 1 << 16):
+            reader = SaveIndexReader(io.StringIO(encoded.decode('latin-1')), chunk_size=chunk_size)
+            self.assertEqual((reader.name, reader.generation), ('Home "sweet" home', 3))
+            self.assertEqual(reader.status_counts, [task_list.status_counts for task_list in self.workspace.task_lists.values()])
+
+            spans = list(reader.task_list_spans())
+            self.assertEqual([name for name, _, _ in spans], ['Kitchen', 'Łazienka "stara"'])
+            self.assertEqual([json.loads(encoded[start:end]) for _, start, end in spans], self.workspace.to_dict()["task_list"])
+
+    def test_truncated_save(self):
+        reader = WorkspaceReader(io.StringIO(self.write()[:60]), chunk_size=8)
+        with self.assertRaises(ValueError):
+            list(reader.tasks())
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from src.utils.sortable_enum import SortableEnum
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+
+class TestSortableEnum(unittest.TestCase):
+
+    def test_rank_follows_definition_order(self):
+        self.assertEqual([status.rank for status in TaskStatus], [0, 1, 2])
+        self.assertEqual([priority.rank for priority in TaskPriority], [0, 1, 2])
+
+    def test_rank_ignores_values_and_aliases(self):
+        class Size(SortableEnum):
+            LARGE = 30
+            SMALL = 10
+            BIG = 30
+
+        self.assertEqual([size.rank for size in Size], [0, 1])
+        self.assertIs(Size.BIG, Size.LARGE)
+        self.assertLess(Size.LARGE, Size.SMALL)
+
+    def test_ordering(self):
+        self.assertLess(TaskStatus.TO_BE_DONE, TaskStatus.IN_PROGRESS)
+        self.assertLessEqual(TaskStatus.IN_PROGRESS, TaskStatus.IN_PROGRESS)
+        self.assertGreater(TaskPriority.LOW, TaskPriority.HIGH)
+        self.assertGreaterEqual(TaskPriority.LOW, TaskPriority.MEDIUM)
+        self.assertEqual(sorted([TaskStatus.DONE, TaskStatus.TO_BE_DONE, TaskStatus.IN_PROGRESS]), list(TaskStatus))
+
+    def test_hashable(self):
+        counts = {status: 0 for status in TaskStatus}
+        counts[TaskStatus.DONE] += 1
+        self.assertEqual(counts[TaskStatus.DONE], 1)
+        self.assertEqual(len({TaskPriority.HIGH, TaskPriority.HIGH}), 1)
+
+    def test_different_enums_are_not_comparable(self):
+        self.assertNotEqual(TaskStatus.TO_BE_DONE, TaskPriority.HIGH)
+        with self.assertRaises(TypeError):
+            TaskStatus.DONE < TaskPriority.LOW
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
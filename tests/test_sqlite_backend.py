@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.sqlite_backend import SqliteBackend
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestSqliteBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Home')
+        self.kitchen = TaskList('Kitchen')
+        self.kitchen.add_task(Task('A', TaskPriority.MEDIUM, TaskStatus.DONE))
+        self.kitchen.add_task(Task('B', TaskPriority.LOW, TaskStatus.TO_BE_DONE))
+        self.kitchen.add_task(Task('C', TaskPriority.HIGH, TaskStatus.TO_BE_DONE))
+        self.kitchen.add_task(Task('D', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        self.workspace.add_task_list(self.kitchen)
+        self.workspace.add_task_list(TaskList('Empty'))
+        self.workspace.save_to_sqlite('home.db')
+
+        self.backend = SqliteBackend(os.path.join('saves', 'home.db'))
+
+    def tearDown(self):
+        self.backend.close()
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        loaded = Workspace.load_from_sqlite('home.db', 'Home')
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+
+    def test_save_replaces_workspace(self):
+        self.kitchen.remove_task('A')
+        self.workspace.save_to_sqlite('home.db')
+        self.assertEqual(self.backend.progress('Home'), '0/3')
+        self.assertEqual(self.backend.workspace_names(), ['Home'])
+
+    def test_missing_workspace(self):
+        with self.assertRaises(ValueError):
+            Workspace.load_from_sqlite('home.db', 'Office')
+
+    def test_find_task_by_description(self):
+        task = self.backend.find_task_by_description('Home', 'Kitchen', 'D')
+        self.assertEqual(task.priority, TaskPriority.HIGH)
+        self.assertEqual(task.status, TaskStatus.IN_PROGRESS)
+        with self.assertRaises(ValueError):
+            self.backend.find_task_by_description('Home', 'Kitchen', 'Z')
+
+    def test_sorted_orders_match_task_list(self):
+        for keys, sort in (
+                (('status',), self.kitchen.sort_tasks_by_status),
+                (('priority', 'status'), self.kitchen.sort_tasks_by_priority),
+                (('status', 'priority'), self.kitchen.sort_tasks_by_status_then_priority),
+        ):
+            sort()
+            descriptions = [task.description for task in self.backend.iter_tasks('Home', 'Kitchen', keys)]
+            self.assertEqual(descriptions, list(self.kitchen.tasks))
+
+    def test_progress_and_status_counts(self):
+        self.assertEqual(self.backend.progress('Home'), '1/4')
+        self.assertEqual(self.backend.progress('Home', 'Empty'), '0/0')
+        self.assertEqual(self.backend.status_counts('Home', 'Kitchen')[TaskStatus.TO_BE_DONE], 2)
+
+    def test_import_tasks(self):
+        self.backend.import_tasks('Office', 'Inbox', (Task(f'Task {index}') for index in range(1000)))
+        self.assertEqual(self.backend.progress('Office', 'Inbox'), '0/1000')
+        with self.assertRaises(ValueError):
+            self.backend.import_tasks('Office', 'Inbox', [Task('New'), Task('Task 5')])
+        self.assertEqual(self.backend.progress('Office', 'Inbox'), '0/1000')
+
+    def test_bulk_import_rebuilds_indexes(self):
+        self.backend.import_tasks('Office', 'Small', [Task('Existing')])
+        with patch('src.sqlite_backend.BATCH_SIZE', 100):
+            with self.assertRaises(ValueError):
+                self.backend.import_tasks('Office', 'Outbox', [Task(f'Task {index % 500}') for index in range(1000)])
+            self.backend.import_tasks('Office', 'Inbox', (Task(f'Task {index}') for index in range(1000)))
+
+        indexes = {name for name, in self.backend._connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertLessEqual({'tasks_by_list_description', 'tasks_by_list_status_priority'}, indexes)
+        self.assertEqual(self.backend.task_list_names('Office'), ['Small', 'Inbox'])
+        self.assertEqual(self.backend.progress('Office'), '0/1001')
+
+    def test_lazy_load_sorts_with_indexed_queries(self):
+        with patch.object(SqliteBackend, 'close', autospec=True, side_effect=SqliteBackend.close) as close:
+            loaded = Workspace.load_from_sqlite('home.db', 'Home', lazy=True)
+            self.assertEqual(loaded.progress, '1/4')
+            self.assertEqual(loaded.task_lists.entry('Kitchen').status_counts, self.kitchen.status_counts)
+
+            with patch.object(SqliteBackend, 'load_task_list', side_effect=AssertionError):
+                loaded.sort_tasks_by_priority()
+                loaded.sort_tasks_by_status()
+                self.workspace.sort_tasks_by_priority()
+                self.workspace.sort_tasks_by_status()
+                self.assertEqual(loaded.to_dict(), self.workspace.to_dict())
+            self.assertFalse(loaded.task_lists.is_loaded('Kitchen'))
+
+            kitchen = loaded.find_task_list_by_name('Kitchen')
+            self.assertEqual(list(kitchen.tasks), list(self.kitchen.tasks))
+            kitchen.sort_tasks_by_priority()
+            self.kitchen.sort_tasks_by_priority()
+            self.assertEqual(list(kitchen.tasks), list(self.kitchen.tasks))
+
+            self.assertEqual(close.call_count, 0)
+            loaded.remove_task_list('Empty')
+            self.assertEqual(close.call_count, 1)
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -0,0 +1,131 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+def contents(workspace: Workspace) -> dict:
+    return {
+        task_list.name: {task.description: (task.priority, task.status) for task in task_list.tasks.values()}
+        for task_list in workspace.task_lists.values()
+    }
+
+
+class TestSync(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.base = Workspace('Home')
+        kitchen = TaskList('Kitchen')
+        kitchen.add_tasks(Task(f'Task {index}') for index in range(5))
+        garage = TaskList('Garage')
+        garage.add_task(Task('Sweep', TaskPriority.HIGH))
+        self.base.add_task_lists([kitchen, garage, TaskList('Attic')])
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def copy(self, workspace: Workspace, compact: bool = False) -> Workspace:
+        return Workspace.from_dict(workspace.to_dict(), compact)
+
+    def test_content_hash(self):
+        other = self.copy(self.base, compact=True)
+        self.assertEqual(self.base.content_hash, other.content_hash)
+
+        other.find_task_list_by_name('Attic').name = 'Loft'
+        self.assertNotEqual(self.base.content_hash, other.content_hash)
+
+        other.find_task_list_by_name('Loft').name = 'Attic'
+        self.assertEqual(self.base.content_hash, other.content_hash)
+
+    def test_diff_and_apply(self):
+        other = self.copy(self.base)
+        self.assertEqual(self.base.diff(other), [])
+
+        kitchen = other.find_task_list_by_name('Kitchen')
+        kitchen.tasks['Task 1'].status = TaskStatus.DONE
+        kitchen.tasks['Task 2'].description = 'Renamed'
+        kitchen.remove_task('Task 3')
+        other.remove_task_list('Garage')
+        cellar = TaskList('Cellar')
+        cellar.add_task(Task('Dust'))
+        other.add_task_list(cellar)
+
+        changes = self.base.diff(other)
+        self.assertEqual({entry[1] if isinstance(entry[1], str) else entry[1]["name"] for entry in changes}, {'Kitchen', 'Garage', 'Cellar'})
+        self.assertEqual(changes, json.loads(json.dumps(changes)))
+
+        self.base.apply(changes)
+        self.assertEqual(contents(self.base), contents(other))
+        self.assertEqual(self.base.content_hash, other.content_hash)
+        self.assertEqual(self.base.diff(other), [])
+
+        self.base.apply(changes)
+        self.assertEqual(contents(self.base), contents(other))
+
+    def test_diff_skips_unloaded_lists(self):
+        self.base.save_to_file('home.json')
+        lazy = Workspace.load_from_file('home.json', lazy=True)
+        other = self.copy(self.base)
+        other.find_task_list_by_name('Garage').add_task(Task('Paint'))
+
+        self.assertEqual(lazy.diff(other), [['add_tasks', 'Garage', [Task('Paint').to_dict()]]])
+        self.assertFalse(lazy.task_lists.is_loaded('Kitchen'))
+        self.assertEqual(lazy.content_hash, self.base.content_hash)
+
+    def test_merge_combines_independent_edits(self):
+        ours = self.copy(self.base)
+        theirs = self.copy(self.base)
+        ours.find_task_list_by_name('Kitchen').tasks['Task 0'].status = TaskStatus.DONE
+        ours.remove_task_list('Attic')
+        theirs.find_task_list_by_name('Kitchen').tasks['Task 4'].priority = TaskPriority.HIGH
+        theirs.find_task_list_by_name('Garage').remove_task('Sweep')
+        theirs.add_task_list(TaskList('Cellar'))
+
+        ours.merge(self.base, theirs)
+
+        kitchen = ours.find_task_list_by_name('Kitchen')
+        self.assertEqual(kitchen.tasks['Task 0'].status, TaskStatus.DONE)
+        self.assertEqual(kitchen.tasks['Task 4'].priority, TaskPriority.HIGH)
+        self.assertEqual(ours.find_task_list_by_name('Garage').tasks, {})
+        self.assertEqual(list(ours.task_lists), ['Kitchen', 'Garage', 'Cellar'])
+
+    def test_merge_conflicts_follow_preference(self):
+        theirs = self.copy(self.base)
+        theirs.find_task_list_by_name('Kitchen').tasks['Task 0'].status = TaskStatus.IN_PROGRESS
+        theirs.find_task_list_by_name('Attic').add_task(Task('Boxes'))
+
+        for prefer, status, attic in (('ours', TaskStatus.DONE, False), ('theirs', TaskStatus.IN_PROGRESS, True)):
+            ours = self.copy(self.base)
+            ours.find_task_list_by_name('Kitchen').tasks['Task 0'].status = TaskStatus.DONE
+            ours.remove_task_list('Attic')
+
+            ours.merge(self.base, theirs, prefer=prefer)
+
+            self.assertEqual(ours.find_task_list_by_name('Kitchen').tasks['Task 0'].status, status)
+            self.assertEqual('Attic' in ours.task_lists, attic)
+
+        with self.assertRaises(ValueError):
+            self.base.merge(self.base, theirs, prefer='both')
+
+    def test_merge_without_their_changes_is_empty(self):
+        ours = self.copy(self.base)
+        ours.find_task_list_by_name('Kitchen').remove_task('Task 0')
+
+        self.assertEqual(ours.merge(self.base, self.copy(self.base)), [])
+        self.assertNotIn('Task 0', ours.find_task_list_by_name('Kitchen').tasks)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
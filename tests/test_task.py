@@ -51,6 +51,10 @@ class TestTask(unittest.TestCase):
         self.laundry_task.status = TaskStatus.DONE
         self.assertEqual(self.laundry_task.status, TaskStatus.DONE)
 
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.laundry_task.name = 'Do laundry'
+
     def test_str_representation(self):
         self.assertEqual(str(self.laundry_task), 'Do laundry - In progress - High')
 
@@ -70,5 +74,22 @@ class TestTask(unittest.TestCase):
         self.assertEqual(new_task.priority, self.laundry_task.priority)
         self.assertEqual(new_task.status, self.laundry_task.status)
 
+    def test_from_dicts(self):
+        tasks = Task.from_dicts([self.laundry_task.to_dict(), {"description": "Dishes", "priority": "LOW", "status": "DONE"}])
+
+        self.assertEqual([task.description for task in tasks], [self.laundry_task.description, 'Dishes'])
+        self.assertEqual(tasks[1].priority, TaskPriority.LOW)
+        self.assertEqual(tasks[1].status, TaskStatus.DONE)
+
+    def test_from_dicts_validates(self):
+        with self.assertRaises(ValueError):
+            Task.from_dicts([{"description": "", "priority": "LOW", "status": "DONE"}])
+        with self.assertRaises(TypeError):
+            Task.from_dicts([{"description": 42, "priority": "LOW", "status": "DONE"}])
+        with self.assertRaises(KeyError):
+            Task.from_dicts([{"description": "Dishes", "priority": "URGENT", "status": "DONE"}])
+        with self.assertRaises(KeyError):
+            Task.from_dicts([{"description": "", "priority": "LOW"}])
+
 if __name__ == '__main__': # pragma: no cover
     unittest.main()
\ No newline at end of file
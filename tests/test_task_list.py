@@ -33,7 +33,7 @@ class TestTaskList(unittest.TestCase):
             )
 
     def test_add_task(self):
-        self.low_priority_to_be_done_task.name = 'B'
+        self.low_priority_to_be_done_task.description = 'B'
         self.task_list.add_task(self.low_priority_to_be_done_task)
         self.assertIn('B', self.task_list.tasks)
 
@@ -86,6 +86,54 @@ class TestTaskList(unittest.TestCase):
         keys = list(self.task_list.tasks.keys())
         self.assertEqual(keys, ['C', 'B', 'D', 'A'])
 
+    def test_sort_reorders_once(self):
+        self.task_list.add_task(self.medium_priority_done_task)
+        self.task_list.add_task(self.low_priority_to_be_done_task)
+        self.task_list.sort_tasks_by_status_then_priority()
+        self.task_list.add_task(self.high_priority_in_progress_task)
+        self.task_list.add_task(self.high_priority_to_be_done_task)
+        self.assertEqual(list(self.task_list.tasks), ['B', 'A', 'D', 'C'])
+        self.assertIsInstance(self.task_list.tasks, dict)
+
+        self.medium_priority_done_task.status = TaskStatus.TO_BE_DONE
+        self.assertEqual(list(self.task_list.tasks), ['B', 'A', 'D', 'C'])
+        self.task_list.sort_tasks_by_status_then_priority()
+        self.assertEqual(list(self.task_list.tasks), ['C', 'A', 'B', 'D'])
+
+        self.high_priority_in_progress_task.priority = TaskPriority.LOW
+        self.task_list.remove_task('B')
+        self.task_list.sort_tasks_by_priority()
+        self.assertEqual(list(self.task_list.tasks), ['C', 'A', 'D'])
+
+    def test_sort_ties_keep_current_order(self):
+        self.task_list.add_task(self.high_priority_in_progress_task)
+        self.task_list.add_task(self.low_priority_to_be_done_task)
+        self.task_list.add_task(self.high_priority_to_be_done_task)
+        self.task_list.sort_tasks_by_status()
+        self.assertEqual(list(self.task_list.tasks), ['B', 'C', 'D'])
+        self.task_list.sort_tasks_by_priority()
+        self.assertEqual(list(self.task_list.tasks), ['C', 'D', 'B'])
+        self.task_list.sort_tasks_by_status()
+        self.assertEqual(list(self.task_list.tasks), ['C', 'B', 'D'])
+
+    def test_rename_task(self):
+        self.task_list.add_task(self.low_priority_to_be_done_task)
+        self.task_list.add_task(self.medium_priority_done_task)
+        self.task_list.sort_tasks_by_status()
+        self.low_priority_to_be_done_task.description = 'E'
+        self.assertEqual(list(self.task_list.tasks), ['A', 'E'])
+        self.assertEqual([task.description for task in self.task_list.query()], ['A', 'E'])
+        self.assertIs(self.task_list.find_task_by_description('E'), self.low_priority_to_be_done_task)
+        with self.assertRaises(ValueError):
+            self.low_priority_to_be_done_task.description = 'A'
+
+    def test_add_task_owned_by_other_list(self):
+        self.task_list.add_task(self.low_priority_to_be_done_task)
+        with self.assertRaises(ValueError):
+            TaskList('Other').add_task(self.low_priority_to_be_done_task)
+        self.task_list.remove_task('B')
+        TaskList('Other').add_task(self.low_priority_to_be_done_task)
+
     def test_progress(self):
         self.assertEqual(self.task_list.progress, '0/0')
         self.task_list.add_task(self.low_priority_to_be_done_task)
@@ -95,6 +143,66 @@ class TestTaskList(unittest.TestCase):
         self.low_priority_to_be_done_task.status = TaskStatus.DONE
         self.assertEqual(self.task_list.progress, '2/2')
 
+    def test_status_counts(self):
+        self.task_list.add_task(self.low_priority_to_be_done_task)
+        self.task_list.add_task(self.high_priority_in_progress_task)
+        self.high_priority_in_progress_task.status = TaskStatus.DONE
+        self.assertEqual(self.task_list.status_counts, {
+            TaskStatus.TO_BE_DONE: 1,
+            TaskStatus.IN_PROGRESS: 0,
+            TaskStatus.DONE: 1,
+        })
+        self.task_list.remove_task('B')
+        self.assertEqual(self.task_list.status_counts[TaskStatus.TO_BE_DONE], 0)
+
+    def test_add_tasks(self):
+        self.task_list.add_task(self.medium_priority_done_task)
+        self.task_list.add_tasks([self.low_priority_to_be_done_task, self.high_priority_in_progress_task, self.high_priority_to_be_done_task])
+        self.assertEqual(list(self.task_list.tasks), ['A', 'B', 'D', 'C'])
+
+        self.task_list.sort_tasks_by_status_then_priority()
+        self.assertEqual(list(self.task_list.tasks), ['C', 'B', 'D', 'A'])
+        self.assertEqual(self.task_list.progress, '1/4')
+        self.assertIs(self.high_priority_to_be_done_task._task_list, self.task_list)
+
+    def test_add_tasks_is_all_or_nothing(self):
+        self.task_list.add_task(self.medium_priority_done_task)
+        with self.assertRaises(ValueError):
+            self.task_list.add_tasks([self.low_priority_to_be_done_task, Task('A')])
+        with self.assertRaises(ValueError):
+            self.task_list.add_tasks([self.low_priority_to_be_done_task, Task('B')])
+
+        self.assertEqual(list(self.task_list.tasks), ['A'])
+        self.assertIsNone(self.low_priority_to_be_done_task._task_list)
+        self.assertEqual(self.task_list.progress, '1/1')
+
+    def test_remove_tasks(self):
+        self.task_list.add_tasks([self.medium_priority_done_task, self.low_priority_to_be_done_task, self.high_priority_to_be_done_task])
+        self.task_list.sort_tasks_by_priority()
+        self.task_list.remove_tasks(['A', 'C'])
+
+        self.assertEqual(list(self.task_list.tasks), ['B'])
+        self.assertEqual(self.task_list.progress, '0/1')
+        self.assertIsNone(self.medium_priority_done_task._task_list)
+
+        self.task_list.add_task(self.high_priority_to_be_done_task)
+        self.assertEqual(list(self.task_list.tasks), ['B', 'C'])
+
+    def test_remove_tasks_is_all_or_nothing(self):
+        self.task_list.add_tasks([self.medium_priority_done_task, self.low_priority_to_be_done_task])
+        with self.assertRaises(ValueError):
+            self.task_list.remove_tasks(['A', 'Z'])
+
+        self.assertEqual(list(self.task_list.tasks), ['A', 'B'])
+
+    def test_bulk_operations_on_compact_task_list(self):
+        task_list = TaskList('Compact', compact=True)
+        task_list.add_tasks([self.medium_priority_done_task, self.low_priority_to_be_done_task, self.high_priority_to_be_done_task])
+        task_list.remove_tasks(['A', 'B'])
+
+        self.assertEqual([task.description for task in task_list.tasks.values()], ['C'])
+        self.assertEqual(task_list.progress, '0/1')
+
     def test_str_representation(self):
         self.task_list.add_task(self.low_priority_to_be_done_task) # B
         self.task_list.add_task(self.medium_priority_done_task) # A
@@ -103,6 +211,27 @@ class TestTaskList(unittest.TestCase):
         self.assertIn(str(self.low_priority_to_be_done_task), s)
         self.assertIn(str(self.medium_priority_done_task), s)
 
+    def test_content_hash_tracks_mutations(self):
+        for compact in (False, True):
+            task_list = TaskList('Hashed', compact)
+            other = TaskList('Other')
+            self.assertEqual(task_list.content_hash, other.content_hash)
+
+            task_list.add_tasks([Task('A'), Task('B', TaskPriority.HIGH)])
+            task_list.add_task(Task('C'))
+            task_list.tasks['A'].status = TaskStatus.DONE
+            task_list.tasks['C'].description = 'D'
+            task_list.remove_task('B')
+            task_list.sort_tasks_by_priority()
+            other.add_tasks([Task('D'), Task('A', status=TaskStatus.DONE)])
+            self.assertEqual(task_list.content_hash, other.content_hash)
+            self.assertEqual(task_list.content_hash, TaskList.from_dict(task_list.to_dict()).content_hash)
+
+            task_list.tasks['D'].priority = TaskPriority.LOW
+            self.assertNotEqual(task_list.content_hash, other.content_hash)
+            task_list.remove_tasks(['A', 'D'])
+            self.assertEqual(task_list.content_hash, TaskList('Empty').content_hash)
+
     def test_to_json(self):
         self.task_list.add_task(self.low_priority_to_be_done_task)
         self.task_list.add_task(self.medium_priority_done_task)
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.segments import SegmentDirectory
+from src.serialization import SaveFile
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestTaskListIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+        self.workspace = Workspace('Lazy')
+        for name in ('Kitchen', 'Bathroom', 'Garage'):
+            task_list = TaskList(name)
+            task_list.add_task(Task(f'Clean {name}'))
+            task_list.add_task(Task(f'Paint {name}', status=TaskStatus.DONE))
+            self.workspace.add_task_list(task_list)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmpdir)
+
+    def test_lazy_load_from_file(self):
+        self.workspace.save_to_file('lazy.json')
+        with patch.object(TaskList, 'from_dict', autospec=True, side_effect=TaskList.from_dict) as from_dict:
+            loaded = Workspace.load_from_file('lazy.json', lazy=True)
+            self.assertEqual(list(loaded.task_lists), ['Kitchen', 'Bathroom', 'Garage'])
+            self.assertEqual(loaded.progress, '3/6')
+            self.assertEqual(loaded.to_json(), self.workspace.to_json())
+            self.assertEqual(from_dict.call_count, 0)
+
+            kitchen = loaded.find_task_list_by_name('Kitchen')
+            self.assertEqual(from_dict.call_count, 1)
+            self.assertTrue(loaded.task_lists.is_loaded('Kitchen'))
+            self.assertFalse(loaded.task_lists.is_loaded('Garage'))
+
+        kitchen.find_task_by_description('Clean Kitchen').status = TaskStatus.DONE
+        self.assertEqual(loaded.progress, '4/6')
+        self.assertEqual(str(loaded), str(Workspace.from_json(loaded.to_json())))
+
+    def test_lazy_load_from_directory(self):
+        self.workspace.save_to_directory('lazy')
+        with patch.object(SegmentDirectory, 'read_segment', autospec=True, side_effect=SegmentDirectory.read_segment) as read_segment:
+            loaded = Workspace.load_from_directory('lazy', lazy=True)
+            self.assertEqual(loaded.progress, '3/6')
+            loaded.find_task_list_by_name('Garage').add_task(Task('Sweep'))
+            self.assertEqual(read_segment.call_count, 1)
+
+        self.assertEqual(loaded.dirty_task_lists, ['Garage'])
+        with patch.object(TaskList, 'to_dict', autospec=True, side_effect=TaskList.to_dict) as to_dict:
+            loaded.save_to_directory('lazy')
+        self.assertEqual(to_dict.call_count, 1)
+
+        reloaded = Workspace.load_from_directory('lazy')
+        self.assertEqual(reloaded.progress, '3/7')
+        self.assertEqual(list(reloaded.task_lists), ['Kitchen', 'Bathroom', 'Garage'])
+
+    def test_lazy_load_reads_only_the_header_and_list_spans(self):
+        self.workspace.find_task_list_by_name('Garage').name = 'Garaż'
+        self.workspace.save_to_file('lazy.json')
+        with patch.object(SaveFile, 'close', autospec=True, side_effect=SaveFile.close) as close:
+            with patch('json.load', side_effect=AssertionError), \
+                    patch.object(Task, 'from_dict', side_effect=AssertionError):
+                loaded = Workspace.load_from_file('lazy.json', lazy=True)
+
+            self.assertEqual(list(loaded.task_lists), ['Kitchen', 'Bathroom', 'Garaż'])
+            self.assertEqual(loaded.task_lists.entry('Garaż').status_counts, self.workspace.task_lists['Garaż'].status_counts)
+            self.assertEqual(loaded.progress, '3/6')
+
+            self.workspace.find_task_list_by_name('Kitchen').add_task(Task('Replaced'))
+            self.workspace.save_to_file('lazy.json')
+            self.assertEqual(loaded.task_lists['Kitchen'].to_dict()["tasks"], [
+                {"description": "Clean Kitchen", "priority": "MEDIUM", "status": "TO_BE_DONE"},
+                {"description": "Paint Kitchen", "priority": "MEDIUM", "status": "DONE"},
+            ])
+            with patch.object(TaskList, 'from_dict', side_effect=AssertionError):
+                loaded.remove_task_list('Bathroom')
+            self.assertEqual(close.call_count, 0)
+
+            self.assertEqual(loaded.find_task_list_by_name('Garaż').progress, '1/2')
+            self.assertEqual(close.call_count, 1)
+
+    def test_lazy_load_of_save_without_counts(self):
+        self.workspace.save_to_file('old.json')
+        with open(os.path.join('saves', 'old.json'), 'w') as output_file:
+            output_file.write(self.workspace.to_json())
+
+        loaded = Workspace.load_from_file('old.json', lazy=True)
+        self.assertFalse(loaded.task_lists.is_loaded('Kitchen'))
+        self.assertEqual(loaded.progress, '3/6')
+        self.assertEqual(loaded.to_dict(), self.workspace.to_dict())
+
+    def test_remove_and_rename_unloaded_lists(self):
+        self.workspace.save_to_file('lazy.json')
+        loaded = Workspace.load_from_file('lazy.json', lazy=True)
+        loaded.remove_task_list('Bathroom')
+        self.assertEqual(loaded.progress, '2/4')
+        loaded.find_task_list_by_name('Garage').name = 'Shed'
+        self.assertEqual(list(loaded.task_lists), ['Kitchen', 'Shed'])
+        with self.assertRaises(ValueError):
+            loaded.add_task_list(TaskList('Kitchen'))
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
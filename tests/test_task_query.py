@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestTaskQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = Workspace('Home')
+        self.kitchen = TaskList('Kitchen')
+        self.kitchen.add_task(Task('Dishes', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        self.kitchen.add_task(Task('Oven', TaskPriority.LOW, TaskStatus.IN_PROGRESS))
+        self.kitchen.add_task(Task('Fridge', TaskPriority.HIGH, TaskStatus.DONE))
+        self.kitchen.add_task(Task('Floor', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        self.garage = TaskList('Garage', compact=True)
+        self.garage.add_task(Task('Car', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        self.garage.add_task(Task('Bike', TaskPriority.MEDIUM, TaskStatus.TO_BE_DONE))
+        self.workspace.add_task_list(self.kitchen)
+        self.workspace.add_task_list(self.garage)
+
+    def test_task_list_query_conjunction(self):
+        query = self.kitchen.query(status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH)
+        self.assertEqual(len(query), 2)
+        self.assertEqual([task.description for task in query], ['Dishes', 'Floor'])
+
+    def test_task_list_query_single_filter_keeps_insertion_order(self):
+        self.assertEqual([task.description for task in self.kitchen.query(priority=TaskPriority.HIGH)], ['Dishes', 'Fridge', 'Floor'])
+        self.assertEqual([task.description for task in self.kitchen.query(status=TaskStatus.IN_PROGRESS)], ['Dishes', 'Oven', 'Floor'])
+        self.assertEqual(len(self.kitchen.query()), 4)
+
+    def test_task_list_query_accepts_several_members(self):
+        query = self.kitchen.query(priority=[TaskPriority.LOW, TaskPriority.HIGH], status=TaskStatus.IN_PROGRESS)
+        self.assertEqual([task.description for task in query], ['Dishes', 'Oven', 'Floor'])
+
+    def test_count_by_status_does_not_build_buckets(self):
+        self.assertEqual(len(self.kitchen.query(status=TaskStatus.DONE)), 1)
+        self.assertIsNone(self.kitchen._buckets)
+
+    def test_query_follows_mutations(self):
+        query = self.kitchen.query(status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH)
+        self.assertEqual(len(query), 2)
+
+        self.kitchen.find_task_by_description('Fridge').status = TaskStatus.IN_PROGRESS
+        self.kitchen.remove_task('Dishes')
+        self.kitchen.add_task(Task('Sink', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+
+        self.assertEqual([task.description for task in query], ['Fridge', 'Floor', 'Sink'])
+
+    def test_changing_tasks_while_iterating(self):
+        for task in self.kitchen.query(status=TaskStatus.IN_PROGRESS):
+            task.status = TaskStatus.DONE
+
+        self.assertEqual(self.kitchen.progress, '4/4')
+        self.assertEqual(len(self.kitchen.query(status=TaskStatus.IN_PROGRESS)), 0)
+
+    def test_invalid_filter(self):
+        with self.assertRaises(TypeError):
+            self.kitchen.query(status=TaskPriority.HIGH)
+        with self.assertRaises(TypeError):
+            self.kitchen.query(priority='HIGH')
+
+    def test_workspace_query(self):
+        query = self.workspace.query(status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH)
+        self.assertEqual(len(query), 3)
+        self.assertEqual(
+            [(name, task.description) for name, task in query],
+            [('Kitchen', 'Dishes'), ('Kitchen', 'Floor'), ('Garage', 'Car')],
+        )
+        self.assertEqual(len(self.workspace.query(status=TaskStatus.TO_BE_DONE)), 1)
+
+    def test_workspace_status_count_leaves_lists_unloaded(self):
+        tmpdir = tempfile.mkdtemp()
+        original_cwd = os.getcwd()
+        os.chdir(tmpdir)
+        try:
+            self.workspace.save_to_file('home.json')
+            loaded = Workspace.load_from_file('home.json', lazy=True)
+            self.assertEqual(len(loaded.query(status=TaskStatus.IN_PROGRESS)), 4)
+            self.assertFalse(loaded.task_lists.is_loaded('Kitchen'))
+
+            self.assertEqual(len(loaded.query(status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH)), 3)
+            self.assertTrue(loaded.task_lists.is_loaded('Kitchen'))
+        finally:
+            os.chdir(original_cwd)
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from src.task import Task
+from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+from src.workspace import Workspace
+
+
+class TestTaskScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = Workspace('Work')
+        self.backend = TaskList('Backend')
+        self.backend.add_task(Task('Fix login', TaskPriority.LOW))
+        self.backend.add_task(Task('Deploy', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        self.backend.add_task(Task('Write docs', TaskPriority.HIGH, TaskStatus.DONE))
+        self.frontend = TaskList('Frontend', compact=True)
+        self.frontend.add_task(Task('Fix layout', TaskPriority.HIGH))
+        self.frontend.add_task(Task('Add icons', TaskPriority.MEDIUM))
+        self.workspace.add_task_list(self.backend)
+        self.workspace.add_task_list(self.frontend)
+        self.scheduler = self.workspace.scheduler
+
+    def drain(self) -> list[str]:
+        descriptions = []
+        while (task := self.scheduler.pop_next()) is not None:
+            descriptions.append(task.description)
+
+        return descriptions
+
+    def test_order_by_status_priority_and_insertion(self):
+        self.assertEqual(len(self.scheduler), 4)
+        self.assertEqual(self.scheduler.peek().description, 'Fix layout')
+        self.assertEqual(self.drain(), ['Fix layout', 'Add icons', 'Fix login', 'Deploy'])
+        self.assertIsNone(self.scheduler.peek())
+
+    def test_scheduler_is_shared(self):
+        self.assertIs(self.workspace.scheduler, self.scheduler)
+
+    def test_follows_status_and_priority_changes(self):
+        self.backend.find_task_by_description('Fix login').priority = TaskPriority.HIGH
+        self.frontend.find_task_by_description('Fix layout').status = TaskStatus.DONE
+        self.backend.find_task_by_description('Write docs').status = TaskStatus.TO_BE_DONE
+
+        self.assertEqual(self.drain(), ['Fix login', 'Write docs', 'Add icons', 'Deploy'])
+
+    def test_changing_back_keeps_insertion_order(self):
+        task = self.backend.find_task_by_description('Fix login')
+        task.priority = TaskPriority.HIGH
+        task.priority = TaskPriority.LOW
+        task.priority = TaskPriority.HIGH
+
+        self.assertEqual(self.drain(), ['Fix login', 'Fix layout', 'Add icons', 'Deploy'])
+
+    def test_follows_added_removed_and_renamed_tasks(self):
+        self.frontend.remove_task('Fix layout')
+        self.backend.add_task(Task('Hotfix', TaskPriority.HIGH))
+        self.frontend.find_task_by_description('Add icons').description = 'Add logos'
+
+        self.assertEqual(self.drain(), ['Hotfix', 'Add logos', 'Fix login', 'Deploy'])
+
+    def test_follows_task_lists(self):
+        self.workspace.remove_task_list('Frontend')
+        ops = TaskList('Ops')
+        ops.add_task(Task('Rotate keys', TaskPriority.HIGH))
+        self.workspace.add_task_list(ops)
+
+        self.assertEqual(self.drain(), ['Rotate keys', 'Fix login', 'Deploy'])
+
+    def test_claim_and_release(self):
+        task = self.scheduler.pop_next()
+        self.assertEqual([claimed.description for claimed in self.scheduler.claimed], ['Fix layout'])
+        self.assertEqual(len(self.scheduler), 3)
+
+        task.priority = TaskPriority.LOW
+        self.assertEqual(self.scheduler.peek().description, 'Add icons')
+
+        self.scheduler.release(task)
+        self.assertEqual(self.scheduler.claimed, [])
+        self.assertEqual(self.drain(), ['Add icons', 'Fix login', 'Fix layout', 'Deploy'])
+
+    def test_release_done_task(self):
+        task = self.scheduler.pop_next()
+        task.status = TaskStatus.DONE
+        self.scheduler.release(task)
+
+        self.assertEqual(self.drain(), ['Add icons', 'Fix login', 'Deploy'])
+
+    def test_release_unclaimed_task(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.release(self.backend.find_task_by_description('Deploy'))
+
+    def test_stale_entries_are_compacted(self):
+        task = self.backend.find_task_by_description('Fix login')
+        for _ in range(50):
+            task.priority = TaskPriority.HIGH
+            task.priority = TaskPriority.LOW
+
+        self.assertLessEqual(len(self.scheduler._heap), 2 * len(self.scheduler) + 1)
+        self.assertEqual(self.drain(), ['Fix layout', 'Add icons', 'Fix login', 'Deploy'])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,185 @@
+import unittest
+from unittest.mock import patch
+
+from src.task import Task
+from src.task_list import TaskList
+from src.task_store import StoredTask, TaskStore
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
+
+
+class TestTaskStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = TaskStore()
+        self.laundry_task = Task('Do laundry', TaskPriority.HIGH, TaskStatus.IN_PROGRESS)
+        self.dishes_task = Task('Do dishes', TaskPriority.LOW, TaskStatus.DONE)
+
+    def test_store_initialization(self):
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store, {})
+
+    def test_set_and_get_task(self):
+        self.store[self.laundry_task.description] = self.laundry_task
+        stored = self.store['Do laundry']
+        self.assertEqual(stored.description, 'Do laundry')
+        self.assertEqual(stored.priority, TaskPriority.HIGH)
+        self.assertEqual(stored.status, TaskStatus.IN_PROGRESS)
+
+    def test_key_must_match_description(self):
+        with self.assertRaises(ValueError):
+            self.store['Other'] = self.laundry_task
+
+    def test_missing_task(self):
+        with self.assertRaises(KeyError):
+            self.store['Missing']
+
+    def test_delete_task(self):
+        self.store[self.laundry_task.description] = self.laundry_task
+        self.store[self.dishes_task.description] = self.dishes_task
+        del self.store['Do laundry']
+        self.assertNotIn('Do laundry', self.store)
+        self.assertEqual(list(self.store), ['Do dishes'])
+
+    def test_write_through_stored_task(self):
+        self.store[self.laundry_task.description] = self.laundry_task
+        self.store['Do laundry'].status = TaskStatus.DONE
+        self.assertEqual(self.store['Do laundry'].status, TaskStatus.DONE)
+
+    def test_rename_stored_task(self):
+        self.store[self.laundry_task.description] = self.laundry_task
+        self.store['Do laundry'].description = 'Fold laundry'
+        self.assertNotIn('Do laundry', self.store)
+        self.assertEqual(self.store['Fold laundry'].priority, TaskPriority.HIGH)
+
+    def test_rename_to_existing_description(self):
+        self.store[self.laundry_task.description] = self.laundry_task
+        self.store[self.dishes_task.description] = self.dishes_task
+        with self.assertRaises(ValueError):
+            self.store['Do laundry'].description = 'Do dishes'
+
+    def test_removed_stored_task_is_detached(self):
+        task_list = TaskList('Laundry', compact=True)
+        task_list.add_tasks([self.laundry_task, self.dishes_task])
+        stored = task_list.find_task_by_description('Do laundry')
+        task_list.remove_task('Do laundry')
+
+        self.assertIsNone(stored._task_list)
+        self.assertEqual((stored.description, stored.priority, stored.status), ('Do laundry', TaskPriority.HIGH, TaskStatus.IN_PROGRESS))
+        stored.status = TaskStatus.DONE
+        self.assertEqual(list(task_list.tasks), ['Do dishes'])
+        self.assertEqual(task_list.progress, '1/1')
+
+        for other in (TaskList('Other'), TaskList('Other', compact=True)):
+            other.add_task(stored)
+            stored.priority = TaskPriority.LOW
+            self.assertEqual(other.progress, '1/1')
+            self.assertEqual(other.tasks['Do laundry'].priority, TaskPriority.LOW)
+            other.remove_task('Do laundry')
+            self.assertIsNone(stored._task_list)
+
+        stored.description = 'Fold laundry'
+        self.assertEqual(stored.to_dict(), {"description": "Fold laundry", "priority": "LOW", "status": "DONE"})
+
+    def test_removing_tasks_detaches_only_held_views(self):
+        task_list = TaskList('Laundry', compact=True)
+        task_list.add_tasks([self.laundry_task, self.dishes_task, Task('Iron shirts')])
+        with patch.object(StoredTask, '_detach', side_effect=AssertionError):
+            task_list.remove_tasks(['Do laundry', 'Do dishes'])
+            task_list.remove_task('Iron shirts')
+
+        self.assertEqual(task_list.progress, '0/0')
+
+    def test_stored_task_validation(self):
+        self.store[self.laundry_task.description] = self.laundry_task
+        with self.assertRaises(TypeError):
+            self.store['Do laundry'].priority = 'HIGH'
+
+    def test_many_tasks_and_compact(self):
+        for index in range(1000):
+            self.store[f'Task {index}'] = Task(f'Task {index}')
+        for index in range(0, 1000, 2):
+            del self.store[f'Task {index}']
+        self.store.compact()
+        self.assertEqual(len(self.store), 500)
+        self.assertEqual(list(self.store)[:2], ['Task 1', 'Task 3'])
+        self.assertIn('Task 999', self.store)
+
+    def test_held_stored_task_survives_compaction(self):
+        task_list = TaskList('Compact', compact=True)
+        task_list.add_tasks([Task(f'Task {index}') for index in range(3000)])
+        held = task_list.find_task_by_description('Task 2999')
+        task_list.remove_tasks([f'Task {index}' for index in range(2000)])
+        task_list._tasks.compact()
+
+        self.assertEqual(len(task_list._tasks._statuses), 1000)
+        self.assertEqual(held.description, 'Task 2999')
+        held.status = TaskStatus.DONE
+        self.assertEqual(task_list.tasks['Task 2999'].status, TaskStatus.DONE)
+        self.assertEqual(task_list.tasks['Task 2998'].status, TaskStatus.TO_BE_DONE)
+        self.assertEqual(task_list.progress, '1/1000')
+        self.assertIs(task_list.find_task_by_description('Task 2999'), held)
+
+    def test_compact_task_list(self):
+        task_list = TaskList('Compact', compact=True)
+        task_list.add_task(self.laundry_task)
+        task_list.add_task(self.dishes_task)
+        task_list.sort_tasks_by_status()
+        task_list.find_task_by_description('Do dishes').status = TaskStatus.TO_BE_DONE
+        self.assertEqual(list(task_list.tasks), ['Do laundry', 'Do dishes'])
+        task_list.sort_tasks_by_status()
+        self.assertEqual(list(task_list.tasks), ['Do dishes', 'Do laundry'])
+        self.assertEqual(TaskList.from_json(task_list.to_json(), compact=True).progress, '0/2')
+
+    def test_compact_list_buckets_hold_rows(self):
+        task_list = TaskList('Compact', compact=True)
+        task_list.add_tasks(Task(f'Task {index}', TaskPriority.LOW if index % 2 else TaskPriority.HIGH) for index in range(6))
+        task_list.sort_tasks_by_priority()
+        self.assertTrue(all(isinstance(row, int) for bucket in task_list._ensure_buckets().values() for row in bucket))
+        self.assertIsNone(task_list._sequences)
+
+        task_list.remove_tasks(['Task 0', 'Task 3'])
+        task_list.tasks['Task 5'].priority = TaskPriority.HIGH
+        task_list.tasks['Task 2'].description = 'Renamed'
+        self.assertEqual(list(task_list.tasks), ['Renamed', 'Task 4', 'Task 1', 'Task 5'])
+
+        task_list._tasks.compact()
+        task_list.add_task(Task('Task 6', TaskPriority.MEDIUM))
+        task_list.sort_tasks_by_priority()
+        self.assertEqual(list(task_list.tasks), ['Renamed', 'Task 4', 'Task 5', 'Task 6', 'Task 1'])
+        self.assertEqual([task.description for task in task_list.query(priority=TaskPriority.HIGH)], ['Renamed', 'Task 4', 'Task 5'])
+
+    def test_added_tasks_stay_bound_to_compact_list(self):
+        task_list = TaskList('Compact', compact=True)
+        task_list.add_task(self.laundry_task)
+        task_list.add_tasks([self.dishes_task])
+
+        self.laundry_task.status = TaskStatus.DONE
+        self.assertEqual(task_list.progress, '2/2')
+        self.assertEqual(task_list.tasks['Do laundry'].status, TaskStatus.DONE)
+
+        task_list.tasks['Do dishes'].priority = TaskPriority.HIGH
+        self.assertEqual(self.dishes_task.priority, TaskPriority.HIGH)
+
+        self.laundry_task.description = 'Fold laundry'
+        self.assertEqual(list(task_list.tasks), ['Fold laundry', 'Do dishes'])
+        task_list.tasks['Fold laundry'].description = 'Iron laundry'
+        self.assertEqual(self.laundry_task.description, 'Iron laundry')
+        self.laundry_task.priority = TaskPriority.LOW
+        self.assertEqual(task_list.tasks['Iron laundry'].priority, TaskPriority.LOW)
+
+        with self.assertRaises(ValueError):
+            TaskList('Other', compact=True).add_task(self.laundry_task)
+
+        task_list.remove_tasks(['Iron laundry'])
+        task_list.remove_task('Do dishes')
+        self.laundry_task.status = TaskStatus.TO_BE_DONE
+        self.assertEqual(task_list.progress, '0/0')
+
+        other = TaskList('Other', compact=True)
+        other.add_task(self.laundry_task)
+        self.assertEqual(other.tasks['Iron laundry'].status, TaskStatus.TO_BE_DONE)
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -1,9 +1,13 @@
+import json
 import os
 import shutil
 import tempfile
 import unittest
 
+from src.task import Task
 from src.task_list import TaskList
+from src.utils.task_priority import TaskPriority
+from src.utils.task_status import TaskStatus
 from src.workspace import Workspace
 
 
@@ -45,6 +49,34 @@ class TestWorkspace(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.workspace.add_task_list(second)
 
+    def test_add_task_lists(self):
+        first = TaskList('List 1')
+        first.add_task(Task('A', status=TaskStatus.DONE))
+        second = TaskList('List 2')
+        second.add_tasks([Task('B'), Task('C')])
+        self.workspace.add_task_lists([first, second])
+
+        self.assertEqual(list(self.workspace.task_lists), ['List 1', 'List 2'])
+        self.assertEqual(self.workspace.progress, '1/3')
+
+    def test_add_task_lists_is_all_or_nothing(self):
+        self.workspace.add_task_list(TaskList('List 1'))
+        with self.assertRaises(ValueError):
+            self.workspace.add_task_lists([TaskList('List 2'), TaskList('List 1')])
+        with self.assertRaises(ValueError):
+            self.workspace.add_task_lists([TaskList('List 2'), TaskList('List 2')])
+
+        self.assertEqual(list(self.workspace.task_lists), ['List 1'])
+
+    def test_bulk_task_changes_update_progress(self):
+        task_list = TaskList('List 1')
+        self.workspace.add_task_list(task_list)
+        task_list.add_tasks([Task('A', status=TaskStatus.DONE), Task('B'), Task('C', status=TaskStatus.DONE)])
+        self.assertEqual(self.workspace.progress, '2/3')
+
+        task_list.remove_tasks(['A', 'B'])
+        self.assertEqual(self.workspace.progress, '1/1')
+
     def test_remove_task_list(self):
         task_list = TaskList('List 1')
         self.workspace.add_task_list(task_list)
@@ -65,6 +97,36 @@ class TestWorkspace(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.workspace.find_task_list_by_name('List 2')
 
+    def test_progress(self):
+        a = TaskList('A')
+        b = TaskList('B')
+        a.add_task(Task('A1', status=TaskStatus.DONE))
+        self.workspace.add_task_list(a)
+        self.workspace.add_task_list(b)
+        self.assertEqual(self.workspace.progress, '1/1')
+
+        b.add_task(Task('B1'))
+        b.add_task(Task('B2', status=TaskStatus.IN_PROGRESS))
+        self.assertEqual(self.workspace.progress, '1/3')
+
+        b.find_task_by_description('B1').status = TaskStatus.DONE
+        a.remove_task('A1')
+        self.assertEqual(self.workspace.progress, '1/2')
+        self.assertEqual(self.workspace.status_counts, {
+            TaskStatus.TO_BE_DONE: 0,
+            TaskStatus.IN_PROGRESS: 1,
+            TaskStatus.DONE: 1,
+        })
+
+        self.workspace.remove_task_list('B')
+        self.assertEqual(self.workspace.progress, '0/0')
+
+    def test_add_task_list_owned_by_other_workspace(self):
+        task_list = TaskList('List 1')
+        self.workspace.add_task_list(task_list)
+        with self.assertRaises(ValueError):
+            Workspace('Other').add_task_list(task_list)
+
     def test_sort_tasks_by_status(self):
         a = TaskList('A')
         b = TaskList('B')
@@ -123,6 +185,58 @@ class TestWorkspace(unittest.TestCase):
         self.assertIsInstance(ws2.task_lists["L1"], TaskList)
         self.assertIsInstance(ws2.task_lists["L2"], TaskList)
 
+    def test_to_json_single_document(self):
+        a = TaskList('X')
+        a.add_task(Task('Do "quoted" laundry', TaskPriority.HIGH, TaskStatus.DONE))
+        self.workspace.add_task_list(a)
+        data = json.loads(self.workspace.to_json())
+        self.assertEqual(data["version"], 2)
+        self.assertEqual(data["task_list"], [{
+            "name": "X",
+            "tasks": [{"description": 'Do "quoted" laundry', "priority": "HIGH", "status": "DONE"}],
+        }])
+
+    def test_json_round_trip(self):
+        a = TaskList('X')
+        a.add_task(Task('A1', TaskPriority.LOW, TaskStatus.IN_PROGRESS))
+        a.add_task(Task('A2'))
+        self.workspace.add_task_list(a)
+        loaded = Workspace.from_json(self.workspace.to_json())
+        self.assertEqual(loaded.name, 'Test Workspace')
+        self.assertEqual(list(loaded.task_lists['X'].tasks), ['A1', 'A2'])
+        self.assertEqual(loaded.task_lists['X'].find_task_by_description('A1').priority, TaskPriority.LOW)
+
+    def test_from_json_legacy_format(self):
+        a = TaskList('Legacy')
+        a.add_task(Task('A1', TaskPriority.LOW, TaskStatus.DONE))
+        legacy = json.dumps({"name": "Old", "task_list": [a.to_json()]})
+        loaded = Workspace.from_json(legacy)
+        self.assertEqual(loaded.name, 'Old')
+        self.assertEqual(loaded.task_lists['Legacy'].progress, '1/1')
+
+    def test_from_json_unsupported_version(self):
+        with self.assertRaises(ValueError):
+            Workspace.from_json('{"version": 99, "name": "Future", "task_list": []}')
+
+    def test_save_and_load_round_trip(self):
+        a = TaskList('A')
+        a.add_task(Task('A1', TaskPriority.HIGH, TaskStatus.DONE))
+        a.add_task(Task('A2'))
+        self.workspace.add_task_list(a)
+        self.workspace.add_task_list(TaskList('B'))
+        self.workspace.save_to_file('round_trip.json')
+
+        loaded = Workspace.load_from_file('round_trip.json')
+        self.assertEqual(loaded.to_json(), self.workspace.to_json())
+        self.assertEqual(
+            [task_list.name for task_list in Workspace.iter_task_lists_from_file('round_trip.json')],
+            ['A', 'B'],
+        )
+        self.assertEqual(
+            [(name, task.description) for name, task in Workspace.iter_tasks_from_file('round_trip.json')],
+            [('A', 'A1'), ('A', 'A2')],
+        )
+
     def test_save_to_file_and_load_from_file(self):
         # prepare workspace with one dummy list
         a = TaskList('SaveMe')